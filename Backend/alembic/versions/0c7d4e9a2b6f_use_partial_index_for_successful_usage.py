@@ -0,0 +1,45 @@
+"""use_partial_index_for_successful_usage
+
+Revision ID: 0c7d4e9a2b6f
+Revises: f2a9c5e7b4d1
+Create Date: 2026-10-16 13:51:33.128940
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c7d4e9a2b6f'
+down_revision: Union[str, Sequence[str], None] = 'f2a9c5e7b4d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Split the per-user api_usage index into a partial (success) and a plain index."""
+    op.create_index(
+        'idx_api_usage_success_partial',
+        'api_usage',
+        ['user_id', 'created_at'],
+        unique=False,
+        postgresql_include=['input_tokens', 'output_tokens', 'total_tokens'],
+        postgresql_where=sa.text('success')
+    )
+    op.create_index('idx_api_usage_user_date', 'api_usage', ['user_id', 'created_at'], unique=False)
+    op.drop_index('idx_api_usage_user_date_success', table_name='api_usage')
+
+
+def downgrade() -> None:
+    """Restore the combined per-user index."""
+    op.create_index(
+        'idx_api_usage_user_date_success',
+        'api_usage',
+        ['user_id', 'created_at', 'success'],
+        unique=False,
+        postgresql_include=['input_tokens', 'output_tokens', 'total_tokens']
+    )
+    op.drop_index('idx_api_usage_user_date', table_name='api_usage')
+    op.drop_index('idx_api_usage_success_partial', table_name='api_usage')
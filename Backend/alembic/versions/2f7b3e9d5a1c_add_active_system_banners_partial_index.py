@@ -0,0 +1,38 @@
+"""add_active_system_banners_partial_index
+
+Revision ID: 2f7b3e9d5a1c
+Revises: 6e1c9a4b8d2f
+Create Date: 2026-10-16 17:24:51.306418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f7b3e9d5a1c'
+down_revision: Union[str, Sequence[str], None] = '6e1c9a4b8d2f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a partial index over active system banners."""
+    op.create_index(
+        'idx_system_banners_active_created',
+        'system_banners',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text('is_active')
+    )
+
+
+def downgrade() -> None:
+    """Drop the active system banners partial index."""
+    op.drop_index(
+        'idx_system_banners_active_created',
+        table_name='system_banners',
+        postgresql_where=sa.text('is_active')
+    )
@@ -0,0 +1,36 @@
+"""add_api_usage_day_column
+
+Revision ID: 3e8f1a6c9d2b
+Revises: 0c7d4e9a2b6f
+Create Date: 2026-10-16 14:10:05.671384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8f1a6c9d2b'
+down_revision: Union[str, Sequence[str], None] = '0c7d4e9a2b6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a stored usage_day column for daily usage reports."""
+    op.add_column('api_usage', sa.Column(
+        'usage_day',
+        sa.Date(),
+        sa.Computed('(created_at::date)', persisted=True),
+        nullable=True,
+        comment='UTC day of created_at'
+    ))
+    op.create_index('idx_api_usage_day', 'api_usage', ['usage_day'], unique=False)
+
+
+def downgrade() -> None:
+    """Remove the usage_day column."""
+    op.drop_index('idx_api_usage_day', table_name='api_usage')
+    op.drop_column('api_usage', 'usage_day')
@@ -0,0 +1,41 @@
+"""store_extraction_result_as_jsonb
+
+Revision ID: 4d8a2f6c1e9b
+Revises: 9b4e1d7a3c5f
+Create Date: 2026-10-16 16:08:31.502916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d8a2f6c1e9b'
+down_revision: Union[str, Sequence[str], None] = '9b4e1d7a3c5f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store documents.extraction_result as jsonb instead of JSON text."""
+    op.alter_column('documents', 'extraction_result',
+               existing_type=sa.Text(),
+               type_=postgresql.JSONB(astext_type=sa.Text()),
+               existing_nullable=True,
+               comment='Extracted data',
+               existing_comment='JSON string of extracted data',
+               postgresql_using='extraction_result::jsonb')
+
+
+def downgrade() -> None:
+    """Store documents.extraction_result as JSON text."""
+    op.alter_column('documents', 'extraction_result',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               type_=sa.Text(),
+               existing_nullable=True,
+               comment='JSON string of extracted data',
+               existing_comment='Extracted data',
+               postgresql_using='extraction_result::text')
@@ -0,0 +1,36 @@
+"""convert_api_usage_id_to_uuid
+
+Revision ID: 5b8e2f4a7c1d
+Revises: 1436567db3f7
+Create Date: 2026-10-16 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e2f4a7c1d'
+down_revision: Union[str, Sequence[str], None] = '1436567db3f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store api_usage.id as native uuid instead of a 36-character string."""
+    op.alter_column('api_usage', 'id',
+               existing_type=sa.String(length=36),
+               type_=sa.UUID(),
+               existing_nullable=False,
+               postgresql_using='id::uuid')
+
+
+def downgrade() -> None:
+    """Revert api_usage.id to a 36-character string."""
+    op.alter_column('api_usage', 'id',
+               existing_type=sa.UUID(),
+               type_=sa.String(length=36),
+               existing_nullable=False,
+               postgresql_using='id::text')
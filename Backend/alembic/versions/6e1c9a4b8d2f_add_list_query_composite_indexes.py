@@ -0,0 +1,52 @@
+"""add_list_query_composite_indexes
+
+Revision ID: 6e1c9a4b8d2f
+Revises: 4d8a2f6c1e9b
+Create Date: 2026-10-16 16:41:09.853127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e1c9a4b8d2f'
+down_revision: Union[str, Sequence[str], None] = '4d8a2f6c1e9b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns) matching each list query's filter + ORDER BY
+INDEXES = (
+    ('idx_bank_accounts_user_created', 'bank_accounts', ['user_id', 'created_at']),
+    ('idx_documents_user_created', 'documents', ['user_id', 'created_at']),
+    ('idx_documents_user_status_created', 'documents', ['user_id', 'status', 'created_at']),
+    ('idx_invoices_user_issue_date', 'invoices', ['user_id', 'issue_date']),
+    ('idx_transactions_user_date', 'transactions', ['user_id', 'transaction_date']),
+    ('idx_clients_user_name', 'clients', ['user_id', 'name']),
+)
+
+
+def upgrade() -> None:
+    """Add composite indexes for the paginated list queries."""
+    # CONCURRENTLY avoids blocking writes while building, but cannot run
+    # inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    """Drop the list query composite indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
@@ -0,0 +1,50 @@
+"""add_api_usage_daily_rollup
+
+Revision ID: 7a2d5c8e1f4b
+Revises: 3e8f1a6c9d2b
+Create Date: 2026-10-16 14:56:18.240795
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a2d5c8e1f4b'
+down_revision: Union[str, Sequence[str], None] = '3e8f1a6c9d2b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the api_usage_daily rollup table and backfill it."""
+    op.create_table('api_usage_daily',
+    sa.Column('date', sa.Date(), nullable=False, comment='UTC day'),
+    sa.Column('input_tokens', sa.BigInteger(), nullable=False),
+    sa.Column('output_tokens', sa.BigInteger(), nullable=False),
+    sa.Column('total_tokens', sa.BigInteger(), nullable=False),
+    sa.Column('request_count', sa.BigInteger(), nullable=False),
+    sa.Column('failed_requests', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('date')
+    )
+
+    op.execute("""
+        INSERT INTO api_usage_daily
+            (date, input_tokens, output_tokens, total_tokens, request_count, failed_requests)
+        SELECT
+            usage_day,
+            SUM(input_tokens),
+            SUM(output_tokens),
+            SUM(total_tokens),
+            COUNT(*),
+            COUNT(*) FILTER (WHERE NOT success)
+        FROM api_usage
+        GROUP BY usage_day
+    """)
+
+
+def downgrade() -> None:
+    """Drop the api_usage_daily rollup table."""
+    op.drop_table('api_usage_daily')
@@ -0,0 +1,41 @@
+"""add_api_usage_daily_covering_index
+
+Revision ID: 8d3c6a1f9e2b
+Revises: 5b8e2f4a7c1d
+Create Date: 2026-10-16 10:41:07.552930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3c6a1f9e2b'
+down_revision: Union[str, Sequence[str], None] = '5b8e2f4a7c1d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace single-column api_usage indexes with a covering index for quota queries."""
+    op.create_index(
+        'idx_api_usage_daily_user',
+        'api_usage',
+        ['created_at', 'user_id', 'service'],
+        unique=False,
+        postgresql_include=['input_tokens', 'output_tokens', 'total_tokens']
+    )
+    op.drop_index(op.f('ix_api_usage_created_at'), table_name='api_usage')
+    op.drop_index(op.f('ix_api_usage_service'), table_name='api_usage')
+    op.drop_index(op.f('ix_api_usage_operation'), table_name='api_usage')
+    op.drop_index(op.f('ix_api_usage_model_name'), table_name='api_usage')
+
+
+def downgrade() -> None:
+    """Restore the single-column api_usage indexes."""
+    op.create_index(op.f('ix_api_usage_model_name'), 'api_usage', ['model_name'], unique=False)
+    op.create_index(op.f('ix_api_usage_operation'), 'api_usage', ['operation'], unique=False)
+    op.create_index(op.f('ix_api_usage_service'), 'api_usage', ['service'], unique=False)
+    op.create_index(op.f('ix_api_usage_created_at'), 'api_usage', ['created_at'], unique=False)
+    op.drop_index('idx_api_usage_daily_user', table_name='api_usage')
@@ -0,0 +1,188 @@
+"""partition_api_usage_by_month
+
+Revision ID: 9b4e1d7a3c5f
+Revises: 7a2d5c8e1f4b
+Create Date: 2026-10-16 15:32:47.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4e1d7a3c5f'
+down_revision: Union[str, Sequence[str], None] = '7a2d5c8e1f4b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns copied between the old and new tables (usage_day is generated)
+COLUMNS = (
+    "id, service, operation, model_name, user_id, input_tokens, output_tokens, "
+    "total_tokens, request_id, status_code, success, error_message, duration_ms, "
+    "document_id, additional_data, created_at, updated_at"
+)
+
+
+def _create_indexes() -> None:
+    """Create the api_usage indexes (on the parent, they cascade to every partition)."""
+    op.create_index(
+        'idx_api_usage_daily_user',
+        'api_usage',
+        ['created_at', 'user_id', 'service'],
+        unique=False,
+        postgresql_include=['input_tokens', 'output_tokens', 'total_tokens']
+    )
+    op.create_index(
+        'idx_api_usage_success_partial',
+        'api_usage',
+        ['user_id', 'created_at'],
+        unique=False,
+        postgresql_include=['input_tokens', 'output_tokens', 'total_tokens'],
+        postgresql_where=sa.text('success')
+    )
+    op.create_index('idx_api_usage_user_date', 'api_usage', ['user_id', 'created_at'], unique=False)
+    op.create_index('idx_api_usage_day', 'api_usage', ['usage_day'], unique=False)
+    op.create_index(op.f('ix_api_usage_document_id'), 'api_usage', ['document_id'], unique=False)
+
+
+def _create_foreign_keys() -> None:
+    """Create the api_usage foreign keys."""
+    op.create_foreign_key(
+        'api_usage_user_id_fkey', 'api_usage', 'users',
+        ['user_id'], ['id'], ondelete='SET NULL'
+    )
+    op.create_foreign_key(
+        'api_usage_document_id_fkey', 'api_usage', 'documents',
+        ['document_id'], ['id'], ondelete='SET NULL'
+    )
+
+
+def upgrade() -> None:
+    """Rebuild api_usage as a table partitioned by month on created_at."""
+    op.execute("ALTER TABLE api_usage RENAME TO api_usage_unpartitioned")
+    # Renaming the table keeps its constraint names; free api_usage_pkey for
+    # the new table's primary key
+    op.execute(
+        "ALTER TABLE api_usage_unpartitioned "
+        "RENAME CONSTRAINT api_usage_pkey TO api_usage_unpartitioned_pkey"
+    )
+    op.execute("""
+        CREATE TABLE api_usage (
+            LIKE api_usage_unpartitioned
+            INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING COMMENTS
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    # The partition key has to be part of the primary key
+    op.create_primary_key('api_usage_pkey', 'api_usage', ['id', 'created_at'])
+
+    # Rows for a month without a partition land in the default partition
+    op.execute("CREATE TABLE api_usage_default PARTITION OF api_usage DEFAULT")
+
+    # Creates the partition holding a given month, if it does not exist yet.
+    # Postgres refuses to create a partition while the default partition
+    # holds rows in its range, so such rows are set aside first and
+    # re-inserted (into the new partition) once it exists
+    op.execute(f"""
+        CREATE FUNCTION create_api_usage_partition(month date) RETURNS void AS $$
+        DECLARE
+            start_day date := date_trunc('month', month)::date;
+            end_day date := (date_trunc('month', month) + interval '1 month')::date;
+            partition_name text := 'api_usage_' || to_char(date_trunc('month', month), 'YYYY_MM');
+        BEGIN
+            IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN;
+            END IF;
+
+            CREATE TEMP TABLE api_usage_moved ON COMMIT DROP AS
+                SELECT * FROM api_usage_default
+                WHERE created_at >= start_day AND created_at < end_day;
+            DELETE FROM api_usage_default
+                WHERE created_at >= start_day AND created_at < end_day;
+
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF api_usage FOR VALUES FROM (%L) TO (%L)',
+                partition_name, start_day, end_day
+            );
+
+            INSERT INTO api_usage ({COLUMNS})
+                SELECT {COLUMNS} FROM api_usage_moved;
+            DROP TABLE api_usage_moved;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Drops every monthly partition that ends on or before a cutoff day
+    op.execute("""
+        CREATE FUNCTION drop_api_usage_partitions_before(cutoff date) RETURNS integer AS $$
+        DECLARE
+            partition_name text;
+            dropped integer := 0;
+        BEGIN
+            FOR partition_name IN
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = 'api_usage'
+                  AND child.relname ~ '^api_usage_[0-9]{4}_[0-9]{2}$'
+                  AND (to_date(substr(child.relname, 11), 'YYYY_MM') + interval '1 month')::date <= cutoff
+            LOOP
+                EXECUTE format('DROP TABLE %I', partition_name);
+                dropped := dropped + 1;
+            END LOOP;
+            RETURN dropped;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Monthly partitions from the oldest existing row through next month, so
+    # every copied row has its month's partition
+    op.execute("""
+        SELECT create_api_usage_partition(month::date)
+        FROM generate_series(
+            date_trunc('month', COALESCE(
+                (SELECT MIN(created_at) FROM api_usage_unpartitioned),
+                timezone('utc', now())
+            )),
+            date_trunc('month', timezone('utc', now())) + interval '1 month',
+            interval '1 month'
+        ) AS month
+    """)
+
+    op.execute(f"""
+        INSERT INTO api_usage ({COLUMNS})
+        SELECT {COLUMNS} FROM api_usage_unpartitioned
+    """)
+    op.drop_table('api_usage_unpartitioned')
+
+    _create_indexes()
+    _create_foreign_keys()
+
+
+def downgrade() -> None:
+    """Rebuild api_usage as a single unpartitioned table."""
+    op.execute("""
+        CREATE TABLE api_usage_unpartitioned (
+            LIKE api_usage
+            INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING COMMENTS
+        )
+    """)
+    op.execute(f"""
+        INSERT INTO api_usage_unpartitioned ({COLUMNS})
+        SELECT {COLUMNS} FROM api_usage
+    """)
+
+    # Dropping the parent drops every partition with it
+    op.drop_table('api_usage')
+    op.execute("DROP FUNCTION drop_api_usage_partitions_before(date)")
+    op.execute("DROP FUNCTION create_api_usage_partition(date)")
+
+    op.execute("ALTER TABLE api_usage_unpartitioned RENAME TO api_usage")
+    op.create_primary_key('api_usage_pkey', 'api_usage', ['id'])
+
+    _create_indexes()
+    _create_foreign_keys()
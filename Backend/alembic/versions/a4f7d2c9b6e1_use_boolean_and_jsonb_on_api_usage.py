@@ -0,0 +1,55 @@
+"""use_boolean_and_jsonb_on_api_usage
+
+Revision ID: a4f7d2c9b6e1
+Revises: 8d3c6a1f9e2b
+Create Date: 2026-10-16 11:05:23.904716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f7d2c9b6e1'
+down_revision: Union[str, Sequence[str], None] = '8d3c6a1f9e2b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store api_usage.success as boolean and additional_data as jsonb."""
+    op.alter_column('api_usage', 'success',
+               existing_type=sa.Integer(),
+               type_=sa.Boolean(),
+               existing_nullable=False,
+               comment='Whether the request succeeded',
+               existing_comment='Whether the request succeeded (1) or failed (0)',
+               postgresql_using='success::boolean')
+    op.alter_column('api_usage', 'additional_data',
+               existing_type=sa.Text(),
+               type_=postgresql.JSONB(astext_type=sa.Text()),
+               existing_nullable=True,
+               comment='Additional metadata as JSON',
+               existing_comment='Additional metadata as JSON string',
+               postgresql_using='additional_data::jsonb')
+
+
+def downgrade() -> None:
+    """Revert api_usage.success to integer and additional_data to text."""
+    op.alter_column('api_usage', 'additional_data',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               type_=sa.Text(),
+               existing_nullable=True,
+               comment='Additional metadata as JSON string',
+               existing_comment='Additional metadata as JSON',
+               postgresql_using='additional_data::text')
+    op.alter_column('api_usage', 'success',
+               existing_type=sa.Boolean(),
+               type_=sa.Integer(),
+               existing_nullable=False,
+               comment='Whether the request succeeded (1) or failed (0)',
+               existing_comment='Whether the request succeeded',
+               postgresql_using='success::integer')
@@ -0,0 +1,44 @@
+"""set_database_side_timestamp_defaults
+
+Revision ID: c3e9b7a5d2f8
+Revises: a4f7d2c9b6e1
+Create Date: 2026-10-16 11:38:52.170463
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e9b7a5d2f8'
+down_revision: Union[str, Sequence[str], None] = 'a4f7d2c9b6e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    'users',
+    'documents',
+    'transactions',
+    'bank_accounts',
+    'system_banners',
+    'api_usage',
+)
+
+UTC_NOW = sa.text("timezone('utc', now())")
+
+
+def upgrade() -> None:
+    """Let Postgres stamp created_at/updated_at (naive UTC) on insert."""
+    for table in TABLES:
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(), server_default=UTC_NOW)
+        op.alter_column(table, 'updated_at', existing_type=sa.DateTime(), server_default=UTC_NOW)
+
+
+def downgrade() -> None:
+    """Restore the previous timestamp defaults (only bank_accounts had one)."""
+    for table in TABLES:
+        previous = sa.text('now()') if table == 'bank_accounts' else None
+        op.alter_column(table, 'updated_at', existing_type=sa.DateTime(), server_default=previous)
+        op.alter_column(table, 'created_at', existing_type=sa.DateTime(), server_default=previous)
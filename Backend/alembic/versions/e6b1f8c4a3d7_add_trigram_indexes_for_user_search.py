@@ -0,0 +1,40 @@
+"""add_trigram_indexes_for_user_search
+
+Revision ID: e6b1f8c4a3d7
+Revises: c3e9b7a5d2f8
+Create Date: 2026-10-16 13:02:16.447105
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b1f8c4a3d7'
+down_revision: Union[str, Sequence[str], None] = 'c3e9b7a5d2f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ('email', 'first_name', 'last_name', 'business_name')
+
+
+def upgrade() -> None:
+    """Add pg_trgm GIN indexes for the admin user search."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f'idx_users_{column}_trgm',
+            'users',
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes (the pg_trgm extension is left installed)."""
+    for column in SEARCH_COLUMNS:
+        op.drop_index(f'idx_users_{column}_trgm', table_name='users')
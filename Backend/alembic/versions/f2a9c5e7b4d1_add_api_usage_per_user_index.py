@@ -0,0 +1,35 @@
+"""add_api_usage_per_user_index
+
+Revision ID: f2a9c5e7b4d1
+Revises: e6b1f8c4a3d7
+Create Date: 2026-10-16 13:27:49.803512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a9c5e7b4d1'
+down_revision: Union[str, Sequence[str], None] = 'e6b1f8c4a3d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the api_usage user_id index with a covering per-user index."""
+    op.create_index(
+        'idx_api_usage_user_date_success',
+        'api_usage',
+        ['user_id', 'created_at', 'success'],
+        unique=False,
+        postgresql_include=['input_tokens', 'output_tokens', 'total_tokens']
+    )
+    op.drop_index(op.f('ix_api_usage_user_id'), table_name='api_usage')
+
+
+def downgrade() -> None:
+    """Restore the single-column user_id index."""
+    op.create_index(op.f('ix_api_usage_user_id'), 'api_usage', ['user_id'], unique=False)
+    op.drop_index('idx_api_usage_user_date_success', table_name='api_usage')
@@ -4,7 +4,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import AsyncSessionLocal
-from app.models.user import User
+from app.schemas.user import CurrentUser
 from app.services.auth_service import AuthService
 from app.core.exceptions import InvalidTokenError, InactiveUserError
 
@@ -38,7 +38,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> CurrentUser:
     """
     Dependency to get current authenticated user from JWT token.
 
@@ -47,7 +47,7 @@ async def get_current_user(
         db: Database session
 
     Returns:
-        Current authenticated User object
+        Current authenticated user (CurrentUser snapshot)
 
     Raises:
         HTTPException: 401 if token is invalid or user not found
@@ -55,7 +55,7 @@ async def get_current_user(
 
     Usage:
         @app.get("/protected")
-        async def protected_route(current_user: User = Depends(get_current_user)):
+        async def protected_route(current_user: CurrentUser = Depends(get_current_user)):
             return {"user_id": current_user.id}
     """
     token = credentials.credentials
@@ -68,8 +68,8 @@ async def get_current_user(
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user)
+) -> CurrentUser:
     """
     Dependency to get current active user.
 
@@ -80,14 +80,14 @@ async def get_current_active_user(
         current_user: Current user from get_current_user dependency
 
     Returns:
-        Current active User object
+        Current active user (CurrentUser snapshot)
 
     Raises:
         HTTPException: 403 if user is inactive
 
     Usage:
         @app.get("/protected")
-        async def protected_route(user: User = Depends(get_current_active_user)):
+        async def protected_route(user: CurrentUser = Depends(get_current_active_user)):
             return {"user_id": user.id}
     """
     if not current_user.is_active:
@@ -97,8 +97,8 @@ async def get_current_active_user(
 
 
 async def get_verified_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user)
+) -> CurrentUser:
     """
     Dependency to get current verified user.
 
@@ -109,14 +109,14 @@ async def get_verified_user(
         current_user: Current user from get_current_user dependency
 
     Returns:
-        Current verified User object
+        Current verified user (CurrentUser snapshot)
 
     Raises:
         HTTPException: 403 if user's email is not verified
 
     Usage:
         @app.post("/invoices")
-        async def create_invoice(user: User = Depends(get_verified_user)):
+        async def create_invoice(user: CurrentUser = Depends(get_verified_user)):
             return {"user_id": user.id}
     """
     if not current_user.is_verified:
@@ -132,7 +132,7 @@ async def get_current_user_ws(
     websocket: WebSocket,
     token: str = Query(..., description="JWT access token for WebSocket authentication"),
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> CurrentUser:
     """
     Dependency to get current authenticated user from WebSocket query parameter.
 
@@ -145,7 +145,7 @@ async def get_current_user_ws(
         db: Database session
 
     Returns:
-        Current authenticated User object
+        Current authenticated user (CurrentUser snapshot)
 
     Raises:
         WebSocketException: 1008 if token is invalid or user not found
@@ -163,8 +163,8 @@ async def get_current_user_ws(
 
 
 async def get_admin_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user)
+) -> CurrentUser:
     """
     Dependency to get current admin user.
 
@@ -175,14 +175,14 @@ async def get_admin_user(
         current_user: Current user from get_current_user dependency
 
     Returns:
-        Current admin User object
+        Current admin user (CurrentUser snapshot)
 
     Raises:
         HTTPException: 403 if user is not a superuser
 
     Usage:
         @app.get("/admin/users")
-        async def list_all_users(admin: User = Depends(get_admin_user)):
+        async def list_all_users(admin: CurrentUser = Depends(get_admin_user)):
             return {"admin_id": admin.id}
     """
     if not current_user.is_superuser:
@@ -5,7 +5,8 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_admin_user
-from app.models.user import User
+from app.db.session import gather_in_sessions
+from app.schemas.user import CurrentUser
 from app.schemas.admin import (
     AdminUserResponse,
     AdminUserUpdate,
@@ -21,13 +22,15 @@ router = APIRouter()
 
 @router.get("/statistics", response_model=AdminStatistics)
 async def get_admin_statistics(
-    admin: User = Depends(get_admin_user),
+    admin: CurrentUser = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db)
 ) -> AdminStatistics:
     """
     Get admin dashboard statistics.
 
-    Returns comprehensive statistics about users and system status.
+    Returns comprehensive statistics about users and system status. The
+    user statistics and the banner count are independent, so they are
+    queried concurrently when a second connection is free.
 
     Args:
         admin: Current admin user (injected)
@@ -57,10 +60,13 @@ async def get_admin_statistics(
             "active_banners": 1
         }
     """
-    stats = await AdminRepository.get_statistics(db)
+    stats, active_banners = await gather_in_sessions(
+        db,
+        AdminRepository.get_statistics,
+        SystemBannerRepository.get_active_count,
+    )
 
     # Add active banners count
-    active_banners = await SystemBannerRepository.get_active_count(db)
     stats["active_banners"] = active_banners
 
     return AdminStatistics(**stats)
@@ -74,7 +80,7 @@ async def list_all_users(
     is_verified: Optional[bool] = Query(None, description="Filter by verification status"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     is_superuser: Optional[bool] = Query(None, description="Filter by superuser status"),
-    admin: User = Depends(get_admin_user),
+    admin: CurrentUser = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db)
 ) -> AdminUserListResponse:
     """
@@ -140,7 +146,7 @@ async def list_all_users(
 @router.get("/users/{user_id}", response_model=AdminUserResponse)
 async def get_user_by_id(
     user_id: UUID,
-    admin: User = Depends(get_admin_user),
+    admin: CurrentUser = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db)
 ) -> AdminUserResponse:
     """
@@ -188,7 +194,7 @@ async def get_user_by_id(
 async def update_user(
     user_id: UUID,
     user_update: AdminUserUpdate,
-    admin: User = Depends(get_admin_user),
+    admin: CurrentUser = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db)
 ) -> AdminUserResponse:
     """
@@ -248,7 +254,7 @@ async def update_user(
 @router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: UUID,
-    admin: User = Depends(get_admin_user),
+    admin: CurrentUser = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -291,7 +297,7 @@ async def delete_user(
 @router.post("/users/{user_id}/unlock", response_model=AdminUserResponse)
 async def unlock_user_account(
     user_id: UUID,
-    admin: User = Depends(get_admin_user),
+    admin: CurrentUser = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db)
 ) -> AdminUserResponse:
     """
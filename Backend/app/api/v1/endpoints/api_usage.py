@@ -8,16 +8,20 @@ from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
 
 from app.api.deps import get_db, get_current_user
-from app.models.user import User
+from app.db.session import AsyncSessionLocal
+from app.schemas.user import CurrentUser
 from app.repositories.api_usage_repository import APIUsageRepository
 from app.schemas.api_usage import (
     UsageSummaryResponse,
     UserUsageStats,
     DailyUsageResponse,
     DailyUsageStats,
+    ServiceBreakdown,
     ServiceBreakdownResponse,
     RecentRequestsResponse,
     UserTodayUsage,
@@ -28,7 +32,7 @@ from app.schemas.api_usage import (
 router = APIRouter()
 
 
-def require_admin(current_user: User = Depends(get_current_user)) -> User:
+def require_admin(current_user: CurrentUser = Depends(get_current_user)) -> CurrentUser:
     """
     Dependency to require admin/superuser access.
 
@@ -55,7 +59,7 @@ async def get_usage_summary(
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     limit: int = Query(100, ge=1, le=1000, description="Max users to return"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: CurrentUser = Depends(require_admin),
 ) -> UsageSummaryResponse:
     """
     Get overall usage summary with per-user statistics.
@@ -123,7 +127,7 @@ async def get_usage_summary(
 async def get_daily_usage(
     days: int = Query(30, ge=1, le=365, description="Number of days to include"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: CurrentUser = Depends(require_admin),
 ) -> DailyUsageResponse:
     """
     Get daily usage trends for the past N days.
@@ -158,7 +162,7 @@ async def get_service_breakdown(
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: CurrentUser = Depends(require_admin),
 ) -> ServiceBreakdownResponse:
     """
     Get usage breakdown by service and operation type.
@@ -206,7 +210,7 @@ async def get_service_breakdown(
         end_date=end_dt
     )
 
-    return ServiceBreakdownResponse(services=services)
+    return ServiceBreakdownResponse(services=[ServiceBreakdown(**s) for s in services])
 
 
 @router.get("/recent", response_model=RecentRequestsResponse)
@@ -214,7 +218,7 @@ async def get_recent_requests(
     user_id: Optional[UUID] = Query(None, description="Filter by user ID"),
     limit: int = Query(50, ge=1, le=200, description="Number of requests to return"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: CurrentUser = Depends(require_admin),
 ) -> RecentRequestsResponse:
     """
     Get recent API requests with details.
@@ -253,7 +257,7 @@ async def get_recent_requests(
             output_tokens=req.output_tokens,
             total_tokens=req.total_tokens,
             status_code=req.status_code,
-            success=bool(req.success),
+            success=req.success,
             error_message=req.error_message,
             duration_ms=req.duration_ms,
             created_at=req.created_at
@@ -267,11 +271,65 @@ async def get_recent_requests(
     )
 
 
+@router.get("/export")
+async def export_requests(
+    user_id: Optional[UUID] = Query(None, description="Filter by user ID"),
+    start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+    limit: int = Query(10000, ge=1, le=100000, description="Maximum requests to export"),
+    current_user: CurrentUser = Depends(require_admin),
+) -> StreamingResponse:
+    """
+    Export API requests as newline-delimited JSON (one request per line).
+
+    Requires admin access. Rows are streamed from a server-side cursor and
+    written out as they arrive, so large exports neither buffer in memory
+    nor delay the first byte.
+
+    Args:
+        user_id: Optional user ID filter
+        start_date: Optional start date filter
+        end_date: Optional end date filter
+        limit: Maximum number of requests to export (default: 10000)
+        current_user: Current admin user (injected)
+
+    Returns:
+        Streaming application/x-ndjson response, newest requests first
+
+    Raises:
+        400: Invalid date format
+        401: Not authenticated
+        403: Not an admin
+    """
+    try:
+        start_dt = datetime.fromisoformat(start_date) if start_date else None
+        end_dt = datetime.fromisoformat(end_date) if end_date else None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid date format. Use YYYY-MM-DD"
+        )
+
+    async def generate():
+        # The stream outlives the request's dependencies, so it owns its session
+        async with AsyncSessionLocal() as db:
+            async for row in APIUsageRepository.stream_requests(
+                db=db,
+                user_id=user_id,
+                start_date=start_dt,
+                end_date=end_dt,
+                limit=limit
+            ):
+                yield orjson.dumps(dict(row), option=orjson.OPT_APPEND_NEWLINE)
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/users/{user_id}/today", response_model=UserTodayUsage)
 async def get_user_today_usage(
     user_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: CurrentUser = Depends(require_admin),
 ) -> UserTodayUsage:
     """
     Get today's usage for a specific user.
@@ -301,7 +359,7 @@ async def get_user_today_usage(
 @router.get("/me/today", response_model=UserTodayUsage)
 async def get_my_today_usage(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> UserTodayUsage:
     """
     Get today's usage for the current user.
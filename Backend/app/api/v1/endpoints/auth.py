@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
@@ -13,6 +13,7 @@ router = APIRouter()
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ) -> UserResponse:
     """
@@ -22,6 +23,7 @@ async def register(
 
     Args:
         user_data: User registration data (email, password, first_name, last_name)
+        background_tasks: FastAPI background tasks (injected)
         db: Database session (injected)
 
     Returns:
@@ -40,7 +42,7 @@ async def register(
             "last_name": "Doe"
         }
     """
-    user = await AuthService.register_user(db, user_data)
+    user = await AuthService.register_user(db, user_data, background_tasks)
     return UserResponse.model_validate(user)
 
 
@@ -184,6 +186,7 @@ async def verify_email(
 @router.post("/resend-verification", status_code=status.HTTP_200_OK)
 async def resend_verification(
     email: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ) -> dict:
     """
@@ -191,6 +194,7 @@ async def resend_verification(
 
     Args:
         email: User's email address
+        background_tasks: FastAPI background tasks (injected)
         db: Database session (injected)
 
     Returns:
@@ -208,7 +212,7 @@ async def resend_verification(
             "message": "Verification email sent successfully"
         }
     """
-    success = await AuthService.resend_verification_email(db, email)
+    success = await AuthService.resend_verification_email(db, email, background_tasks)
     if success:
         return {"message": "Verification email sent successfully"}
     else:
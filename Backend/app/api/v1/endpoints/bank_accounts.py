@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_current_user
-from app.models.user import User
+from app.schemas.user import CurrentUser
 from app.models.bank_account import Currency
 from app.repositories.bank_account_repository import BankAccountRepository
 from app.schemas.bank_account import (
@@ -20,7 +20,7 @@ router = APIRouter()
 @router.post("", response_model=BankAccountResponse, status_code=201)
 async def create_bank_account(
     bank_account_data: BankAccountCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new bank account"""
@@ -38,7 +38,7 @@ async def list_bank_accounts(
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     currency: Optional[Currency] = Query(None, description="Filter by currency"),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get all bank accounts for current user"""
@@ -66,7 +66,7 @@ async def list_bank_accounts(
 
 @router.get("/active", response_model=list[BankAccountResponse])
 async def get_active_bank_accounts(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get all active bank accounts (for dropdowns)"""
@@ -80,7 +80,7 @@ async def get_active_bank_accounts(
 @router.get("/{bank_account_id}", response_model=BankAccountResponse)
 async def get_bank_account(
     bank_account_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get a specific bank account"""
@@ -100,7 +100,7 @@ async def get_bank_account(
 async def update_bank_account(
     bank_account_id: UUID,
     update_data: BankAccountUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Update a bank account"""
@@ -120,7 +120,7 @@ async def update_bank_account(
 @router.delete("/{bank_account_id}", status_code=204)
 async def delete_bank_account(
     bank_account_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a bank account"""
@@ -139,7 +139,7 @@ async def delete_bank_account(
 @router.post("/{bank_account_id}/deactivate", response_model=BankAccountResponse)
 async def deactivate_bank_account(
     bank_account_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Deactivate a bank account (soft delete)"""
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_admin_user, get_current_user
-from app.models.user import User
+from app.schemas.user import CurrentUser
 from app.schemas.system_banner import (
     SystemBannerCreate,
     SystemBannerUpdate,
@@ -21,7 +21,7 @@ router = APIRouter()
 # Public endpoint - get active banners for current user
 @router.get("/active", response_model=list[SystemBannerResponse])
 async def get_active_banners(
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> list[SystemBannerResponse]:
     """
@@ -61,7 +61,7 @@ async def get_active_banners(
             }
         ]
     """
-    banners = await SystemBannerRepository.get_active_banners(db, current_user.is_verified)
+    banners = await SystemBannerRepository.get_active_banners_cached(db, current_user.is_verified)
     return [SystemBannerResponse.model_validate(banner) for banner in banners]
 
 
@@ -69,7 +69,7 @@ async def get_active_banners(
 @router.post("", response_model=SystemBannerResponse, status_code=status.HTTP_201_CREATED)
 async def create_banner(
     banner_data: SystemBannerCreate,
-    admin: User = Depends(get_admin_user),
+    admin: CurrentUser = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db)
 ) -> SystemBannerResponse:
     """
@@ -113,7 +113,7 @@ async def list_banners(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
     active_only: bool = Query(False, description="Show only active banners"),
-    admin: User = Depends(get_admin_user),
+    admin: CurrentUser = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db)
 ) -> SystemBannerListResponse:
     """
@@ -158,7 +158,7 @@ async def list_banners(
 @router.get("/{banner_id}", response_model=SystemBannerResponse)
 async def get_banner(
     banner_id: UUID,
-    admin: User = Depends(get_admin_user),
+    admin: CurrentUser = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db)
 ) -> SystemBannerResponse:
     """
@@ -196,7 +196,7 @@ async def get_banner(
 async def update_banner(
     banner_id: UUID,
     banner_update: SystemBannerUpdate,
-    admin: User = Depends(get_admin_user),
+    admin: CurrentUser = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db)
 ) -> SystemBannerResponse:
     """
@@ -242,7 +242,7 @@ async def update_banner(
 @router.delete("/{banner_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_banner(
     banner_id: UUID,
-    admin: User = Depends(get_admin_user),
+    admin: CurrentUser = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -279,7 +279,7 @@ async def delete_banner(
 @router.post("/{banner_id}/deactivate", response_model=SystemBannerResponse)
 async def deactivate_banner(
     banner_id: UUID,
-    admin: User = Depends(get_admin_user),
+    admin: CurrentUser = Depends(get_admin_user),
     db: AsyncSession = Depends(get_db)
 ) -> SystemBannerResponse:
     """
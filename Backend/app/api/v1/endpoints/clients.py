@@ -2,10 +2,9 @@ from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from math import ceil
 
 from app.api.deps import get_db, get_current_user, get_verified_user
-from app.models.user import User
+from app.schemas.user import CurrentUser
 from app.schemas.client import ClientCreate, ClientUpdate, ClientResponse, ClientListResponse
 from app.repositories.client_repository import ClientRepository
 
@@ -17,7 +16,7 @@ router = APIRouter()
 async def create_client(
     client_data: ClientCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_verified_user),
+    current_user: CurrentUser = Depends(get_verified_user),
 ) -> ClientResponse:
     """
     Create a new client.
@@ -45,7 +44,7 @@ async def list_clients(
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> ClientListResponse:
     """
     List all clients for the current user.
@@ -68,7 +67,7 @@ async def list_clients(
         db, current_user.id, skip=skip, limit=page_size, is_active=is_active
     )
 
-    total_pages = ceil(total / page_size) if total > 0 else 1
+    total_pages = (total + page_size - 1) // page_size if total else 1
 
     return ClientListResponse(
         clients=[ClientResponse.model_validate(client) for client in clients],
@@ -83,7 +82,7 @@ async def list_clients(
 async def get_client(
     client_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> ClientResponse:
     """
     Get a specific client by ID.
@@ -114,7 +113,7 @@ async def update_client(
     client_id: UUID,
     client_data: ClientUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_verified_user),
+    current_user: CurrentUser = Depends(get_verified_user),
 ) -> ClientResponse:
     """
     Update a client.
@@ -147,7 +146,7 @@ async def update_client(
 async def delete_client(
     client_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> None:
     """
     Delete a client.
@@ -174,7 +173,7 @@ async def delete_client(
 async def deactivate_client(
     client_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> ClientResponse:
     """
     Deactivate a client (soft delete).
@@ -6,12 +6,11 @@ and retrieval of extraction results for the review screen.
 """
 from typing import Optional
 from uuid import UUID
-from math import ceil
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query, BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_current_user
-from app.models.user import User
+from app.schemas.user import CurrentUser
 from app.models.document import DocumentType, ProcessingStatus
 from app.schemas.document import (
     DocumentUploadResponse,
@@ -70,7 +69,6 @@ async def process_document_background(
             extracted_data = await GeminiService.extract_bank_statement_data(
                 file_content=file_content,
                 filename=filename,
-                db=db,
                 user_id=user_id,
                 document_id=document_id
             )
@@ -90,19 +88,20 @@ async def process_document_background(
             )
 
             # Send WebSocket notification to user
+            document_id_str = str(document_id)
             await manager.notify_document_completed(
-                user_id=user_id,
-                document_id=document_id,
+                user_id=str(user_id),
+                document_id=document_id_str,
                 filename=filename
             )
 
             # Send email notification if requested
             if email_notification_requested:
-                EmailService.send_document_processed_email(
+                await EmailService.send_document_processed_email(
                     to_email=user_email,
                     first_name=user_first_name,
                     document_filename=filename,
-                    document_id=str(document_id),
+                    document_id=document_id_str,
                     frontend_url=settings.FRONTEND_URL
                 )
 
@@ -133,7 +132,7 @@ async def upload_document(
     bank_account_id: Optional[UUID] = Query(None, description="Bank account ID for bank statements"),
     email_notification: bool = Query(False, description="Send email notification when processing completes"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> DocumentUploadResponse:
     """
     Upload a document (bank statement PDF) for async processing.
@@ -212,7 +211,7 @@ async def upload_document(
 async def get_document_status(
     document_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> DocumentStatusResponse:
     """
     Get document processing status and results.
@@ -252,7 +251,7 @@ async def list_documents(
     document_type: Optional[str] = Query(None, description="Filter by document type"),
     status_filter: Optional[str] = Query(None, description="Filter by processing status (comma-separated)"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> DocumentListResponse:
     """
     List all documents for the current user.
@@ -305,7 +304,7 @@ async def list_documents(
         status=status_enums
     )
 
-    total_pages = ceil(total / page_size) if total > 0 else 1
+    total_pages = (total + page_size - 1) // page_size if total else 1
 
     # Build response with transaction counts
     document_responses = []
@@ -327,7 +326,7 @@ async def list_documents(
 async def delete_document(
     document_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> None:
     """
     Delete a document and all associated transactions.
@@ -353,7 +352,7 @@ async def delete_document(
 async def get_extraction_results(
     document_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> dict:
     """
     Get raw extraction results for review before importing.
@@ -373,9 +372,9 @@ async def get_extraction_results(
         401: Not authenticated
         404: Document not found or not yet processed
     """
-    import json
-
-    document = await DocumentRepository.get_by_id(db, document_id, current_user.id)
+    document = await DocumentRepository.get_by_id(
+        db, document_id, current_user.id, include_extraction_result=True
+    )
     if not document:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -394,11 +393,5 @@ async def get_extraction_results(
             detail="No extraction results available"
         )
 
-    try:
-        extraction_data = json.loads(document.extraction_result)
-        return extraction_data
-    except json.JSONDecodeError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to parse extraction results"
-        )
+    # Stored as JSONB, so the driver has already decoded it
+    return document.extraction_result
@@ -3,10 +3,9 @@ from uuid import UUID
 from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from math import ceil
 
 from app.api.deps import get_db, get_current_user, get_verified_user
-from app.models.user import User
+from app.schemas.user import CurrentUser
 from app.schemas.invoice import (
     InvoiceCreate,
     InvoiceUpdate,
@@ -25,7 +24,7 @@ router = APIRouter()
 async def create_invoice(
     invoice_data: InvoiceCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_verified_user),
+    current_user: CurrentUser = Depends(get_verified_user),
 ) -> InvoiceResponse:
     """
     Create a new invoice with items.
@@ -65,7 +64,7 @@ async def list_invoices(
     start_date: Optional[date] = Query(None, description="Filter by issue date >="),
     end_date: Optional[date] = Query(None, description="Filter by issue date <="),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> InvoiceListResponse:
     """
     List all invoices for the current user.
@@ -98,7 +97,7 @@ async def list_invoices(
         end_date=end_date,
     )
 
-    total_pages = ceil(total / page_size) if total > 0 else 1
+    total_pages = (total + page_size - 1) // page_size if total else 1
 
     return InvoiceListResponse(
         invoices=[InvoiceResponse.model_validate(invoice) for invoice in invoices],
@@ -112,7 +111,7 @@ async def list_invoices(
 @router.get("/stats", response_model=InvoiceStats)
 async def get_invoice_stats(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> InvoiceStats:
     """
     Get invoice statistics for the current user.
@@ -135,7 +134,7 @@ async def get_invoice_stats(
 async def get_invoice(
     invoice_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> InvoiceResponse:
     """
     Get a specific invoice by ID.
@@ -166,7 +165,7 @@ async def update_invoice(
     invoice_id: UUID,
     invoice_data: InvoiceUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_verified_user),
+    current_user: CurrentUser = Depends(get_verified_user),
 ) -> InvoiceResponse:
     """
     Update an invoice.
@@ -208,7 +207,7 @@ async def update_invoice(
 async def delete_invoice(
     invoice_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> None:
     """
     Delete an invoice.
@@ -235,7 +234,7 @@ async def update_invoice_status(
     invoice_id: UUID,
     status: Literal["draft", "sent", "paid", "overdue", "cancelled"] = Query(..., description="New status"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_verified_user),
+    current_user: CurrentUser = Depends(get_verified_user),
 ) -> InvoiceResponse:
     """
     Update invoice status.
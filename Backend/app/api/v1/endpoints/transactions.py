@@ -7,12 +7,13 @@ filtering, and statistics.
 from typing import Optional
 from uuid import UUID
 from datetime import date
-from math import ceil
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_current_user, get_verified_user
-from app.models.user import User
+from app.core.etag import make_etag, not_modified
+from app.schemas.user import CurrentUser
 from app.models.transaction import TransactionType, TransactionCategory
 from app.schemas.transaction import (
     TransactionCreate,
@@ -23,7 +24,6 @@ from app.schemas.transaction import (
     TransactionStats
 )
 from app.repositories.transaction_repository import TransactionRepository
-from app.repositories.document_repository import DocumentRepository
 
 
 router = APIRouter()
@@ -33,7 +33,7 @@ router = APIRouter()
 async def create_transaction(
     transaction_data: TransactionCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_verified_user),
+    current_user: CurrentUser = Depends(get_verified_user),
 ) -> TransactionResponse:
     """
     Create a new transaction manually.
@@ -66,7 +66,7 @@ async def bulk_import_transactions(
     import_data: TransactionBulkImportRequest,
     document_id: UUID = Query(..., description="Document ID these transactions belong to"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_verified_user),
+    current_user: CurrentUser = Depends(get_verified_user),
 ) -> dict:
     """
     Bulk import transactions from document extraction results.
@@ -92,34 +92,26 @@ async def bulk_import_transactions(
         404: Document not found
         422: Validation error
     """
-    # Verify document exists and belongs to user
-    document = await DocumentRepository.get_by_id(db, document_id, current_user.id)
-    if not document:
+    # Verify the document, drop transactions from a previous import and
+    # insert the new ones (inheriting bank_account_id from the document)
+    # in a single statement
+    result = await TransactionRepository.replace_document_transactions(
+        db=db,
+        user_id=current_user.id,
+        document_id=document_id,
+        transactions_data=import_data.transactions
+    )
+    if result is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Document not found"
         )
 
-    # Delete any existing transactions for this document (reimport scenario)
-    deleted_count = await TransactionRepository.delete_by_document_id(
-        db=db,
-        document_id=document_id,
-        user_id=current_user.id
-    )
-
-    # Bulk create transactions (inherit bank_account_id from document)
-    transactions = await TransactionRepository.bulk_create(
-        db=db,
-        user_id=current_user.id,
-        transactions_data=import_data.transactions,
-        document_id=document_id,
-        bank_account_id=document.bank_account_id,
-        source_document_name=document.original_filename
-    )
+    imported_count, deleted_count = result
 
     return {
         "message": "Transactions imported successfully",
-        "count": len(transactions),
+        "count": imported_count,
         "replaced_count": deleted_count,
         "document_id": str(document_id)
     }
@@ -129,14 +121,14 @@ async def bulk_import_transactions(
 async def list_transactions(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(100, ge=1, le=500, description="Items per page"),
-    transaction_type: Optional[str] = Query(None, description="Filter by type (debit/credit)"),
-    category: Optional[str] = Query(None, description="Filter by category"),
+    transaction_type: Optional[TransactionType] = Query(None, description="Filter by type (debit/credit)"),
+    category: Optional[TransactionCategory] = Query(None, description="Filter by category"),
     start_date: Optional[date] = Query(None, description="Filter by date >="),
     end_date: Optional[date] = Query(None, description="Filter by date <="),
     document_id: Optional[UUID] = Query(None, description="Filter by document"),
     bank_account_id: Optional[UUID] = Query(None, description="Filter by bank account"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> TransactionListResponse:
     """
     List all transactions for the current user.
@@ -158,44 +150,24 @@ async def list_transactions(
 
     Raises:
         401: Not authenticated
+        422: Invalid transaction type or category
     """
     skip = (page - 1) * page_size
 
-    # Parse enums if provided
-    type_enum = None
-    if transaction_type:
-        try:
-            type_enum = TransactionType(transaction_type)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid transaction type: {transaction_type}"
-            )
-
-    category_enum = None
-    if category:
-        try:
-            category_enum = TransactionCategory(category)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid category: {category}"
-            )
-
     transactions, total = await TransactionRepository.get_all(
         db=db,
         user_id=current_user.id,
         skip=skip,
         limit=page_size,
-        transaction_type=type_enum,
-        category=category_enum,
+        transaction_type=transaction_type,
+        category=category,
         start_date=start_date,
         end_date=end_date,
         document_id=document_id,
         bank_account_id=bank_account_id
     )
 
-    total_pages = ceil(total / page_size) if total > 0 else 1
+    total_pages = (total + page_size - 1) // page_size if total else 1
 
     return TransactionListResponse(
         transactions=[TransactionResponse.model_validate(t) for t in transactions],
@@ -208,13 +180,22 @@ async def list_transactions(
 
 @router.get("/stats", response_model=TransactionStats)
 async def get_transaction_stats(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> TransactionStats:
     """
     Get transaction statistics for the current user.
 
+    The response carries an ETag computed from the statistics themselves;
+    a matching If-None-Match gets 304 Not Modified with no body. The
+    aggregate queries still run on every request, so a 304 only saves
+    building and sending the response body.
+
     Args:
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
         db: Database session (injected)
         current_user: Current authenticated user (injected)
 
@@ -225,6 +206,15 @@ async def get_transaction_stats(
         401: Not authenticated
     """
     stats = await TransactionRepository.get_stats(db, current_user.id)
+
+    etag = make_etag(
+        current_user.id,
+        orjson.dumps(stats, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode()
+    )
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
     return TransactionStats(**stats)
 
 
@@ -232,7 +222,7 @@ async def get_transaction_stats(
 async def get_transaction(
     transaction_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> TransactionResponse:
     """
     Get a specific transaction by ID.
@@ -264,7 +254,7 @@ async def update_transaction(
     transaction_id: UUID,
     transaction_data: TransactionUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_verified_user),
+    current_user: CurrentUser = Depends(get_verified_user),
 ) -> TransactionResponse:
     """
     Update a transaction.
@@ -304,7 +294,7 @@ async def update_transaction(
 async def delete_transaction(
     transaction_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ) -> None:
     """
     Delete a transaction.
@@ -1,9 +1,9 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, get_current_active_user
-from app.models.user import User
-from app.schemas.user import UserResponse, UserUpdate, ChangePasswordRequest
+from app.core.etag import make_etag, not_modified
+from app.schemas.user import CurrentUser, UserResponse, UserUpdate, ChangePasswordRequest
 from app.repositories.user_repository import UserRepository
 from app.services.auth_service import AuthService
 
@@ -13,14 +13,20 @@ router = APIRouter()
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_profile(
-    current_user: User = Depends(get_current_active_user)
+    request: Request,
+    response: Response,
+    current_user: CurrentUser = Depends(get_current_active_user)
 ) -> UserResponse:
     """
     Get current user profile.
 
-    Returns the profile of the currently authenticated user.
+    Returns the profile of the currently authenticated user. The response
+    carries an ETag derived from the user's updated_at, and a matching
+    If-None-Match gets 304 Not Modified with no body.
 
     Args:
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
         current_user: Current authenticated user (injected)
 
     Returns:
@@ -44,13 +50,18 @@ async def get_current_user_profile(
             ...
         }
     """
+    etag = make_etag(current_user.id, current_user.updated_at)
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
     return UserResponse.model_validate(current_user)
 
 
 @router.put("/me", response_model=UserResponse)
 async def update_current_user_profile(
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUser = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> UserResponse:
     """
@@ -88,7 +99,7 @@ async def update_current_user_profile(
 @router.post("/me/change-password", status_code=status.HTTP_200_OK)
 async def change_password(
     password_data: ChangePasswordRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUser = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> dict:
     """
@@ -136,7 +147,7 @@ async def change_password(
 
 @router.delete("/me", status_code=status.HTTP_200_OK)
 async def deactivate_account(
-    current_user: User = Depends(get_current_active_user),
+    current_user: CurrentUser = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> dict:
     """
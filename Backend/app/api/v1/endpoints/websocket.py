@@ -4,12 +4,11 @@ WebSocket endpoint for real-time notifications.
 Provides WebSocket connection for users to receive real-time updates
 about document processing, transaction imports, and other events.
 """
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, status
-from fastapi.exceptions import HTTPException
+from fastapi import APIRouter, WebSocket, Depends
 
 from app.core.websocket_manager import manager
 from app.api.deps import get_current_user_ws
-from app.models.user import User
+from app.schemas.user import CurrentUser
 
 router = APIRouter()
 
@@ -17,7 +16,7 @@ router = APIRouter()
 @router.websocket("/ws")
 async def websocket_endpoint(
     websocket: WebSocket,
-    current_user: User = Depends(get_current_user_ws)
+    current_user: CurrentUser = Depends(get_current_user_ws)
 ):
     """
     WebSocket endpoint for real-time notifications.
@@ -42,19 +41,11 @@ async def websocket_endpoint(
     await manager.connect(user_id, websocket)
 
     try:
-        # Keep connection alive and listen for client messages
-        while True:
-            # Receive messages from client (mostly just keepalives)
-            data = await websocket.receive_text()
-
-            # Echo ping/pong for keepalive
-            if data == "ping":
-                await websocket.send_text("pong")
-
-    except WebSocketDisconnect:
-        # Clean disconnect
-        manager.disconnect(user_id, websocket)
-    except Exception as e:
-        # Error occurred
-        manager.disconnect(user_id, websocket)
-        raise
+        # Keepalive is handled by protocol-level ping frames (uvicorn
+        # --ws-ping-interval / --ws-ping-timeout), so there is nothing to
+        # answer here; just wait until the client goes away. Any text the
+        # client sends (e.g. legacy "ping" keepalives) is ignored.
+        async for _ in websocket.iter_text():
+            pass
+    finally:
+        await manager.disconnect(user_id, websocket)
@@ -0,0 +1,117 @@
+"""
+Buffered writer for API usage records.
+
+Every Gemini call produces one api_usage row. Instead of a round-trip and
+commit per call, records are queued in memory and written in batches by a
+background task: a batch is flushed once it reaches MAX_BATCH_SIZE rows or
+FLUSH_INTERVAL_SECONDS after its first row arrived, whichever comes first.
+
+Usage logging is best-effort; a failed batch is reported and dropped rather
+than failing the request that produced it.
+"""
+from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+
+from sqlalchemy import insert
+
+from app.db.session import AsyncSessionLocal
+from app.models.api_usage import APIUsage
+
+logger = logging.getLogger(__name__)
+
+# Flush thresholds
+MAX_BATCH_SIZE = 500
+FLUSH_INTERVAL_SECONDS = 0.2
+
+# Queued by stop() to tell the flush task to exit
+_STOP = object()
+
+
+class APIUsageBuffer:
+    """Queues API usage rows and inserts them in batches."""
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background flush task (called on application startup)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Write any queued rows and stop the flush task (called on shutdown)."""
+        if self._task is not None:
+            # The sentinel lands behind every queued row, so the task drains
+            # the queue before exiting
+            self._queue.put_nowait(_STOP)
+            await self._task
+            self._task = None
+
+    async def record(self, row: Dict[str, Any]):
+        """
+        Queue an API usage row for insertion.
+
+        Without a running flush task (e.g. outside the web application) the
+        row is written immediately.
+
+        Args:
+            row: Column values for a new APIUsage record
+        """
+        if self._task is None:
+            await self._flush([row])
+            return
+
+        self._queue.put_nowait(row)
+
+    async def _run(self):
+        """Collect queued rows into batches and flush them until stopped."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            # Wait for the first row of the next batch, then gather more
+            # until the batch is full or its flush deadline passes
+            row = await self._queue.get()
+            if row is _STOP:
+                return
+
+            rows = [row]
+            deadline = loop.time() + FLUSH_INTERVAL_SECONDS
+
+            while len(rows) < MAX_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is _STOP:
+                    stopping = True
+                    break
+                rows.append(row)
+
+            await self._flush(rows)
+
+    async def _flush(self, rows: List[Dict[str, Any]]):
+        """
+        Insert a batch of rows in a single Core executemany statement.
+
+        Args:
+            rows: Column values for new APIUsage records
+        """
+        if not rows:
+            return
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(insert(APIUsage.__table__), rows)
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} API usage records: {e}")
+
+
+# Global API usage buffer instance
+api_usage_buffer = APIUsageBuffer()
@@ -0,0 +1,92 @@
+"""
+Scheduled maintenance of the monthly api_usage partitions.
+
+Creates the coming months' partitions ahead of time and, when
+API_USAGE_RETENTION_MONTHS is set, drops partitions past retention. It runs
+after migrations in start.sh, hourly from the web app's rollup loop (see
+app.core.api_usage_rollup) and, where Celery beat is deployed, daily as
+maintain_api_usage_partitions_task. It can also be run directly with:
+
+    python -m app.core.api_usage_partitions
+
+A transaction-level advisory lock makes overlapping runs (other workers,
+beat) skip instead of issuing the partition DDL twice.
+"""
+from datetime import date, datetime
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.celery_app import celery_app, MAINTENANCE_QUEUE
+from app.core.config import settings
+from app.repositories.api_usage_repository import APIUsageRepository
+
+logger = logging.getLogger(__name__)
+
+
+def retention_cutoff(today: date, retention_months: int) -> date:
+    """
+    First day kept under a retention of whole months.
+
+    The current month plus retention_months full months before it are kept.
+
+    Args:
+        today: Current (UTC) day
+        retention_months: Number of full months to keep before the current one
+
+    Returns:
+        First day of the oldest month kept
+    """
+    months = today.year * 12 + today.month - 1 - retention_months
+    return date(months // 12, months % 12 + 1, 1)
+
+
+async def maintain_partitions(db: AsyncSession) -> bool:
+    """
+    Create upcoming api_usage partitions and drop those past retention.
+
+    Args:
+        db: Database session
+
+    Returns:
+        True if maintenance ran, False if another run held the lock
+    """
+    if not await APIUsageRepository.try_lock_partition_maintenance(db):
+        await db.rollback()
+        logger.info("api_usage partition maintenance already running, skipped")
+        return False
+
+    await APIUsageRepository.create_partitions(db)
+
+    if settings.API_USAGE_RETENTION_MONTHS:
+        cutoff = retention_cutoff(datetime.utcnow().date(), settings.API_USAGE_RETENTION_MONTHS)
+        dropped = await APIUsageRepository.drop_partitions_before(db, cutoff)
+        if dropped:
+            logger.info(f"Dropped {dropped} api_usage partitions before {cutoff}")
+
+    # Ends the transaction, releasing the advisory lock
+    await db.commit()
+    return True
+
+
+async def _run() -> bool:
+    """Run maintenance on a dedicated engine (outside the web app's event loop)."""
+    engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+    try:
+        async with AsyncSession(engine) as db:
+            return await maintain_partitions(db)
+    finally:
+        await engine.dispose()
+
+
+@celery_app.task(queue=MAINTENANCE_QUEUE)
+def maintain_api_usage_partitions_task() -> bool:
+    """Celery beat entry point for partition maintenance."""
+    return asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run())
@@ -0,0 +1,81 @@
+"""
+Periodic refresh of the api_usage_daily rollup.
+
+Every worker runs the refresh loop; the upsert is idempotent, so overlapping
+runs only repeat work. Each run recomputes yesterday and today, which keeps
+completed days final as long as the loop ran at least once after midnight.
+
+The loop also runs api_usage partition maintenance, so deployments without
+Celery beat still get next month's partitions and retention. Its advisory
+lock lets only one worker at a time do the DDL; the others skip.
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+import asyncio
+import logging
+
+from app.core.api_usage_partitions import maintain_partitions
+from app.db.session import AsyncSessionLocal
+from app.repositories.api_usage_repository import APIUsageRepository, ROLLUP_LIVE_DAYS
+
+logger = logging.getLogger(__name__)
+
+# How often the rollup is refreshed
+ROLLUP_INTERVAL_SECONDS = 3600
+
+
+class APIUsageRollup:
+    """Background task that keeps api_usage_daily up to date."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the refresh loop (called on application startup)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the refresh loop (called on application shutdown)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def refresh(self):
+        """Recompute the rollup rows for the days still being aggregated live."""
+        since = datetime.utcnow().date() - timedelta(days=ROLLUP_LIVE_DAYS)
+
+        async with AsyncSessionLocal() as db:
+            await APIUsageRepository.refresh_daily_rollup(db, since)
+
+    async def run_partition_maintenance(self):
+        """Create upcoming api_usage partitions and drop expired ones."""
+        async with AsyncSessionLocal() as db:
+            await maintain_partitions(db)
+
+    async def _run(self):
+        """Refresh the rollup and maintain partitions every ROLLUP_INTERVAL_SECONDS."""
+        while True:
+            try:
+                await self.run_partition_maintenance()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"API usage partition maintenance failed: {e}")
+
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"API usage rollup refresh failed: {e}")
+
+            await asyncio.sleep(ROLLUP_INTERVAL_SECONDS)
+
+
+# Global rollup refresher instance
+api_usage_rollup = APIUsageRollup()
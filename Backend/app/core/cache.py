@@ -0,0 +1,75 @@
+"""
+Small JSON cache on top of the shared Redis client.
+
+Used for short-lived results of expensive queries (e.g. admin statistics).
+Without Redis configured every lookup is a miss and writes are skipped, so
+callers simply compute the value each time. Cache errors are logged and
+treated as misses; they never fail the request.
+"""
+from typing import Any, Optional
+import logging
+
+import orjson
+
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+async def cache_get_json(key: str) -> Optional[Any]:
+    """
+    Read a cached JSON value.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Decoded value, or None on a miss (or when Redis is not configured)
+    """
+    redis = get_redis()
+    if redis is None:
+        return None
+
+    try:
+        cached = await redis.get(key)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+    return orjson.loads(cached) if cached is not None else None
+
+
+async def cache_set_json(key: str, value: Any, ttl_seconds: int) -> None:
+    """
+    Store a JSON-serializable value with an expiry.
+
+    Args:
+        key: Cache key
+        value: Value to store
+        ttl_seconds: Time to live in seconds
+    """
+    redis = get_redis()
+    if redis is None:
+        return
+
+    try:
+        await redis.set(key, orjson.dumps(value), ex=ttl_seconds)
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+async def cache_delete(*keys: str) -> None:
+    """
+    Drop cached values.
+
+    Args:
+        keys: Cache keys to delete
+    """
+    redis = get_redis()
+    if redis is None or not keys:
+        return
+
+    try:
+        await redis.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Cache delete failed for {keys}: {e}")
@@ -0,0 +1,49 @@
+"""
+Celery application for background work that should not block HTTP requests.
+
+Used for outbound email, routed to the dedicated "email_queue", and for
+scheduled database maintenance on "maintenance_queue". Run workers and the
+scheduler with:
+
+    celery -A app.core.celery_app worker -Q email_queue --concurrency 4
+    celery -A app.core.celery_app worker -Q maintenance_queue --concurrency 1
+    celery -A app.core.celery_app beat
+"""
+from celery import Celery
+from celery.schedules import crontab
+
+from app.core.config import settings
+
+EMAIL_QUEUE = "email_queue"
+MAINTENANCE_QUEUE = "maintenance_queue"
+
+celery_app = Celery(
+    "fintrack",
+    broker=settings.CELERY_BROKER_URL,
+    include=["app.core.tasks", "app.core.api_usage_partitions"],
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    task_ignore_result=True,
+    # Acknowledge after the task finishes so throttled or interrupted sends
+    # are redelivered instead of lost
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    task_default_retry_delay=10,
+    task_routes={
+        "app.core.tasks.send_email_task": {"queue": EMAIL_QUEUE},
+        "app.core.api_usage_partitions.maintain_api_usage_partitions_task": {
+            "queue": MAINTENANCE_QUEUE
+        },
+    },
+    beat_schedule={
+        # Partitions are created two months ahead, so a daily run leaves
+        # plenty of slack for missed runs
+        "maintain-api-usage-partitions": {
+            "task": "app.core.api_usage_partitions.maintain_api_usage_partitions_task",
+            "schedule": crontab(hour=3, minute=15),
+        },
+    },
+)
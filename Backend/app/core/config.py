@@ -1,6 +1,6 @@
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import field_validator
-from typing import List, Union
+from typing import FrozenSet, List, Union
 import json
 
 
@@ -14,6 +14,14 @@ class Settings(BaseSettings):
 
     # Database Configuration
     DATABASE_URL: str
+    # Connection pool, per worker process: size x workers (plus overflow)
+    # must stay under the server's max_connections. Behind pgbouncer in
+    # transaction mode, keep the pool small and let pgbouncer multiplex.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    # Connections older than this are replaced, before idle timeouts on
+    # load balancers/proxies can silently drop them
+    DB_POOL_RECYCLE_SECONDS: int = 1800
 
     # JWT Configuration
     JWT_SECRET_KEY: str
@@ -23,6 +31,9 @@ class Settings(BaseSettings):
 
     # Security
     BCRYPT_COST_FACTOR: int = 12
+    # When set, argon2 time_cost is calibrated at startup to the largest value
+    # whose hash takes at most this many milliseconds on the current host
+    PASSWORD_HASH_TARGET_MS: int | None = None
 
     # Application Configuration
     PROJECT_NAME: str = "FinTrack"
@@ -47,18 +58,29 @@ class Settings(BaseSettings):
         "http://localhost:8000",
     ]
 
-    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
-    @classmethod
-    def parse_cors_origins(cls, v: Union[str, List[str]]) -> List[str]:
-        """Parse CORS origins from JSON string or return list as-is."""
-        if isinstance(v, str):
+    @cached_property
+    def cors_origins(self) -> FrozenSet[str]:
+        """
+        Parsed CORS origins, computed once on first access.
+
+        BACKEND_CORS_ORIGINS may arrive from the environment as a JSON array
+        string, a single origin string, or the default list. Returned as a
+        frozenset so the CORS middleware's per-request origin check is a
+        hash lookup rather than a list scan.
+        """
+        value = self.BACKEND_CORS_ORIGINS
+        if isinstance(value, str):
             try:
                 # Try to parse as JSON array string
-                return json.loads(v)
+                return frozenset(json.loads(value))
             except json.JSONDecodeError:
-                # If it's a single origin string, wrap it in a list
-                return [v]
-        return v
+                # If it's a single origin string, wrap it in a set
+                return frozenset([value])
+        return frozenset(value)
+
+    # Repository read paths raise on lazy relationship loads (hidden N+1s);
+    # when disabled, lazy loads are allowed and logged as warnings instead
+    ORM_RAISE_ON_LAZY_LOAD: bool = True
 
     # Account Security
     MAX_LOGIN_ATTEMPTS: int = 5
@@ -76,6 +98,22 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: str | None = None
     GEMINI_MODEL: str = "gemini-2.5-flash"
 
+    # Redis Configuration (optional)
+    # When unset, WebSocket notifications are delivered in-process only,
+    # which is correct for a single Uvicorn worker.
+    REDIS_URL: str | None = None
+
+    # Celery Configuration (optional)
+    # When unset, emails are sent inline instead of on the email_queue worker.
+    CELERY_BROKER_URL: str | None = None
+    # Per-worker cap on emails sent per second (match the ZeptoMail account quota)
+    EMAIL_MAX_SEND_RATE: int = 14
+
+    # API Usage Retention (optional)
+    # Monthly api_usage partitions older than this many months are dropped;
+    # daily totals survive in the api_usage_daily rollup. Unset keeps everything.
+    API_USAGE_RETENTION_MONTHS: int | None = None
+
     # Document Processing Configuration
     MAX_DOCUMENT_SIZE_MB: int = 10
     DOCUMENT_PROCESSING_TIMEOUT_SECONDS: int = 45
@@ -88,5 +126,16 @@ class Settings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings instance.
+
+    The instance is built (and .env parsed) only once; subsequent calls
+    return the cached object.
+    """
+    return Settings()
+
+
 # Create global settings instance
-settings = Settings()
+settings = get_settings()
@@ -5,12 +5,104 @@ This module handles sending verification emails, password resets,
 and other transactional emails using ZeptoMail API.
 """
 import secrets
+import ssl
+import certifi
 import httpx
+import orjson
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Optional
 
+import jinja2
+from fastapi import BackgroundTasks
+
 from app.core.config import settings
 
+# Email templates are compiled once at import. HTML templates are autoescaped
+# so user-provided values (e.g. first_name) cannot inject markup.
+_TEMPLATE_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(Path(__file__).resolve().parent.parent / "templates" / "email"),
+    autoescape=jinja2.select_autoescape(["html"]),
+    auto_reload=False,
+)
+_VERIFY_HTML = _TEMPLATE_ENV.get_template("verify.html")
+_VERIFY_TXT = _TEMPLATE_ENV.get_template("verify.txt")
+_RESET_HTML = _TEMPLATE_ENV.get_template("reset.html")
+_RESET_TXT = _TEMPLATE_ENV.get_template("reset.txt")
+_DOCUMENT_PROCESSED_HTML = _TEMPLATE_ENV.get_template("document_processed.html")
+_DOCUMENT_PROCESSED_TXT = _TEMPLATE_ENV.get_template("document_processed.txt")
+
+# Parts of every ZeptoMail request that never change between sends
+_ZEPTOMAIL_HEADERS = {
+    "accept": "application/json",
+    "content-type": "application/json",
+    "authorization": settings.ZEPTOMAIL_API_KEY
+}
+_ZEPTOMAIL_FROM = {
+    "address": settings.FROM_EMAIL,
+    "name": "FinTrack"
+}
+
+# One TLS context shared by both ZeptoMail clients: the CA bundle is loaded
+# once, and only TLS 1.2+ is negotiated
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+_SSL_CONTEXT.minimum_version = ssl.TLSVersion.TLSv1_2
+
+# Shared ZeptoMail HTTP clients, created on first send. Reusing them keeps TLS
+# connections alive between emails instead of dialing a new one per message.
+# The sync client is used by Celery workers, the async one by the API process.
+_http_client: Optional[httpx.Client] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the shared ZeptoMail HTTP client, creating it on first use."""
+    global _http_client
+
+    if _http_client is None:
+        _http_client = httpx.Client(
+            verify=_SSL_CONTEXT,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=5,
+                max_keepalive_connections=5,
+                keepalive_expiry=100.0
+            )
+        )
+
+    return _http_client
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """Return the shared async ZeptoMail HTTP client, creating it on first use."""
+    global _async_http_client
+
+    if _async_http_client is None:
+        _async_http_client = httpx.AsyncClient(
+            verify=_SSL_CONTEXT,
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=10
+            )
+        )
+
+    return _async_http_client
+
+
+async def close_http_clients() -> None:
+    """Close the shared ZeptoMail HTTP clients (called on application shutdown)."""
+    global _http_client, _async_http_client
+
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+        _async_http_client = None
+
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
+
 
 class EmailService:
     """Service for sending emails via Zoho ZeptoMail API."""
@@ -36,15 +128,15 @@ class EmailService:
         return datetime.utcnow() + timedelta(hours=24)
 
     @staticmethod
-    def send_email(
+    def _build_request(
         to_email: str,
         subject: str,
         html_body: str,
         text_body: Optional[str] = None,
         to_name: Optional[str] = None
-    ) -> bool:
+    ) -> tuple[dict, dict]:
         """
-        Send an email via ZeptoMail API.
+        Build the ZeptoMail API payload and headers for an email.
 
         Args:
             to_email: Recipient email address
@@ -54,7 +146,7 @@ class EmailService:
             to_name: Recipient name (optional)
 
         Returns:
-            bool: True if sent successfully, False otherwise
+            Tuple of (payload, headers)
 
         Raises:
             Exception: If ZeptoMail configuration is missing
@@ -66,50 +158,113 @@ class EmailService:
         ]):
             raise Exception("ZeptoMail configuration is incomplete. Check environment variables.")
 
-        try:
-            # Prepare the request payload
-            payload = {
-                "from": {
-                    "address": settings.FROM_EMAIL,
-                    "name": "FinTrack"
-                },
-                "to": [
-                    {
-                        "email_address": {
-                            "address": to_email,
-                            "name": to_name or to_email
-                        }
+        # Prepare the request payload; sender and headers are prebuilt
+        payload = {
+            "from": _ZEPTOMAIL_FROM,
+            "to": [
+                {
+                    "email_address": {
+                        "address": to_email,
+                        "name": to_name or to_email
                     }
-                ],
-                "subject": subject,
-                "htmlbody": html_body
-            }
-
-            # Add text body if provided
-            if text_body:
-                payload["textbody"] = text_body
-
-            # Set up headers
-            headers = {
-                "accept": "application/json",
-                "content-type": "application/json",
-                "authorization": settings.ZEPTOMAIL_API_KEY
-            }
-
-            # Send the email via ZeptoMail API
-            with httpx.Client(timeout=30.0) as client:
-                response = client.post(
-                    settings.ZEPTOMAIL_API_URL,
-                    json=payload,
-                    headers=headers
-                )
-
-                # Check if successful (2xx status code)
-                if response.status_code in range(200, 300):
-                    return True
-                else:
-                    print(f"ZeptoMail API error: {response.status_code} - {response.text}")
-                    return False
+                }
+            ],
+            "subject": subject,
+            "htmlbody": html_body
+        }
+
+        # Add text body if provided
+        if text_body:
+            payload["textbody"] = text_body
+
+        return payload, _ZEPTOMAIL_HEADERS
+
+    @staticmethod
+    def _check_response(response: httpx.Response) -> bool:
+        """Return True for a 2xx ZeptoMail response, logging anything else."""
+        if response.status_code in range(200, 300):
+            return True
+
+        print(f"ZeptoMail API error: {response.status_code} - {response.text}")
+        return False
+
+    @staticmethod
+    def send_email(
+        to_email: str,
+        subject: str,
+        html_body: str,
+        text_body: Optional[str] = None,
+        to_name: Optional[str] = None
+    ) -> bool:
+        """
+        Send an email via ZeptoMail API (blocking; used by Celery workers).
+
+        Args:
+            to_email: Recipient email address
+            subject: Email subject line
+            html_body: HTML email content
+            text_body: Plain text fallback (optional)
+            to_name: Recipient name (optional)
+
+        Returns:
+            bool: True if sent successfully, False otherwise
+
+        Raises:
+            Exception: If ZeptoMail configuration is missing
+        """
+        payload, headers = EmailService._build_request(
+            to_email, subject, html_body, text_body, to_name
+        )
+
+        try:
+            # Send the email via ZeptoMail API over the pooled client
+            response = _get_http_client().post(
+                settings.ZEPTOMAIL_API_URL,
+                content=orjson.dumps(payload),
+                headers=headers
+            )
+            return EmailService._check_response(response)
+
+        except Exception as e:
+            # Log error (in production, use proper logging)
+            print(f"Failed to send email to {to_email}: {str(e)}")
+            return False
+
+    @staticmethod
+    async def send_email_async(
+        to_email: str,
+        subject: str,
+        html_body: str,
+        text_body: Optional[str] = None,
+        to_name: Optional[str] = None
+    ) -> bool:
+        """
+        Send an email via ZeptoMail API without blocking the event loop.
+
+        Args:
+            to_email: Recipient email address
+            subject: Email subject line
+            html_body: HTML email content
+            text_body: Plain text fallback (optional)
+            to_name: Recipient name (optional)
+
+        Returns:
+            bool: True if sent successfully, False otherwise
+
+        Raises:
+            Exception: If ZeptoMail configuration is missing
+        """
+        payload, headers = EmailService._build_request(
+            to_email, subject, html_body, text_body, to_name
+        )
+
+        try:
+            response = await _get_async_http_client().post(
+                settings.ZEPTOMAIL_API_URL,
+                content=orjson.dumps(payload),
+                headers=headers
+            )
+            return EmailService._check_response(response)
 
         except Exception as e:
             # Log error (in production, use proper logging)
@@ -117,11 +272,69 @@ class EmailService:
             return False
 
     @staticmethod
-    def send_verification_email(
+    async def deliver(
+        to_email: str,
+        subject: str,
+        html_body: str,
+        text_body: Optional[str] = None,
+        to_name: Optional[str] = None,
+        background_tasks: Optional[BackgroundTasks] = None,
+        dedup_key: Optional[str] = None
+    ) -> bool:
+        """
+        Hand an email off for delivery.
+
+        With a Celery broker configured, the email is queued on email_queue
+        and sent by a worker. Otherwise it is sent from this process: after
+        the response when background_tasks is given, or awaited directly.
+
+        Args:
+            to_email: Recipient email address
+            subject: Email subject line
+            html_body: HTML email content
+            text_body: Plain text fallback (optional)
+            to_name: Recipient name (optional)
+            background_tasks: Request background tasks to send after responding (optional)
+            dedup_key: Idempotency key so the worker sends this email only once (optional)
+
+        Returns:
+            bool: True if queued, scheduled or sent successfully
+        """
+        email = {
+            "to_email": to_email,
+            "subject": subject,
+            "html_body": html_body,
+            "text_body": text_body,
+            "to_name": to_name,
+        }
+
+        if not settings.CELERY_BROKER_URL:
+            if background_tasks is not None:
+                background_tasks.add_task(EmailService.send_email_async, **email)
+                return True
+            return await EmailService.send_email_async(**email)
+
+        # Imported here because the tasks module imports EmailService
+        from app.core.celery_app import EMAIL_QUEUE
+        from app.core.tasks import send_email_task
+
+        try:
+            send_email_task.apply_async(
+                kwargs={**email, "dedup_key": dedup_key},
+                queue=EMAIL_QUEUE
+            )
+            return True
+        except Exception as e:
+            print(f"Failed to enqueue email to {to_email}: {str(e)}")
+            return False
+
+    @staticmethod
+    async def send_verification_email(
         to_email: str,
         first_name: str,
         verification_token: str,
-        frontend_url: str
+        frontend_url: str,
+        background_tasks: Optional[BackgroundTasks] = None
     ) -> bool:
         """
         Send email verification link to user.
@@ -131,6 +344,7 @@ class EmailService:
             first_name: User's first name for personalization
             verification_token: Unique verification token
             frontend_url: Frontend base URL (e.g., https://fintracker.cc)
+            background_tasks: Request background tasks to send after responding (optional)
 
         Returns:
             bool: True if sent successfully
@@ -139,103 +353,31 @@ class EmailService:
 
         subject = "Verify your FinTrack account"
 
-        html_body = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-</head>
-<body style="margin: 0; padding: 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; background-color: #f5f5f5;">
-    <table role="presentation" style="width: 100%; border-collapse: collapse;">
-        <tr>
-            <td align="center" style="padding: 40px 0;">
-                <table role="presentation" style="width: 600px; border-collapse: collapse; background-color: #ffffff; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                    <!-- Header -->
-                    <tr>
-                        <td style="padding: 40px 40px 20px 40px; text-align: center;">
-                            <h1 style="margin: 0; font-size: 24px; font-weight: 600; color: #1a1a1a;">Welcome to FinTrack!</h1>
-                        </td>
-                    </tr>
-
-                    <!-- Body -->
-                    <tr>
-                        <td style="padding: 0 40px 40px 40px;">
-                            <p style="margin: 0 0 16px 0; font-size: 16px; line-height: 24px; color: #4a4a4a;">
-                                Hi {first_name},
-                            </p>
-                            <p style="margin: 0 0 24px 0; font-size: 16px; line-height: 24px; color: #4a4a4a;">
-                                Thank you for signing up! Please verify your email address by clicking the button below:
-                            </p>
-
-                            <!-- CTA Button -->
-                            <table role="presentation" style="width: 100%; border-collapse: collapse;">
-                                <tr>
-                                    <td align="center" style="padding: 20px 0;">
-                                        <a href="{verification_link}" style="display: inline-block; padding: 14px 32px; background-color: #2563eb; color: #ffffff; text-decoration: none; border-radius: 6px; font-weight: 500; font-size: 16px;">Verify Email Address</a>
-                                    </td>
-                                </tr>
-                            </table>
-
-                            <p style="margin: 24px 0 0 0; font-size: 14px; line-height: 20px; color: #6b7280;">
-                                Or copy and paste this link into your browser:
-                            </p>
-                            <p style="margin: 8px 0 0 0; font-size: 14px; line-height: 20px; color: #2563eb; word-break: break-all;">
-                                {verification_link}
-                            </p>
-
-                            <p style="margin: 24px 0 0 0; font-size: 14px; line-height: 20px; color: #6b7280;">
-                                This link will expire in 24 hours. If you didn't create a FinTrack account, you can safely ignore this email.
-                            </p>
-                        </td>
-                    </tr>
-
-                    <!-- Footer -->
-                    <tr>
-                        <td style="padding: 20px 40px; background-color: #f9fafb; border-top: 1px solid #e5e7eb; border-radius: 0 0 8px 8px;">
-                            <p style="margin: 0; font-size: 12px; line-height: 18px; color: #9ca3af; text-align: center;">
-                                &copy; {datetime.utcnow().year} FinTrack. All rights reserved.<br>
-                                You're receiving this email because you signed up for FinTrack.
-                            </p>
-                        </td>
-                    </tr>
-                </table>
-            </td>
-        </tr>
-    </table>
-</body>
-</html>
-"""
-
-        text_body = f"""
-Welcome to FinTrack!
-
-Hi {first_name},
-
-Thank you for signing up! Please verify your email address by clicking the link below:
-
-{verification_link}
-
-This link will expire in 24 hours. If you didn't create a FinTrack account, you can safely ignore this email.
-
----
-© {datetime.utcnow().year} FinTrack. All rights reserved.
-"""
+        context = {
+            "first_name": first_name,
+            "verification_link": verification_link,
+            "year": datetime.utcnow().year,
+        }
+        html_body = _VERIFY_HTML.render(context)
+        text_body = _VERIFY_TXT.render(context)
 
-        return EmailService.send_email(
+        return await EmailService.deliver(
             to_email=to_email,
             subject=subject,
             html_body=html_body,
             text_body=text_body,
-            to_name=first_name
+            to_name=first_name,
+            background_tasks=background_tasks,
+            dedup_key=verification_token
         )
 
     @staticmethod
-    def send_password_reset_email(
+    async def send_password_reset_email(
         to_email: str,
         first_name: str,
         reset_token: str,
-        frontend_url: str
+        frontend_url: str,
+        background_tasks: Optional[BackgroundTasks] = None
     ) -> bool:
         """
         Send password reset link to user.
@@ -245,6 +387,7 @@ This link will expire in 24 hours. If you didn't create a FinTrack account, you
             first_name: User's first name
             reset_token: Password reset token
             frontend_url: Frontend base URL
+            background_tasks: Request background tasks to send after responding (optional)
 
         Returns:
             bool: True if sent successfully
@@ -253,94 +396,32 @@ This link will expire in 24 hours. If you didn't create a FinTrack account, you
 
         subject = "Reset your FinTrack password"
 
-        html_body = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-</head>
-<body style="margin: 0; padding: 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; background-color: #f5f5f5;">
-    <table role="presentation" style="width: 100%; border-collapse: collapse;">
-        <tr>
-            <td align="center" style="padding: 40px 0;">
-                <table role="presentation" style="width: 600px; border-collapse: collapse; background-color: #ffffff; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                    <tr>
-                        <td style="padding: 40px 40px 20px 40px; text-align: center;">
-                            <h1 style="margin: 0; font-size: 24px; font-weight: 600; color: #1a1a1a;">Reset Your Password</h1>
-                        </td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 0 40px 40px 40px;">
-                            <p style="margin: 0 0 16px 0; font-size: 16px; line-height: 24px; color: #4a4a4a;">
-                                Hi {first_name},
-                            </p>
-                            <p style="margin: 0 0 24px 0; font-size: 16px; line-height: 24px; color: #4a4a4a;">
-                                We received a request to reset your password. Click the button below to create a new password:
-                            </p>
-                            <table role="presentation" style="width: 100%; border-collapse: collapse;">
-                                <tr>
-                                    <td align="center" style="padding: 20px 0;">
-                                        <a href="{reset_link}" style="display: inline-block; padding: 14px 32px; background-color: #2563eb; color: #ffffff; text-decoration: none; border-radius: 6px; font-weight: 500; font-size: 16px;">Reset Password</a>
-                                    </td>
-                                </tr>
-                            </table>
-                            <p style="margin: 24px 0 0 0; font-size: 14px; line-height: 20px; color: #6b7280;">
-                                Or copy and paste this link into your browser:
-                            </p>
-                            <p style="margin: 8px 0 0 0; font-size: 14px; line-height: 20px; color: #2563eb; word-break: break-all;">
-                                {reset_link}
-                            </p>
-                            <p style="margin: 24px 0 0 0; font-size: 14px; line-height: 20px; color: #6b7280;">
-                                This link will expire in 1 hour. If you didn't request a password reset, you can safely ignore this email.
-                            </p>
-                        </td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 20px 40px; background-color: #f9fafb; border-top: 1px solid #e5e7eb; border-radius: 0 0 8px 8px;">
-                            <p style="margin: 0; font-size: 12px; line-height: 18px; color: #9ca3af; text-align: center;">
-                                &copy; {datetime.utcnow().year} FinTrack. All rights reserved.
-                            </p>
-                        </td>
-                    </tr>
-                </table>
-            </td>
-        </tr>
-    </table>
-</body>
-</html>
-"""
-
-        text_body = f"""
-Reset Your Password
-
-Hi {first_name},
-
-We received a request to reset your password. Click the link below to create a new password:
-
-{reset_link}
-
-This link will expire in 1 hour. If you didn't request a password reset, you can safely ignore this email.
-
----
-© {datetime.utcnow().year} FinTrack. All rights reserved.
-"""
+        context = {
+            "first_name": first_name,
+            "reset_link": reset_link,
+            "year": datetime.utcnow().year,
+        }
+        html_body = _RESET_HTML.render(context)
+        text_body = _RESET_TXT.render(context)
 
-        return EmailService.send_email(
+        return await EmailService.deliver(
             to_email=to_email,
             subject=subject,
             html_body=html_body,
             text_body=text_body,
-            to_name=first_name
+            to_name=first_name,
+            background_tasks=background_tasks,
+            dedup_key=reset_token
         )
 
     @staticmethod
-    def send_document_processed_email(
+    async def send_document_processed_email(
         to_email: str,
         first_name: str,
         document_filename: str,
         document_id: str,
-        frontend_url: str
+        frontend_url: str,
+        background_tasks: Optional[BackgroundTasks] = None
     ) -> bool:
         """
         Send notification that document processing is complete.
@@ -351,6 +432,7 @@ This link will expire in 1 hour. If you didn't request a password reset, you can
             document_filename: Name of the processed document
             document_id: Document UUID
             frontend_url: Frontend base URL
+            background_tasks: Request background tasks to send after responding (optional)
 
         Returns:
             bool: True if sent successfully
@@ -359,79 +441,20 @@ This link will expire in 1 hour. If you didn't request a password reset, you can
 
         subject = "Your bank statement is ready for review"
 
-        html_body = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-</head>
-<body style="margin: 0; padding: 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; background-color: #f5f5f5;">
-    <table role="presentation" style="width: 100%; border-collapse: collapse;">
-        <tr>
-            <td align="center" style="padding: 40px 0;">
-                <table role="presentation" style="width: 600px; border-collapse: collapse; background-color: #ffffff; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                    <tr>
-                        <td style="padding: 40px 40px 20px 40px; text-align: center;">
-                            <h1 style="margin: 0; font-size: 24px; font-weight: 600; color: #1a1a1a;">Document Processing Complete</h1>
-                        </td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 0 40px 40px 40px;">
-                            <p style="margin: 0 0 16px 0; font-size: 16px; line-height: 24px; color: #4a4a4a;">
-                                Hi {first_name},
-                            </p>
-                            <p style="margin: 0 0 24px 0; font-size: 16px; line-height: 24px; color: #4a4a4a;">
-                                Your bank statement has been processed and is ready for review.
-                            </p>
-                            <table role="presentation" style="width: 100%; border-collapse: collapse;">
-                                <tr>
-                                    <td align="center" style="padding: 20px 0;">
-                                        <a href="{review_link}" style="display: inline-block; padding: 14px 32px; background-color: #2563eb; color: #ffffff; text-decoration: none; border-radius: 6px; font-weight: 500; font-size: 16px;">Review Transactions</a>
-                                    </td>
-                                </tr>
-                            </table>
-                            <p style="margin: 24px 0 0 0; font-size: 14px; line-height: 20px; color: #6b7280;">
-                                Or copy and paste this link into your browser:
-                            </p>
-                            <p style="margin: 8px 0 0 0; font-size: 14px; line-height: 20px; color: #2563eb; word-break: break-all;">
-                                {review_link}
-                            </p>
-                        </td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 20px 40px; background-color: #f9fafb; border-top: 1px solid #e5e7eb; border-radius: 0 0 8px 8px;">
-                            <p style="margin: 0; font-size: 12px; line-height: 18px; color: #9ca3af; text-align: center;">
-                                &copy; {datetime.utcnow().year} FinTrack. All rights reserved.
-                            </p>
-                        </td>
-                    </tr>
-                </table>
-            </td>
-        </tr>
-    </table>
-</body>
-</html>
-"""
-
-        text_body = f"""
-Document Processing Complete
-
-Hi {first_name},
-
-Your bank statement has been processed and is ready for review.
-
-Review your transactions here:
-{review_link}
-
----
-© {datetime.utcnow().year} FinTrack. All rights reserved.
-"""
+        context = {
+            "first_name": first_name,
+            "review_link": review_link,
+            "year": datetime.utcnow().year,
+        }
+        html_body = _DOCUMENT_PROCESSED_HTML.render(context)
+        text_body = _DOCUMENT_PROCESSED_TXT.render(context)
 
-        return EmailService.send_email(
+        return await EmailService.deliver(
             to_email=to_email,
             subject=subject,
             html_body=html_body,
             text_body=text_body,
-            to_name=first_name
+            to_name=first_name,
+            background_tasks=background_tasks,
+            dedup_key=f"document-processed:{document_id}"
         )
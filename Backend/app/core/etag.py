@@ -0,0 +1,62 @@
+"""
+HTTP ETag helpers for conditional GET requests.
+
+Endpoints attach an ETag to their response and answer 304 Not Modified when
+the client's If-None-Match already matches, skipping body serialization.
+"""
+import hashlib
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """
+    Build a strong ETag from the given parts.
+
+    Args:
+        *parts: Values identifying the representation (e.g. id and updated_at)
+
+    Returns:
+        Quoted ETag string
+    """
+    digest = hashlib.blake2b(
+        ":".join(str(part) for part in parts).encode(),
+        digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Response | None:
+    """
+    Check If-None-Match against an ETag.
+
+    Sets the ETag (and a revalidation Cache-Control) on the outgoing response.
+    If the client already has this representation, returns a 304 response
+    the endpoint should return as-is. Tags are compared weakly, as RFC 7232
+    requires for If-None-Match, so a W/ tag (e.g. after a proxy re-encoded
+    the response) still matches.
+
+    Args:
+        request: Incoming request
+        response: Response the endpoint will return on a miss
+        etag: Current ETag of the resource
+
+    Returns:
+        304 response if the client's copy is current, otherwise None
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {_opaque_tag(tag) for tag in if_none_match.split(",")}
+        if _opaque_tag(etag) in tags or "*" in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
+
+def _opaque_tag(tag: str) -> str:
+    """Strip whitespace and any weak W/ prefix from an entity tag."""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
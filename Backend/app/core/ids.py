@@ -0,0 +1,33 @@
+"""
+Time-ordered UUID generation for primary keys.
+
+Random (v4) UUID keys land on a random leaf of the primary key B-tree, so
+every insert touches a different page. UUIDv7 (RFC 9562) starts with a
+millisecond Unix timestamp, so new keys sort after existing ones and inserts
+append to the right-hand edge of the index, while staying globally unique.
+"""
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a version 7 UUID.
+
+    Layout: 48-bit millisecond timestamp, 4-bit version, 12 random bits,
+    2-bit variant, 62 random bits.
+
+    Returns:
+        New time-ordered UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10))
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= (rand >> 62 & 0xFFF) << 64
+    value |= 0b10 << 62
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF
+
+    return uuid.UUID(int=value)
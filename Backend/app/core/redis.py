@@ -0,0 +1,60 @@
+"""
+Shared Redis client.
+
+Redis is optional: when REDIS_URL is not configured, get_redis() returns None
+and callers fall back to their in-process behaviour.
+"""
+from typing import Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+_redis: Optional[aioredis.Redis] = None
+_sync_redis: Optional[redis.Redis] = None
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """
+    Return the process-wide async Redis client, creating it on first use.
+
+    Returns:
+        Redis client, or None if REDIS_URL is not configured
+    """
+    global _redis
+
+    if not settings.REDIS_URL:
+        return None
+
+    if _redis is None:
+        _redis = aioredis.from_url(settings.REDIS_URL)
+
+    return _redis
+
+
+def get_sync_redis() -> Optional[redis.Redis]:
+    """
+    Return the process-wide blocking Redis client (for Celery workers).
+
+    Returns:
+        Redis client, or None if REDIS_URL is not configured
+    """
+    global _sync_redis
+
+    if not settings.REDIS_URL:
+        return None
+
+    if _sync_redis is None:
+        _sync_redis = redis.Redis.from_url(settings.REDIS_URL)
+
+    return _sync_redis
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client (called on application shutdown)."""
+    global _redis
+
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
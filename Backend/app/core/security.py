@@ -1,40 +1,77 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+import asyncio
+import hashlib
+import os
+import statistics
+import time
 import bcrypt
-from jose import JWTError, jwt
+import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from jwt import InvalidTokenError as JWTError
 
 from app.core.config import settings
 
+# Accepted signing algorithms, built once rather than per decode
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
+# Single argon2id hasher shared by all calls; parameters are parsed once.
+# time_cost may be replaced at startup by calibrate_password_hasher().
+_ARGON2_MEMORY_COST = 65536
+_ARGON2_PARALLELISM = 2
+_ARGON2_TIME_COSTS = range(1, 7)
+_password_hasher = PasswordHasher(
+    time_cost=2,
+    memory_cost=_ARGON2_MEMORY_COST,
+    parallelism=_ARGON2_PARALLELISM
+)
+
+# Prefixes identifying hashes created before the argon2id migration
+_BCRYPT_PREFIXES = ("$2b$", "$2a$", "$2y$")
+
+# Dedicated pool for password hashing. argon2 and bcrypt release the GIL
+# while hashing, so concurrent logins run in parallel across cores instead
+# of blocking the event loop.
+_password_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count(),
+    thread_name_prefix="password-hash"
+)
+
+# Verified token payloads keyed by a keyed hash of the token (the raw token
+# is never stored), evicted LRU or once the token expires
+_TOKEN_CACHE_MAX_SIZE = 4096
+_TOKEN_CACHE_KEY = hashlib.sha256(settings.JWT_SECRET_KEY.encode()).digest()
+_token_cache: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using argon2id.
 
     Args:
         password: Plain text password
 
     Returns:
-        Hashed password string
+        Hashed password string (PHC format, e.g. "$argon2id$v=19$...")
 
     Note:
         This is a one-way hash. The original password cannot be recovered.
         Each hash includes a unique salt automatically.
     """
-    # Encode password to bytes
-    password_bytes = password.encode('utf-8')
-
-    # Generate salt and hash password
-    salt = bcrypt.gensalt(rounds=settings.BCRYPT_COST_FACTOR)
-    hashed = bcrypt.hashpw(password_bytes, salt)
-
-    # Return as string
-    return hashed.decode('utf-8')
+    return _password_hasher.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against a hash.
 
+    Hashes created before the argon2id migration are bcrypt ("$2b$...")
+    and are still verified with bcrypt; use password_needs_rehash() after
+    a successful verify to upgrade them.
+
     Args:
         plain_password: Plain text password to verify
         hashed_password: Hashed password from database
@@ -42,12 +79,112 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    # Encode to bytes
-    password_bytes = plain_password.encode('utf-8')
-    hashed_bytes = hashed_password.encode('utf-8')
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return bcrypt.checkpw(
+            plain_password.encode('utf-8'),
+            hashed_password.encode('utf-8')
+        )
+
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced with a fresh argon2id hash.
 
-    # Verify
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    True for legacy bcrypt hashes and for argon2 hashes created with
+    parameters other than the current ones.
+
+    Args:
+        hashed_password: Hashed password from database
+
+    Returns:
+        True if the password should be rehashed on next successful login
+    """
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
+
+    try:
+        return _password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
+
+
+def calibrate_password_hasher(target_ms: int) -> int:
+    """
+    Pick the argon2 time_cost that fits a per-hash latency budget.
+
+    Each candidate time_cost is timed three times on this host and the
+    largest one whose median stays within target_ms becomes the cost for
+    new hashes. Existing hashes with a different cost keep verifying and
+    are upgraded on next login via password_needs_rehash().
+
+    Args:
+        target_ms: Latency budget for a single hash in milliseconds
+
+    Returns:
+        The selected time_cost
+    """
+    global _password_hasher
+
+    selected = _ARGON2_TIME_COSTS[0]
+    for time_cost in _ARGON2_TIME_COSTS:
+        hasher = PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=_ARGON2_MEMORY_COST,
+            parallelism=_ARGON2_PARALLELISM
+        )
+
+        samples = []
+        for _ in range(3):
+            started = time.perf_counter()
+            hasher.hash("x" * 16)
+            samples.append((time.perf_counter() - started) * 1000)
+
+        if statistics.median(samples) > target_ms:
+            break
+        selected = time_cost
+
+    _password_hasher = PasswordHasher(
+        time_cost=selected,
+        memory_cost=_ARGON2_MEMORY_COST,
+        parallelism=_ARGON2_PARALLELISM
+    )
+    return selected
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password on the password hashing thread pool.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Hashed password string
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_pool, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the password hashing thread pool.
+
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password from database
+
+    Returns:
+        True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_pool, verify_password, plain_password, hashed_password
+    )
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -127,6 +264,10 @@ def decode_token(token: str) -> Dict[str, Any]:
     """
     Decode and verify a JWT token.
 
+    The same access token is presented on every request during its
+    lifetime, so verified payloads are cached until the token's expiry;
+    repeat decodes are a dictionary lookup instead of HMAC + JSON work.
+
     Args:
         token: JWT token string
 
@@ -136,11 +277,28 @@ def decode_token(token: str) -> Dict[str, Any]:
     Raises:
         JWTError: If token is invalid, expired, or malformed
     """
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16, key=_TOKEN_CACHE_KEY).digest()
+
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        payload, expires_at = cached
+        if expires_at > time.time():
+            _token_cache.move_to_end(cache_key)
+            return payload
+        del _token_cache[cache_key]
+
     payload = jwt.decode(
         token,
         settings.JWT_SECRET_KEY,
-        algorithms=[settings.JWT_ALGORITHM]
+        algorithms=_JWT_ALGORITHMS
     )
+
+    expires_at = payload.get("exp")
+    if expires_at is not None:
+        _token_cache[cache_key] = (payload, float(expires_at))
+        if len(_token_cache) > _TOKEN_CACHE_MAX_SIZE:
+            _token_cache.popitem(last=False)
+
     return payload
 
 
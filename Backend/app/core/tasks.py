@@ -0,0 +1,110 @@
+"""
+Celery tasks.
+
+Email delivery runs here so request handlers only pay for enqueueing the
+message instead of the ZeptoMail round trip.
+"""
+import hashlib
+from typing import Optional
+
+from app.core.celery_app import celery_app, EMAIL_QUEUE
+from app.core.config import settings
+from app.core.email import EmailService
+from app.core.redis import get_sync_redis
+
+# How long a sent email's idempotency key is remembered. Besides duplicate
+# enqueues (double clicks) it has to outlive Celery's redelivery of a task
+# whose worker died after the send: with task_acks_late on a Redis broker
+# that happens only after the visibility timeout (1 hour by default)
+EMAIL_DEDUP_TTL_SECONDS = 24 * 60 * 60
+# How long a send in progress blocks duplicates of the same email; long
+# enough to cover a ZeptoMail request, short enough that a worker dying
+# mid-send only delays the redelivered task
+EMAIL_IN_FLIGHT_TTL_SECONDS = 30
+
+
+class EmailDeliveryError(Exception):
+    """Raised when an email could not be handed to ZeptoMail (triggers a retry)."""
+
+
+@celery_app.task(
+    bind=True,
+    rate_limit=f"{settings.EMAIL_MAX_SEND_RATE}/s",
+    # EmailService.send_email reports every failure (HTTP errors included)
+    # as False, which is raised as EmailDeliveryError
+    autoretry_for=(EmailDeliveryError,),
+    retry_backoff=True,
+    retry_backoff_max=60,
+    retry_jitter=True,
+    max_retries=5,
+    queue=EMAIL_QUEUE,
+)
+def send_email_task(
+    self,
+    to_email: str,
+    subject: str,
+    html_body: str,
+    text_body: Optional[str] = None,
+    to_name: Optional[str] = None,
+    dedup_key: Optional[str] = None
+) -> bool:
+    """
+    Send an email via ZeptoMail from a worker.
+
+    When dedup_key is given (e.g. the verification token) and Redis is
+    configured, a second delivery of the same email within
+    EMAIL_DEDUP_TTL_SECONDS (a day) is skipped. This covers duplicate
+    enqueues and Celery's at-least-once redelivery, which on a Redis broker
+    only happens once the broker's visibility timeout has passed.
+
+    The "sent" key is only written after ZeptoMail accepted the email.
+    While a send is in progress a short-lived "in flight" marker holds off
+    duplicates (they retry later); if the worker dies mid-send the marker
+    expires, so the redelivered task still sends the email.
+
+    Args:
+        to_email: Recipient email address
+        subject: Email subject line
+        html_body: HTML email content
+        text_body: Plain text fallback (optional)
+        to_name: Recipient name (optional)
+        dedup_key: Idempotency key for this email (optional)
+
+    Returns:
+        bool: True once the email has been accepted (or was already sent)
+
+    Raises:
+        EmailDeliveryError: If sending failed (the task is retried with backoff)
+    """
+    redis = get_sync_redis() if dedup_key else None
+    sent_key = in_flight_key = None
+    if redis is not None:
+        digest = hashlib.sha256(f"{to_email}:{dedup_key}".encode()).hexdigest()
+        sent_key = f"email:sent:{digest}"
+        in_flight_key = f"email:sending:{digest}"
+
+        if redis.exists(sent_key):
+            return True
+        if not redis.set(in_flight_key, "1", nx=True, ex=EMAIL_IN_FLIGHT_TTL_SECONDS):
+            # Another worker is sending this email right now; check again
+            # after it finished (or its marker expired)
+            raise EmailDeliveryError(f"Email to {to_email} is already being sent")
+
+    try:
+        sent = EmailService.send_email(
+            to_email=to_email,
+            subject=subject,
+            html_body=html_body,
+            text_body=text_body,
+            to_name=to_name
+        )
+        if not sent:
+            raise EmailDeliveryError(f"Failed to send email to {to_email}")
+
+        if sent_key is not None:
+            redis.set(sent_key, "1", ex=EMAIL_DEDUP_TTL_SECONDS)
+    finally:
+        if in_flight_key is not None:
+            redis.delete(in_flight_key)
+
+    return True
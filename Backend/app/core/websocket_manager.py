@@ -3,97 +3,138 @@ WebSocket connection manager for real-time notifications.
 
 Manages WebSocket connections per user and broadcasts notifications
 when events occur (e.g., document processing complete).
+
+Each worker process only holds the sockets that connected to it. When Redis
+is configured, notifications are published to Redis channels and every worker
+delivers them to its own local sockets, so a message produced in one worker
+reaches a user connected to another. Without Redis, messages are delivered
+in-process (single worker deployments).
 """
-from typing import Dict, Set
-from uuid import UUID
-from fastapi import WebSocket
+from collections import defaultdict
+from typing import Coroutine, Dict, List, Optional, Set
+from fastapi import WebSocket, status
+import asyncio
 import logging
 
+import orjson
+
+from app.core.redis import get_redis
+
 logger = logging.getLogger(__name__)
 
+# Redis channel names
+USER_CHANNEL_PREFIX = "ws:user:"
+BROADCAST_CHANNEL = "ws:broadcast"
+
+# Number of connection shards (power of two so the index is a bit mask)
+SHARD_COUNT = 16
+
+# A client that can't take a frame within this long (full transport buffer)
+# is dropped instead of holding up delivery
+SEND_TIMEOUT_SECONDS = 5
+
 
 class ConnectionManager:
     """Manages WebSocket connections for real-time notifications."""
 
     def __init__(self):
-        # Map user_id to set of WebSocket connections
-        # A user can have multiple connections (multiple tabs/devices)
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # Map user_id to list of WebSocket connections, split across shards
+        # so broadcasts walk many small dicts instead of one large one.
+        # A user can have multiple connections (multiple tabs/devices); the
+        # handful per user makes a list cheaper to iterate than a set
+        self._shards: List[Dict[str, List[WebSocket]]] = [
+            defaultdict(list) for _ in range(SHARD_COUNT)
+        ]
+
+        # Per-worker Redis subscription and the task reading from it
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+        # Deliveries dispatched by the listener (referenced until done)
+        self._tasks: Set[asyncio.Task] = set()
 
     async def connect(self, user_id: str, websocket: WebSocket):
         """
         Accept and store a new WebSocket connection for a user.
 
+        The first local connection for a user subscribes this worker to the
+        user's Redis channel. The subscription comes first, so a failure
+        leaves nothing accepted or registered.
+
         Args:
             user_id: User UUID as string
             websocket: WebSocket connection
         """
-        await websocket.accept()
+        if not self._shard(user_id).get(user_id):
+            await self._subscribe(USER_CHANNEL_PREFIX + user_id)
 
-        if user_id not in self.active_connections:
-            self.active_connections[user_id] = set()
+        await websocket.accept()
 
-        self.active_connections[user_id].add(websocket)
-        logger.info(f"WebSocket connected for user {user_id}. Total connections: {len(self.active_connections[user_id])}")
+        connections = self._shard(user_id)[user_id]
+        if websocket not in connections:
+            connections.append(websocket)
+        logger.info(f"WebSocket connected for user {user_id}. Total connections: {len(connections)}")
 
-    def disconnect(self, user_id: str, websocket: WebSocket):
+    async def disconnect(self, user_id: str, websocket: WebSocket):
         """
         Remove a WebSocket connection for a user.
 
+        When the user's last local connection goes away, this worker
+        unsubscribes from the user's Redis channel.
+
         Args:
             user_id: User UUID as string
             websocket: WebSocket connection to remove
         """
-        if user_id in self.active_connections:
-            self.active_connections[user_id].discard(websocket)
+        shard = self._shard(user_id)
+        if user_id in shard:
+            connections = shard[user_id]
+            if websocket in connections:
+                connections.remove(websocket)
 
             # Remove user entry if no more connections
-            if not self.active_connections[user_id]:
-                del self.active_connections[user_id]
+            if not connections:
+                del shard[user_id]
+                await self._unsubscribe(USER_CHANNEL_PREFIX + user_id)
 
-            logger.info(f"WebSocket disconnected for user {user_id}. Remaining connections: {len(self.active_connections.get(user_id, []))}")
+            logger.info(f"WebSocket disconnected for user {user_id}. Remaining connections: {len(connections)}")
 
     async def send_personal_message(self, user_id: str, message: dict):
         """
         Send a message to all connections for a specific user.
 
+        With Redis configured the message is published to the user's channel
+        and delivered by whichever workers hold the user's sockets.
+
         Args:
             user_id: User UUID as string
             message: Dictionary to send as JSON
         """
-        if user_id not in self.active_connections:
-            logger.debug(f"No active connections for user {user_id}")
-            return
+        payload = orjson.dumps(message).decode()
 
-        # Send to all user's connections (multiple tabs/devices)
-        disconnected = set()
-        for websocket in self.active_connections[user_id]:
-            try:
-                await websocket.send_json(message)
-            except Exception as e:
-                logger.error(f"Error sending message to websocket: {e}")
-                disconnected.add(websocket)
+        redis = get_redis()
+        if redis is None:
+            await self._deliver(user_id, payload)
+            return
 
-        # Clean up disconnected websockets
-        for websocket in disconnected:
-            self.disconnect(user_id, websocket)
+        await redis.publish(USER_CHANNEL_PREFIX + user_id, payload)
 
-    async def notify_document_completed(self, user_id: UUID, document_id: UUID, filename: str):
+    async def notify_document_completed(self, user_id: str, document_id: str, filename: str):
         """
         Notify user that their document processing is complete.
 
         Args:
-            user_id: User UUID
-            document_id: Document UUID
+            user_id: User UUID as string
+            document_id: Document UUID as string
             filename: Original filename
         """
         message = {
             "type": "document_completed",
-            "document_id": str(document_id),
+            "document_id": document_id,
             "filename": filename,
             "message": "Your bank statement is ready for review!"
         }
-        await self.send_personal_message(str(user_id), message)
+        await self.send_personal_message(user_id, message)
         logger.info(f"Sent document completion notification to user {user_id} for document {document_id}")
 
     async def broadcast_banner_update(self, banners: list):
@@ -106,18 +147,169 @@ class ConnectionManager:
         Args:
             banners: List of active banner dictionaries
         """
-        message = {
+        # Serialized once and sent as-is to every socket
+        payload = orjson.dumps({
             "type": "banner_update",
             "banners": banners
-        }
+        }).decode()
+
+        redis = get_redis()
+        if redis is None:
+            await self._broadcast_local(payload)
+            return
+
+        await redis.publish(BROADCAST_CHANNEL, payload)
+
+    async def close(self):
+        """Stop the Redis listener (called on application shutdown)."""
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
 
-        # Send to all connected users
-        total_sent = 0
-        for user_id in list(self.active_connections.keys()):
-            await self.send_personal_message(user_id, message)
-            total_sent += len(self.active_connections.get(user_id, set()))
+        for task in list(self._tasks):
+            task.cancel()
 
-        logger.info(f"Broadcast banner update to {len(self.active_connections)} users ({total_sent} connections)")
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+    def _shard(self, user_id: str) -> Dict[str, List[WebSocket]]:
+        """Return the shard holding a user's connections."""
+        return self._shards[hash(user_id) & (SHARD_COUNT - 1)]
+
+    def _spawn(self, coroutine: Coroutine) -> None:
+        """Run a delivery in the background, keeping a reference until it ends."""
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _deliver(self, user_id: str, payload: str):
+        """
+        Send a serialized message to this worker's connections for a user.
+
+        Args:
+            user_id: User UUID as string
+            payload: JSON-encoded message, sent as a text frame
+        """
+        shard = self._shard(user_id)
+        if user_id not in shard:
+            logger.debug(f"No active connections for user {user_id}")
+            return
+
+        # Send to all user's connections (multiple tabs/devices) concurrently;
+        # snapshot the list since it can change while sends are in flight
+        connections = list(shard[user_id])
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(websocket.send_text(payload), SEND_TIMEOUT_SECONDS)
+                for websocket in connections
+            ),
+            return_exceptions=True
+        )
+
+        # Clean up disconnected (or stalled) websockets
+        for websocket, result in zip(connections, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning(f"WebSocket for user {user_id} too slow to receive, dropping it")
+                await self.disconnect(user_id, websocket)
+                self._spawn(self._close_stalled(websocket))
+            elif isinstance(result, Exception):
+                logger.error(f"Error sending message to websocket: {result}")
+                await self.disconnect(user_id, websocket)
+
+    async def _close_stalled(self, websocket: WebSocket):
+        """Close a socket dropped for not keeping up (its endpoint then exits)."""
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=status.WS_1011_INTERNAL_ERROR),
+                SEND_TIMEOUT_SECONDS
+            )
+        except Exception:
+            pass
+
+    async def _broadcast_local(self, payload: str):
+        """
+        Send a serialized message to every connection held by this worker.
+
+        Shards and the users within them are sent to concurrently, so one
+        slow client does not hold up the rest of the broadcast.
+
+        Args:
+            payload: JSON-encoded message, sent as a text frame
+        """
+        counts = await asyncio.gather(
+            *(self._broadcast_shard(shard, payload) for shard in self._shards)
+        )
+
+        total_users = sum(users for users, _ in counts)
+        total_sent = sum(sent for _, sent in counts)
+        logger.info(f"Broadcast banner update to {total_users} users ({total_sent} connections)")
+
+    async def _broadcast_shard(self, shard: Dict[str, List[WebSocket]], payload: str):
+        """
+        Send a serialized message to every connection in one shard.
+
+        Args:
+            shard: Shard mapping user_id to connections
+            payload: JSON-encoded message, sent as a text frame
+
+        Returns:
+            Tuple of (users, connections) the message was sent to
+        """
+        user_ids = list(shard.keys())
+        await asyncio.gather(
+            *(self._deliver(user_id, payload) for user_id in user_ids),
+            return_exceptions=True
+        )
+
+        return len(user_ids), sum(len(shard.get(user_id, ())) for user_id in user_ids)
+
+    async def _subscribe(self, channel: str):
+        """Subscribe this worker to a Redis channel, starting the listener if needed."""
+        redis = get_redis()
+        if redis is None:
+            return
+
+        if self._pubsub is None:
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(BROADCAST_CHANNEL)
+            self._pubsub = pubsub
+            self._listener = asyncio.create_task(self._listen())
+
+        await self._pubsub.subscribe(channel)
+
+    async def _unsubscribe(self, channel: str):
+        """Unsubscribe this worker from a Redis channel."""
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(channel)
+
+    async def _listen(self):
+        """
+        Deliver messages published to subscribed channels to local sockets.
+
+        Each delivery runs as its own task, so a slow client never stalls
+        reading from Redis (and the subscription's output buffer on the
+        Redis side stays short).
+        """
+        while True:
+            try:
+                async for item in self._pubsub.listen():
+                    if item["type"] != "message":
+                        continue
+
+                    # Published payloads are already JSON; forward them untouched
+                    channel = item["channel"].decode()
+                    payload = item["data"].decode()
+
+                    if channel == BROADCAST_CHANNEL:
+                        self._spawn(self._broadcast_local(payload))
+                    elif channel.startswith(USER_CHANNEL_PREFIX):
+                        self._spawn(self._deliver(channel[len(USER_CHANNEL_PREFIX):], payload))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Redis pub/sub listener error: {e}")
+                await asyncio.sleep(1)
 
 
 # Global connection manager instance
@@ -1,8 +1,10 @@
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import DeclarativeBase
 
-# Declarative base for all ORM models.
-#
-# Kept separate from engine/session creation so Alembic (and model imports)
-# don't require application settings to be present.
-Base = declarative_base()
 
+class Base(DeclarativeBase):
+    """
+    Declarative base for all ORM models.
+
+    Kept separate from engine/session creation so Alembic (and model imports)
+    don't require application settings to be present.
+    """
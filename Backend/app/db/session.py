@@ -1,5 +1,9 @@
+from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, List, Optional
+import asyncio
+
+import orjson
 
 from app.core.config import settings
 from app.db.base import Base
@@ -11,8 +15,20 @@ engine = create_async_engine(
     echo=settings.DEBUG,  # Log SQL queries in debug mode
     future=True,
     pool_pre_ping=True,  # Verify connections before using
-    pool_size=10,  # Connection pool size
-    max_overflow=20,  # Max overflow connections
+    pool_size=settings.DB_POOL_SIZE,  # Connection pool size
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Max overflow connections
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,  # Replace long-lived connections
+    # Server-side TCP keepalives detect dead client connections quickly
+    connect_args={
+        "server_settings": {
+            "tcp_keepalives_idle": "30",
+            "tcp_keepalives_interval": "10",
+            "tcp_keepalives_count": "3",
+        }
+    },
+    # JSON/JSONB columns are encoded and decoded with orjson
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads,
 )
 
 # Create async session factory
@@ -46,3 +62,75 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+# Connections a request may take on top of its own session, for queries run
+# concurrently with it. Kept well below the pool size: a request holding a
+# connection never waits for a second one, so a burst of requests can't
+# each hold one connection while blocking on another until the pool times out
+_extra_connections = asyncio.Semaphore(max(1, settings.DB_POOL_SIZE // 2))
+
+
+@asynccontextmanager
+async def extra_session() -> AsyncIterator[Optional[AsyncSession]]:
+    """
+    Open a second session for a concurrent query, if one is free right now.
+
+    Yields None instead of waiting when the extra-connection budget is used
+    up; the caller then runs its query on the request's own session.
+
+    Usage:
+        async with extra_session() as session:
+            if session is None:
+                ...  # run sequentially on db
+    """
+    if _extra_connections.locked():
+        yield None
+        return
+
+    async with _extra_connections:
+        async with AsyncSessionLocal() as session:
+            yield session
+
+
+async def gather_in_sessions(
+    db: AsyncSession,
+    *operations: Callable[[AsyncSession], Awaitable[Any]]
+) -> List[Any]:
+    """
+    Run independent read-only queries concurrently where connections allow.
+
+    A single session holds one connection and can only run one statement at
+    a time, so queries that don't depend on each other run on extra pooled
+    connections and their round-trips overlap. The first query, and any
+    query that gets no extra connection, runs on the request's own session
+    one after another.
+
+    Usage:
+        stats, banners = await gather_in_sessions(
+            db,
+            AdminRepository.get_statistics,
+            SystemBannerRepository.get_active_count,
+        )
+
+    Args:
+        db: The request's database session
+        *operations: Callables taking a session and returning an awaitable
+
+    Returns:
+        Results in the same order as the operations
+    """
+    db_lock = asyncio.Lock()
+
+    async def run_on_db(operation: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        async with db_lock:
+            return await operation(db)
+
+    async def run(operation: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        async with extra_session() as session:
+            if session is not None:
+                return await operation(session)
+        return await run_on_db(operation)
+
+    first, *rest = operations
+    return list(await asyncio.gather(run_on_db(first), *(run(operation) for operation in rest)))
@@ -1,26 +1,69 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
+from app.core.api_usage_buffer import api_usage_buffer
+from app.core.api_usage_rollup import api_usage_rollup
 from app.core.config import settings
+from app.core.email import close_http_clients
+from app.core.redis import close_redis
+from app.core.security import calibrate_password_hasher
+from app.core.websocket_manager import manager
 from app.api.v1.router import api_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown hooks."""
+    # Startup: size the password hash cost to this host's CPU
+    if settings.PASSWORD_HASH_TARGET_MS:
+        await asyncio.to_thread(calibrate_password_hasher, settings.PASSWORD_HASH_TARGET_MS)
+
+    # Startup: begin batching API usage inserts and refreshing the daily rollup
+    api_usage_buffer.start()
+    api_usage_rollup.start()
+
+    yield
+
+    # Shutdown: write any API usage rows still queued
+    await api_usage_rollup.stop()
+    await api_usage_buffer.stop()
+
+    # Shutdown: stop the WebSocket pub/sub listener and release Redis
+    await manager.close()
+    await close_redis()
+
+    # Close the pooled ZeptoMail HTTP clients
+    await close_http_clients()
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,
     debug=settings.DEBUG,
     description="FinTrack Invoice and Expense Management API",
     version="1.0.5",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS
+# Configure CORS (explicit origins held in a frozenset for O(1) origin checks)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.BACKEND_CORS_ORIGINS,
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (e.g. transaction lists); small bodies and
+# WebSocket traffic pass through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 @app.get("/")
 async def root():
@@ -10,6 +10,7 @@ from app.models.document import Document, DocumentType, ProcessingStatus
 from app.models.transaction import Transaction, TransactionType, TransactionCategory
 from app.models.bank_account import BankAccount, AccountType, Currency
 from app.models.api_usage import APIUsage, APIServiceType, APIOperationType
+from app.models.api_usage_daily import APIUsageDaily
 
 __all__ = [
     "BaseModel",
@@ -31,4 +32,5 @@ __all__ = [
     "APIUsage",
     "APIServiceType",
     "APIOperationType",
+    "APIUsageDaily",
 ]
@@ -3,14 +3,13 @@ API Usage Tracking Model
 
 Tracks Gemini API usage for monitoring quotas and costs.
 """
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy import Column, Computed, Date, String, Integer, Boolean, DateTime, ForeignKey, Text, Index, text, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import deferred, relationship
 import enum
-import uuid
 
-from app.models.base import BaseModel
+from app.core.ids import uuid7
+from app.models.base import BaseModel, UTC_NOW_DEFAULT
 
 
 class APIServiceType(str, enum.Enum):
@@ -35,28 +34,26 @@ class APIUsage(BaseModel):
     """
     __tablename__ = "api_usage"
 
-    # Primary key
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    # Primary key (native 16-byte uuid; overrides BaseModel.id to skip the
+    # extra unique index, which would duplicate the primary key index)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Service information
     service = Column(
         SQLEnum(APIServiceType, values_callable=lambda x: [e.value for e in x]),
         nullable=False,
-        index=True,
         comment="API service used (e.g., Gemini)"
     )
 
     operation = Column(
         SQLEnum(APIOperationType, values_callable=lambda x: [e.value for e in x]),
         nullable=False,
-        index=True,
         comment="Type of operation performed"
     )
 
     model_name = Column(
         String(100),
         nullable=False,
-        index=True,
         comment="Model used (e.g., gemini-2.5-flash)"
     )
 
@@ -65,7 +62,6 @@ class APIUsage(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
         comment="User who made the request (NULL for system requests)"
     )
 
@@ -105,10 +101,10 @@ class APIUsage(BaseModel):
     )
 
     success = Column(
-        Integer,  # SQLite doesn't have boolean, use 0/1
+        Boolean,
         nullable=False,
-        default=1,
-        comment="Whether the request succeeded (1) or failed (0)"
+        default=True,
+        comment="Whether the request succeeded"
     )
 
     error_message = Column(
@@ -133,25 +129,67 @@ class APIUsage(BaseModel):
         comment="Related document if this was document processing"
     )
 
-    # Additional data
-    additional_data = Column(
-        Text,
+    # Additional data (deferred: not part of any usage report)
+    additional_data = deferred(Column(
+        JSONB,
         nullable=True,
-        comment="Additional metadata as JSON string"
-    )
+        comment="Additional metadata as JSON"
+    ))
 
     # Timestamps
+    # The table is partitioned by month on created_at, and Postgres requires
+    # the partition key to be part of the primary key
     created_at = Column(
         DateTime,
+        primary_key=True,
         nullable=False,
-        default=datetime.utcnow,
-        index=True,
+        server_default=UTC_NOW_DEFAULT,
         comment="When the API request was made"
     )
 
+    # Day bucket for daily reports, computed and stored by Postgres so
+    # grouping by day needs no per-row date_trunc
+    usage_day = Column(
+        Date,
+        Computed("(created_at::date)", persisted=True),
+        comment="UTC day of created_at"
+    )
+
     # Relationships
-    user = relationship("User", back_populates="api_usage", lazy="joined")
-    document = relationship("Document", back_populates="api_usage", lazy="joined")
+    # Never loaded implicitly: usage queries only need the FK columns, so
+    # callers that want the related rows must ask via selectinload()
+    user = relationship("User", back_populates="api_usage", lazy="raise")
+    document = relationship("Document", back_populates="api_usage", lazy="raise")
+
+    # Indexes
+    # Daily quota queries filter on created_at (plus user/service) and sum
+    # token counts; including the counts lets them run as index-only scans.
+    # The leading created_at column also serves plain date-range filters.
+    # Per-user token sums only count successful requests, so their covering
+    # index is partial; recent requests (any outcome) and the user_id
+    # foreign key use the plain user-first index.
+    __table_args__ = (
+        Index(
+            "idx_api_usage_daily_user",
+            "created_at",
+            "user_id",
+            "service",
+            postgresql_include=["input_tokens", "output_tokens", "total_tokens"],
+        ),
+        Index(
+            "idx_api_usage_success_partial",
+            "user_id",
+            "created_at",
+            postgresql_include=["input_tokens", "output_tokens", "total_tokens"],
+            postgresql_where=text("success"),
+        ),
+        Index("idx_api_usage_user_date", "user_id", "created_at"),
+        Index("idx_api_usage_day", "usage_day"),
+        # Monthly partitions (api_usage_YYYY_MM) are created ahead of time by
+        # app.core.api_usage_partitions (run at startup and hourly); date-range
+        # queries only scan the months they touch
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     def __repr__(self):
         return f"<APIUsage(id={self.id}, service={self.service}, model={self.model_name}, tokens={self.total_tokens})>"
@@ -0,0 +1,28 @@
+"""
+Daily API Usage Rollup Model
+
+Pre-aggregated per-day totals of the api_usage table, refreshed periodically
+so daily usage reports read one row per day instead of every request.
+"""
+from sqlalchemy import Column, Date, BigInteger
+
+from app.db.base import Base
+
+
+class APIUsageDaily(Base):
+    """
+    Per-day API usage totals.
+
+    Rows are upserted from api_usage by APIUsageRepository.refresh_daily_rollup.
+    """
+    __tablename__ = "api_usage_daily"
+
+    date = Column(Date, primary_key=True, comment="UTC day")
+    input_tokens = Column(BigInteger, nullable=False, default=0)
+    output_tokens = Column(BigInteger, nullable=False, default=0)
+    total_tokens = Column(BigInteger, nullable=False, default=0)
+    request_count = Column(BigInteger, nullable=False, default=0)
+    failed_requests = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<APIUsageDaily(date={self.date}, tokens={self.total_tokens}, requests={self.request_count})>"
@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import Column, String, Enum as SQLEnum, DECIMAL, Boolean, ForeignKey
+from sqlalchemy import Column, String, Enum as SQLEnum, DECIMAL, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -75,9 +75,17 @@ class BankAccount(BaseModel):
     is_active = Column(Boolean, default=True, nullable=False, index=True)
 
     # Relationships
+    # Children reference bank_accounts ON DELETE CASCADE; passive_deletes lets
+    # Postgres remove them instead of the ORM loading and deleting each row
     user = relationship("User", back_populates="bank_accounts")
-    transactions = relationship("Transaction", back_populates="bank_account", cascade="all, delete-orphan")
-    documents = relationship("Document", back_populates="bank_account", cascade="all, delete-orphan")
+    transactions = relationship("Transaction", back_populates="bank_account", cascade="all, delete-orphan", passive_deletes=True)
+    documents = relationship("Document", back_populates="bank_account", cascade="all, delete-orphan", passive_deletes=True)
+
+    # The account list filters by user and pages newest first; the index is
+    # read backwards for ORDER BY created_at DESC, so no sort is needed
+    __table_args__ = (
+        Index("idx_bank_accounts_user_created", "user_id", "created_at"),
+    )
 
     def __repr__(self):
         return f"<BankAccount {self.account_name} ({self.bank_name}) - {self.currency}>"
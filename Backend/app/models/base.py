@@ -1,10 +1,14 @@
-from datetime import datetime
-from sqlalchemy import Column, DateTime
+from sqlalchemy import Column, DateTime, func, text
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
 
+from app.core.ids import uuid7
 from app.db.base import Base
 
+# Timestamps are stamped by Postgres as naive UTC, matching the naive
+# datetime.utcnow() values the application compares them against
+UTC_NOW_DEFAULT = text("timezone('utc', now())")
+UTC_NOW = func.timezone("utc", func.now())
+
 
 class BaseModel(Base):
     """
@@ -16,14 +20,18 @@ class BaseModel(Base):
     - updated_at: Timestamp when record was last updated
 
     This is an abstract base class and won't create its own table.
+
+    Timestamps are filled in by the database; eager_defaults fetches them
+    back with RETURNING so they are populated on the instance after flush.
     """
 
     __abstract__ = True
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         unique=True,
         nullable=False,
         index=True
@@ -31,14 +39,14 @@ class BaseModel(Base):
 
     created_at = Column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=UTC_NOW_DEFAULT,
         nullable=False
     )
 
     updated_at = Column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=UTC_NOW_DEFAULT,
+        onupdate=UTC_NOW,
         nullable=False
     )
 
@@ -1,15 +1,15 @@
 from sqlalchemy import Column, String, Text, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 
+from app.core.ids import uuid7
 from app.models.base import Base
 
 
 class Client(Base):
     __tablename__ = "clients"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     # Client Information
@@ -37,4 +37,6 @@ class Client(Base):
     __table_args__ = (
         Index("idx_clients_user_id", "user_id"),
         Index("idx_clients_is_active", "is_active"),
+        # Client list: per user, ordered by name
+        Index("idx_clients_user_name", "user_id", "name"),
     )
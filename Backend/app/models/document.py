@@ -7,8 +7,8 @@ This module defines the Document model for tracking uploaded financial documents
 import enum
 from datetime import datetime
 from sqlalchemy import Column, String, Text, Integer, Boolean, ForeignKey, Enum as SQLEnum, DateTime, Index
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from app.models.base import BaseModel
 
@@ -93,11 +93,13 @@ class Document(BaseModel):
     )
 
     # Processing results/errors
-    extraction_result = Column(
-        Text,
+    # extraction_result can be large and is only read by the extraction
+    # endpoint, so it is deferred: loaded on request via undefer()
+    extraction_result = deferred(Column(
+        JSONB,
         nullable=True,
-        comment="JSON string of extracted data"
-    )
+        comment="Extracted data"
+    ))
     error_message = Column(
         Text,
         nullable=True
@@ -125,4 +127,7 @@ class Document(BaseModel):
         Index("idx_documents_user_id", "user_id"),
         Index("idx_documents_status", "status"),
         Index("idx_documents_type", "document_type"),
+        # Document list: per user, optionally by status, newest first
+        Index("idx_documents_user_created", "user_id", "created_at"),
+        Index("idx_documents_user_status_created", "user_id", "status", "created_at"),
     )
@@ -2,15 +2,15 @@ from sqlalchemy import Column, String, Text, Date, DECIMAL, ForeignKey, CheckCon
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import date
-import uuid
 
+from app.core.ids import uuid7
 from app.models.base import Base
 
 
 class Invoice(Base):
     __tablename__ = "invoices"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id", ondelete="RESTRICT"), nullable=False)
 
@@ -50,8 +50,10 @@ class Invoice(Base):
     # Relationships
     user = relationship("User", back_populates="invoices")
     client = relationship("Client", back_populates="invoices")
-    items = relationship("InvoiceItem", back_populates="invoice", cascade="all, delete-orphan")
-    transactions = relationship("Transaction", back_populates="linked_invoice")
+    # Items are removed (ON DELETE CASCADE) and linked transactions unlinked
+    # (ON DELETE SET NULL) by Postgres, without loading them first
+    items = relationship("InvoiceItem", back_populates="invoice", cascade="all, delete-orphan", passive_deletes=True)
+    transactions = relationship("Transaction", back_populates="linked_invoice", passive_deletes=True)
 
     __table_args__ = (
         CheckConstraint("status IN ('draft', 'sent', 'paid', 'overdue', 'cancelled')", name="invoices_status_check"),
@@ -60,4 +62,6 @@ class Invoice(Base):
         Index("idx_invoices_status", "status"),
         Index("idx_invoices_due_date", "due_date"),
         Index("idx_invoices_invoice_number", "invoice_number"),
+        # Invoice list: per user, ordered (and range-filtered) by issue date
+        Index("idx_invoices_user_issue_date", "user_id", "issue_date"),
     )
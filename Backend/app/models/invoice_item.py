@@ -1,15 +1,15 @@
 from sqlalchemy import Column, Text, Integer, DECIMAL, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-import uuid
 
+from app.core.ids import uuid7
 from app.models.base import Base
 
 
 class InvoiceItem(Base):
     __tablename__ = "invoice_items"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     invoice_id = Column(UUID(as_uuid=True), ForeignKey("invoices.id", ondelete="CASCADE"), nullable=False)
 
     # Item Details
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, String, Text, Boolean, Index, text, Enum as SQLEnum
 import enum
 
 from app.models.base import BaseModel
@@ -80,5 +80,15 @@ class SystemBanner(BaseModel):
         comment="Whether users can dismiss/close the banner"
     )
 
+    # Active banners are counted and listed newest first on every page load;
+    # the partial index holds only the (few) active rows in that order
+    __table_args__ = (
+        Index(
+            "idx_system_banners_active_created",
+            "created_at",
+            postgresql_where=text("is_active"),
+        ),
+    )
+
     def __repr__(self):
         return f"<SystemBanner(id={self.id}, type={self.banner_type}, active={self.is_active})>"
@@ -149,4 +149,6 @@ class Transaction(BaseModel):
         Index("idx_transactions_type", "transaction_type"),
         Index("idx_transactions_category", "category"),
         Index("idx_transactions_document_id", "document_id"),
+        # Transaction list: per user, ordered (and range-filtered) by date
+        Index("idx_transactions_user_date", "user_id", "transaction_date"),
     )
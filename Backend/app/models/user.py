@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, Boolean, Integer, DateTime, Text, CheckConstraint
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, Text, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.event import listens_for
 
@@ -65,16 +65,32 @@ class User(BaseModel):
     locked_until = Column(DateTime, nullable=True)
 
     # Relationships
-    clients = relationship("Client", back_populates="user", cascade="all, delete-orphan")
-    invoices = relationship("Invoice", back_populates="user", cascade="all, delete-orphan")
-    documents = relationship("Document", back_populates="user", cascade="all, delete-orphan")
-    transactions = relationship("Transaction", back_populates="user", cascade="all, delete-orphan")
-    bank_accounts = relationship("BankAccount", back_populates="user", cascade="all, delete-orphan")
+    # clients/invoices are never loaded implicitly (a list of users would
+    # issue one query per user); load them with selectinload() when needed.
+    # Child tables reference users ON DELETE CASCADE, so passive_deletes
+    # leaves deleting them to Postgres instead of loading every child row
+    # and deleting it individually
+    clients = relationship("Client", back_populates="user", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
+    invoices = relationship("Invoice", back_populates="user", cascade="all, delete-orphan", lazy="raise", passive_deletes=True)
+    documents = relationship("Document", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    transactions = relationship("Transaction", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+    bank_accounts = relationship("BankAccount", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
     api_usage = relationship("APIUsage", back_populates="user", cascade="all, delete-orphan")
 
-    # Constraints
+    # Constraints and indexes
+    # Trigram (pg_trgm) GIN indexes serve the admin search's ILIKE '%term%'
+    # filters, which plain btree indexes cannot
     __table_args__ = (
         CheckConstraint("email = LOWER(email)", name="users_email_lowercase"),
+        *(
+            Index(
+                f"idx_users_{name}_trgm",
+                name,
+                postgresql_using="gin",
+                postgresql_ops={name: "gin_trgm_ops"},
+            )
+            for name in ("email", "first_name", "last_name", "business_name")
+        ),
     )
 
     def __repr__(self):
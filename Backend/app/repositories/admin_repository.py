@@ -1,13 +1,48 @@
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, update, delete, func, and_, or_, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+from app.core.cache import cache_delete, cache_get_json, cache_set_json
+from app.models.api_usage import APIUsage
+from app.models.invoice import Invoice
 from app.models.user import User
+from app.repositories.loading import no_lazy_loads
+from app.repositories.pagination import fetch_page
+from app.repositories.user_repository import UserRepository
 from app.schemas.admin import AdminUserUpdate
 
 
+# Columns shown by the admin user list (AdminUserResponse); address,
+# logo_url, tokens and the password hash are left unloaded
+USER_LIST_COLUMNS = (
+    User.id,
+    User.email,
+    User.first_name,
+    User.last_name,
+    User.business_name,
+    User.phone,
+    User.is_active,
+    User.is_verified,
+    User.is_superuser,
+    User.created_at,
+    User.updated_at,
+    User.last_login_at,
+    User.verified_at,
+    User.failed_login_attempts,
+    User.locked_until,
+    User.subscription_tier,
+    User.subscription_status,
+    User.trial_ends_at,
+)
+
+# Admin dashboard statistics are cached briefly; they don't need to be exact
+STATISTICS_CACHE_KEY = "admin:stats:v1"
+STATISTICS_CACHE_TTL_SECONDS = 45
+
+
 class AdminRepository:
     """Repository for admin operations on users."""
 
@@ -35,9 +70,18 @@ class AdminRepository:
 
         Returns:
             Tuple of (list of users, total count)
+
+        Note:
+            Without any filter the total is the planner's row estimate for
+            the users table (pg_class.reltuples, refreshed by ANALYZE and
+            autovacuum) instead of an exact count, unless the page itself
+            shows where the table ends.
         """
-        # Build query with filters
-        query = select(User)
+        # Build query with filters, loading only the listed columns
+        query = select(User).options(load_only(*USER_LIST_COLUMNS), *no_lazy_loads())
+
+        if search is None and is_verified is None and is_active is None and is_superuser is None:
+            return await AdminRepository._list_all_users(db, query, skip, limit)
 
         # Search filter
         if search:
@@ -59,19 +103,46 @@ class AdminRepository:
         if is_superuser is not None:
             query = query.filter(User.is_superuser == is_superuser)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
+        # Fetch the page and the total match count together
+        rows, total = await fetch_page(db, query.order_by(User.created_at.desc()), skip, limit)
 
-        # Apply pagination and ordering
-        query = query.order_by(User.created_at.desc()).offset(skip).limit(limit)
+        return [row[0] for row in rows], total
 
-        # Execute query
-        result = await db.execute(query)
-        users = result.scalars().all()
+    @staticmethod
+    async def _list_all_users(
+        db: AsyncSession, query, skip: int, limit: int
+    ) -> Tuple[List[User], int]:
+        """
+        Fetch an unfiltered page of users with an approximate total.
 
-        return list(users), total
+        Args:
+            db: Database session
+            query: Unfiltered user select
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (list of users, total count)
+        """
+        page_query = query.order_by(User.created_at.desc()).offset(skip).limit(limit)
+        users = list((await db.execute(page_query)).scalars().all())
+
+        # A partial page (with at least one row) reaches the end of the
+        # table, so the exact total is known without counting
+        if users and len(users) < limit:
+            return users, skip + len(users)
+
+        estimate = (await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'users'::regclass")
+        )).scalar_one()
+
+        # reltuples is -1 (or 0) until the table has been analyzed
+        if estimate <= 0:
+            count_query = select(func.count()).select_from(User)
+            estimate = (await db.execute(count_query)).scalar_one()
+
+        # Never report fewer users than the page has already shown
+        return users, max(estimate, skip + len(users))
 
     @staticmethod
     async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
@@ -85,8 +156,8 @@ class AdminRepository:
         Returns:
             User object or None if not found
         """
-        result = await db.execute(select(User).filter(User.id == user_id))
-        return result.scalar_one_or_none()
+        # Primary key lookup through the identity map
+        return await db.get(User, user_id)
 
     @staticmethod
     async def update_user(
@@ -103,21 +174,9 @@ class AdminRepository:
         Returns:
             Updated User object or None if not found
         """
-        user = await AdminRepository.get_user_by_id(db, user_id)
-        if not user:
-            return None
-
-        # Update fields
         update_data = user_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(user, field, value)
 
-        user.updated_at = datetime.utcnow()
-
-        await db.commit()
-        await db.refresh(user)
-
-        return user
+        return await AdminRepository._update_returning(db, user_id, **update_data)
 
     @staticmethod
     async def delete_user(db: AsyncSession, user_id: UUID) -> bool:
@@ -130,15 +189,28 @@ class AdminRepository:
 
         Returns:
             True if deleted, False if not found
+
+        Note:
+            Deletes directly in the database instead of loading the user and
+            every child collection for the ORM cascade. Foreign keys cascade
+            the remaining children; invoices go first because
+            invoices.client_id is ON DELETE RESTRICT, and API usage rows are
+            removed (as the ORM cascade did) rather than left with a NULL user.
         """
-        user = await AdminRepository.get_user_by_id(db, user_id)
-        if not user:
-            return False
+        await db.execute(delete(Invoice).where(Invoice.user_id == user_id))
+        await db.execute(delete(APIUsage).where(APIUsage.user_id == user_id))
 
-        await db.delete(user)
+        result = await db.execute(
+            delete(User).where(User.id == user_id).returning(User.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         await db.commit()
 
-        return True
+        if deleted:
+            await cache_delete(STATISTICS_CACHE_KEY)
+            await UserRepository.invalidate_cache(user_id)
+
+        return deleted
 
     @staticmethod
     async def unlock_user(db: AsyncSession, user_id: UUID) -> Optional[User]:
@@ -152,16 +224,36 @@ class AdminRepository:
         Returns:
             Updated User object or None if not found
         """
-        user = await AdminRepository.get_user_by_id(db, user_id)
-        if not user:
-            return None
+        return await AdminRepository._update_returning(
+            db,
+            user_id,
+            failed_login_attempts=0,
+            locked_until=None,
+        )
 
-        user.failed_login_attempts = 0
-        user.locked_until = None
-        user.updated_at = datetime.utcnow()
+    @staticmethod
+    async def _update_returning(db: AsyncSession, user_id: UUID, **values) -> Optional[User]:
+        """
+        Update a user with a single UPDATE ... RETURNING statement.
+
+        Args:
+            db: Database session
+            user_id: User UUID
+            **values: Column values to set
 
+        Returns:
+            Updated User object or None if not found
+        """
+        result = await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**values)
+            .returning(User)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        user = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(user)
+        await UserRepository.invalidate_cache(user_id)
 
         return user
 
@@ -175,57 +267,47 @@ class AdminRepository:
 
         Returns:
             Dictionary with various user statistics
+
+        Note:
+            Results are cached in Redis for STATISTICS_CACHE_TTL_SECONDS
+            (when configured), so counts can lag by up to that long.
         """
+        cached = await cache_get_json(STATISTICS_CACHE_KEY)
+        if cached is not None:
+            return cached
+
         now = datetime.utcnow()
         today_start = datetime(now.year, now.month, now.day)
         week_start = today_start - timedelta(days=7)
         month_start = today_start - timedelta(days=30)
 
-        # Total users
-        total_users_query = select(func.count()).select_from(User)
-        total_users = (await db.execute(total_users_query)).scalar_one()
-
-        # Verified users
-        verified_query = select(func.count()).select_from(User).filter(User.is_verified == True)
-        verified_users = (await db.execute(verified_query)).scalar_one()
-
-        # Unverified users
-        unverified_users = total_users - verified_users
+        # All counters in one pass over users using FILTER aggregates
+        query = select(
+            func.count().label("total_users"),
+            func.count().filter(User.is_verified == True).label("verified_users"),
+            func.count().filter(User.is_active == True).label("active_users"),
+            func.count().filter(
+                and_(User.locked_until.isnot(None), User.locked_until > now)
+            ).label("locked_users"),
+            func.count().filter(User.is_superuser == True).label("superusers"),
+            func.count().filter(User.created_at >= today_start).label("users_today"),
+            func.count().filter(User.created_at >= week_start).label("users_week"),
+            func.count().filter(User.created_at >= month_start).label("users_month"),
+        ).select_from(User)
+        row = (await db.execute(query)).one()
+
+        statistics = {
+            "total_users": row.total_users,
+            "verified_users": row.verified_users,
+            "unverified_users": row.total_users - row.verified_users,
+            "active_users": row.active_users,
+            "locked_users": row.locked_users,
+            "superusers": row.superusers,
+            "users_created_today": row.users_today,
+            "users_created_this_week": row.users_week,
+            "users_created_this_month": row.users_month,
+        }
 
-        # Active users
-        active_query = select(func.count()).select_from(User).filter(User.is_active == True)
-        active_users = (await db.execute(active_query)).scalar_one()
+        await cache_set_json(STATISTICS_CACHE_KEY, statistics, STATISTICS_CACHE_TTL_SECONDS)
 
-        # Locked users
-        locked_query = select(func.count()).select_from(User).filter(
-            and_(User.locked_until.isnot(None), User.locked_until > now)
-        )
-        locked_users = (await db.execute(locked_query)).scalar_one()
-
-        # Superusers
-        superuser_query = select(func.count()).select_from(User).filter(User.is_superuser == True)
-        superusers = (await db.execute(superuser_query)).scalar_one()
-
-        # Users created today
-        today_query = select(func.count()).select_from(User).filter(User.created_at >= today_start)
-        users_today = (await db.execute(today_query)).scalar_one()
-
-        # Users created this week
-        week_query = select(func.count()).select_from(User).filter(User.created_at >= week_start)
-        users_week = (await db.execute(week_query)).scalar_one()
-
-        # Users created this month
-        month_query = select(func.count()).select_from(User).filter(User.created_at >= month_start)
-        users_month = (await db.execute(month_query)).scalar_one()
-
-        return {
-            "total_users": total_users,
-            "verified_users": verified_users,
-            "unverified_users": unverified_users,
-            "active_users": active_users,
-            "locked_users": locked_users,
-            "superusers": superusers,
-            "users_created_today": users_today,
-            "users_created_this_week": users_week,
-            "users_created_this_month": users_month,
-        }
+        return statistics
@@ -4,14 +4,50 @@ Repository for API usage tracking queries.
 This module provides database queries for monitoring API usage,
 calculating daily quotas, and generating usage statistics.
 """
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from datetime import date, datetime, time, timedelta
+from typing import Optional, List, Dict, Any, AsyncIterator
 from uuid import UUID
-from sqlalchemy import select, func, and_, desc
-from sqlalchemy.sql import case as sql_case
+from sqlalchemy import select, func, and_, desc, union_all, cast, Integer, String, lambda_stmt, text
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.api_usage import APIUsage, APIServiceType, APIOperationType
+from app.models.api_usage_daily import APIUsageDaily
+from app.models.user import User
+
+
+def _int_or_zero(expression):
+    """Coalesce an aggregate to an integer in SQL (NULL becomes 0, averages are truncated)."""
+    return func.coalesce(cast(func.floor(expression), Integer), 0)
+
+
+def _created_between(start_date: Optional[datetime], end_date: Optional[datetime]):
+    """
+    Filter api_usage rows to a created_at range.
+
+    Both bounds are always present (open ends become datetime.min/max), so
+    every caller produces the same statement shape and hits the same
+    compiled-SQL cache entry; only the bound values differ.
+    """
+    return and_(
+        APIUsage.created_at >= (start_date or datetime.min),
+        APIUsage.created_at <= (end_date or datetime.max)
+    )
+
+
+# Rows fetched per round-trip when streaming api_usage exports
+EXPORT_BATCH_SIZE = 500
+
+
+# Advisory lock key serializing api_usage partition maintenance
+# (arbitrary constant; any other pg_advisory_lock user must not reuse it)
+PARTITION_MAINTENANCE_LOCK_KEY = 72_401_913
+
+
+# Most recent days (today and yesterday) are always aggregated live, since
+# the hourly rollup may not have caught up with them yet
+ROLLUP_LIVE_DAYS = 1
 
 
 class APIUsageRepository:
@@ -36,15 +72,17 @@ class APIUsageRepository:
         Returns:
             Total tokens used
         """
-        query = select(func.sum(APIUsage.total_tokens)).where(
-            APIUsage.user_id == user_id,
-            APIUsage.success == 1
-        )
+        start_date = start_date or datetime.min
+        end_date = end_date or datetime.max
 
-        if start_date:
-            query = query.where(APIUsage.created_at >= start_date)
-        if end_date:
-            query = query.where(APIUsage.created_at <= end_date)
+        # Quota checks run this on every extraction; a lambda statement
+        # skips rebuilding the select and computing its cache key each call
+        query = lambda_stmt(lambda: select(func.sum(APIUsage.total_tokens)).where(
+            APIUsage.user_id == user_id,
+            APIUsage.success == True,
+            APIUsage.created_at >= start_date,
+            APIUsage.created_at <= end_date
+        ))
 
         result = await db.execute(query)
         total = result.scalar()
@@ -67,7 +105,7 @@ class APIUsageRepository:
         """
         today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
 
-        query = select(
+        query = lambda_stmt(lambda: select(
             func.sum(APIUsage.input_tokens).label('input_tokens'),
             func.sum(APIUsage.output_tokens).label('output_tokens'),
             func.sum(APIUsage.total_tokens).label('total_tokens'),
@@ -75,8 +113,8 @@ class APIUsageRepository:
         ).where(
             APIUsage.user_id == user_id,
             APIUsage.created_at >= today_start,
-            APIUsage.success == 1
-        )
+            APIUsage.success == True
+        ))
 
         result = await db.execute(query)
         row = result.first()
@@ -102,10 +140,14 @@ class APIUsageRepository:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         limit: int = 100
-    ) -> List[Dict[str, Any]]:
+    ) -> List[RowMapping]:
         """
         Get usage statistics for all users.
 
+        The user's email is joined in the same query, so callers don't need
+        a follow-up lookup per user. Values are coalesced and cast in SQL, so
+        rows are returned as-is without per-row Python conversion.
+
         Args:
             db: Database session
             start_date: Start of date range (optional)
@@ -117,39 +159,26 @@ class APIUsageRepository:
         """
         query = select(
             APIUsage.user_id,
-            func.sum(APIUsage.input_tokens).label('input_tokens'),
-            func.sum(APIUsage.output_tokens).label('output_tokens'),
-            func.sum(APIUsage.total_tokens).label('total_tokens'),
+            User.email,
+            _int_or_zero(func.sum(APIUsage.input_tokens)).label('input_tokens'),
+            _int_or_zero(func.sum(APIUsage.output_tokens)).label('output_tokens'),
+            _int_or_zero(func.sum(APIUsage.total_tokens)).label('total_tokens'),
             func.count(APIUsage.id).label('request_count'),
-            func.avg(APIUsage.duration_ms).label('avg_duration_ms')
+            _int_or_zero(func.avg(APIUsage.duration_ms)).label('avg_duration_ms')
+        ).join(
+            User, User.id == APIUsage.user_id
         ).where(
-            APIUsage.user_id.isnot(None),
-            APIUsage.success == 1
+            APIUsage.success == True,
+            _created_between(start_date, end_date)
         ).group_by(
-            APIUsage.user_id
+            APIUsage.user_id,
+            User.email
         ).order_by(
             desc('total_tokens')
         ).limit(limit)
 
-        if start_date:
-            query = query.where(APIUsage.created_at >= start_date)
-        if end_date:
-            query = query.where(APIUsage.created_at <= end_date)
-
         result = await db.execute(query)
-        rows = result.all()
-
-        return [
-            {
-                'user_id': str(row.user_id),
-                'input_tokens': row.input_tokens or 0,
-                'output_tokens': row.output_tokens or 0,
-                'total_tokens': row.total_tokens or 0,
-                'request_count': row.request_count or 0,
-                'avg_duration_ms': int(row.avg_duration_ms) if row.avg_duration_ms else 0
-            }
-            for row in rows
-        ]
+        return result.mappings().all()
 
     @staticmethod
     async def get_daily_usage_summary(
@@ -159,6 +188,10 @@ class APIUsageRepository:
         """
         Get daily usage summary for the past N days.
 
+        Completed days are read from the api_usage_daily rollup. Today and
+        yesterday may not be fully rolled up yet, so they are aggregated
+        live from api_usage.
+
         Args:
             db: Database session
             days: Number of days to include
@@ -166,33 +199,27 @@ class APIUsageRepository:
         Returns:
             List of daily usage statistics
         """
-        from sqlalchemy import cast, Date
-
-        start_date = datetime.utcnow() - timedelta(days=days)
-
-        # Use DATE_TRUNC for PostgreSQL compatibility - truncate to day
-        date_col = cast(func.date_trunc('day', APIUsage.created_at), Date)
-
-        query = select(
-            date_col.label('date'),
-            func.sum(APIUsage.input_tokens).label('input_tokens'),
-            func.sum(APIUsage.output_tokens).label('output_tokens'),
-            func.sum(APIUsage.total_tokens).label('total_tokens'),
-            func.count(APIUsage.id).label('request_count'),
-            func.sum(
-                sql_case(
-                    (APIUsage.success == 0, 1),
-                    else_=0
-                )
-            ).label('failed_requests')
+        today = datetime.utcnow().date()
+        start_day = today - timedelta(days=days)
+        live_start_day = max(start_day, today - timedelta(days=ROLLUP_LIVE_DAYS))
+
+        rolled_up = select(
+            APIUsageDaily.date,
+            APIUsageDaily.input_tokens,
+            APIUsageDaily.output_tokens,
+            APIUsageDaily.total_tokens,
+            APIUsageDaily.request_count,
+            APIUsageDaily.failed_requests
         ).where(
-            APIUsage.created_at >= start_date
-        ).group_by(
-            date_col
-        ).order_by(
-            desc(date_col)
+            APIUsageDaily.date >= start_day,
+            APIUsageDaily.date < live_start_day
         )
 
+        live = APIUsageRepository._daily_aggregate(live_start_day)
+
+        combined = union_all(rolled_up, live).subquery()
+        query = select(combined).order_by(desc(combined.c.date))
+
         result = await db.execute(query)
         rows = result.all()
 
@@ -208,15 +235,140 @@ class APIUsageRepository:
             for row in rows
         ]
 
+    @staticmethod
+    async def refresh_daily_rollup(db: AsyncSession, since: date) -> None:
+        """
+        Upsert api_usage_daily rows for every day from `since` onwards.
+
+        Safe to run repeatedly (and from several workers): each run
+        recomputes the affected days from api_usage and overwrites them.
+
+        Args:
+            db: Database session
+            since: First day to recompute
+        """
+        columns = [
+            "date", "input_tokens", "output_tokens", "total_tokens",
+            "request_count", "failed_requests"
+        ]
+
+        stmt = pg_insert(APIUsageDaily).from_select(
+            columns, APIUsageRepository._daily_aggregate(since)
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[APIUsageDaily.date],
+            set_={name: stmt.excluded[name] for name in columns[1:]}
+        )
+
+        await db.execute(stmt)
+        await db.commit()
+
+    @staticmethod
+    async def try_lock_partition_maintenance(db: AsyncSession) -> bool:
+        """
+        Take the partition maintenance advisory lock for the current transaction.
+
+        The lock is released when the transaction ends, so the caller must
+        commit (or roll back) after its maintenance work.
+
+        Args:
+            db: Database session
+
+        Returns:
+            True if the lock was taken, False if another session holds it
+        """
+        result = await db.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"),
+            {"key": PARTITION_MAINTENANCE_LOCK_KEY}
+        )
+        return bool(result.scalar())
+
+    @staticmethod
+    async def create_partitions(db: AsyncSession, months_ahead: int = 2) -> None:
+        """
+        Make sure monthly api_usage partitions exist through the coming months.
+
+        Rows for a month without a partition land in api_usage_default;
+        create_api_usage_partition() moves them into the new partition when
+        it is created. Runs in the caller's transaction (no commit).
+
+        Args:
+            db: Database session
+            months_ahead: Number of months after the current one to cover
+        """
+        await db.execute(
+            text("""
+                SELECT create_api_usage_partition(month::date)
+                FROM generate_series(
+                    date_trunc('month', timezone('utc', now())),
+                    date_trunc('month', timezone('utc', now())) + make_interval(months => :months_ahead),
+                    interval '1 month'
+                ) AS month
+            """),
+            {"months_ahead": months_ahead}
+        )
+
+    @staticmethod
+    async def drop_partitions_before(db: AsyncSession, cutoff: date) -> int:
+        """
+        Drop monthly api_usage partitions that end on or before a cutoff day.
+
+        Dropping a partition discards its rows without any per-row delete or
+        vacuum work. Daily totals for those days remain in api_usage_daily.
+        Runs in the caller's transaction (no commit).
+
+        Args:
+            db: Database session
+            cutoff: Partitions covering only days before this are dropped
+
+        Returns:
+            Number of partitions dropped
+        """
+        result = await db.execute(
+            text("SELECT drop_api_usage_partitions_before(:cutoff)"),
+            {"cutoff": cutoff}
+        )
+        return result.scalar() or 0
+
+    @staticmethod
+    def _daily_aggregate(since: date):
+        """
+        Build the per-day usage aggregate over api_usage.
+
+        Args:
+            since: First day to include
+
+        Returns:
+            Select producing one row per day, shaped like api_usage_daily
+        """
+        return select(
+            APIUsage.usage_day.label('date'),
+            func.sum(APIUsage.input_tokens).label('input_tokens'),
+            func.sum(APIUsage.output_tokens).label('output_tokens'),
+            func.sum(APIUsage.total_tokens).label('total_tokens'),
+            func.count(APIUsage.id).label('request_count'),
+            func.count().filter(APIUsage.success == False).label('failed_requests')
+        ).where(
+            APIUsage.usage_day >= since,
+            # Same bound on the partition key (naive UTC, like created_at),
+            # so only the partitions covering `since` onwards are scanned
+            APIUsage.created_at >= datetime.combine(since, time.min)
+        ).group_by(
+            APIUsage.usage_day
+        )
+
     @staticmethod
     async def get_service_breakdown(
         db: AsyncSession,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[RowMapping]:
         """
         Get usage breakdown by service and operation type.
 
+        Enum columns are cast to text and aggregates coalesced in SQL, so
+        rows are returned as-is without per-row Python conversion.
+
         Args:
             db: Database session
             start_date: Start of date range (optional)
@@ -226,14 +378,15 @@ class APIUsageRepository:
             List of service/operation usage statistics
         """
         query = select(
-            APIUsage.service,
-            APIUsage.operation,
+            cast(APIUsage.service, String).label('service'),
+            cast(APIUsage.operation, String).label('operation'),
             APIUsage.model_name,
-            func.sum(APIUsage.total_tokens).label('total_tokens'),
+            _int_or_zero(func.sum(APIUsage.total_tokens)).label('total_tokens'),
             func.count(APIUsage.id).label('request_count'),
-            func.avg(APIUsage.duration_ms).label('avg_duration_ms')
+            _int_or_zero(func.avg(APIUsage.duration_ms)).label('avg_duration_ms')
         ).where(
-            APIUsage.success == 1
+            APIUsage.success == True,
+            _created_between(start_date, end_date)
         ).group_by(
             APIUsage.service,
             APIUsage.operation,
@@ -242,25 +395,8 @@ class APIUsageRepository:
             desc('total_tokens')
         )
 
-        if start_date:
-            query = query.where(APIUsage.created_at >= start_date)
-        if end_date:
-            query = query.where(APIUsage.created_at <= end_date)
-
         result = await db.execute(query)
-        rows = result.all()
-
-        return [
-            {
-                'service': row.service.value if hasattr(row.service, 'value') else row.service,
-                'operation': row.operation.value if hasattr(row.operation, 'value') else row.operation,
-                'model_name': row.model_name,
-                'total_tokens': row.total_tokens or 0,
-                'request_count': row.request_count or 0,
-                'avg_duration_ms': int(row.avg_duration_ms) if row.avg_duration_ms else 0
-            }
-            for row in rows
-        ]
+        return result.mappings().all()
 
     @staticmethod
     async def get_recent_requests(
@@ -287,4 +423,56 @@ class APIUsageRepository:
         result = await db.execute(query)
         return result.scalars().all()
 
+    @staticmethod
+    async def stream_requests(
+        db: AsyncSession,
+        user_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 10000
+    ) -> AsyncIterator[RowMapping]:
+        """
+        Stream API requests, newest first, without loading them all at once.
+
+        Rows are read from a server-side cursor EXPORT_BATCH_SIZE at a time,
+        so memory stays bounded by one batch regardless of limit. Only the
+        exported columns are selected (enums cast to text), and rows are
+        yielded as plain mappings rather than ORM objects.
+
+        Args:
+            db: Database session (must stay open while iterating)
+            user_id: Filter by user (optional)
+            start_date: Start of date range (optional)
+            end_date: End of date range (optional)
+            limit: Maximum number of requests to return
+
+        Yields:
+            One mapping per API request
+        """
+        query = select(
+            APIUsage.id,
+            cast(APIUsage.service, String).label('service'),
+            cast(APIUsage.operation, String).label('operation'),
+            APIUsage.model_name,
+            APIUsage.user_id,
+            APIUsage.document_id,
+            APIUsage.input_tokens,
+            APIUsage.output_tokens,
+            APIUsage.total_tokens,
+            APIUsage.status_code,
+            APIUsage.success,
+            APIUsage.error_message,
+            APIUsage.duration_ms,
+            APIUsage.created_at
+        ).where(
+            _created_between(start_date, end_date)
+        ).order_by(
+            desc(APIUsage.created_at)
+        ).limit(limit).execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+        if user_id:
+            query = query.where(APIUsage.user_id == user_id)
 
+        result = await db.stream(query)
+        async for row in result.mappings():
+            yield row
@@ -1,10 +1,13 @@
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, insert, update, delete, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from decimal import Decimal
 
 from app.models.bank_account import BankAccount, AccountType, Currency
+from app.repositories.loading import no_lazy_loads
+from app.repositories.pagination import fetch_page
+from app.repositories import request_cache
 from app.schemas.bank_account import BankAccountCreate, BankAccountUpdate
 
 
@@ -18,18 +21,19 @@ class BankAccountRepository:
         bank_account_data: BankAccountCreate
     ) -> BankAccount:
         """Create a new bank account"""
-        bank_account = BankAccount(
-            user_id=user_id,
-            **bank_account_data.model_dump()
-        )
+        values = bank_account_data.model_dump()
 
         # Set current_balance to opening_balance if provided
         if bank_account_data.opening_balance is not None:
-            bank_account.current_balance = bank_account_data.opening_balance
+            values["current_balance"] = bank_account_data.opening_balance
 
-        db.add(bank_account)
+        # INSERT ... RETURNING hands back the generated columns in the same
+        # round-trip, so no refresh is needed
+        result = await db.execute(
+            insert(BankAccount).values(user_id=user_id, **values).returning(BankAccount)
+        )
+        bank_account = result.scalar_one()
         await db.commit()
-        await db.refresh(bank_account)
         return bank_account
 
     @staticmethod
@@ -39,15 +43,12 @@ class BankAccountRepository:
         user_id: UUID
     ) -> Optional[BankAccount]:
         """Get a bank account by ID (user-scoped)"""
-        result = await db.execute(
-            select(BankAccount).where(
-                and_(
-                    BankAccount.id == bank_account_id,
-                    BankAccount.user_id == user_id
-                )
-            )
-        )
-        return result.scalar_one_or_none()
+        # Primary key lookup through the identity map: no SQL at all when the
+        # account is already loaded in this session
+        bank_account = await db.get(BankAccount, bank_account_id, options=no_lazy_loads())
+        if bank_account is None or bank_account.user_id != user_id:
+            return None
+        return bank_account
 
     @staticmethod
     async def get_all(
@@ -60,7 +61,7 @@ class BankAccountRepository:
     ) -> tuple[list[BankAccount], int]:
         """Get all bank accounts for a user with pagination and filters"""
         # Build base query
-        query = select(BankAccount).where(BankAccount.user_id == user_id)
+        query = select(BankAccount).options(*no_lazy_loads()).where(BankAccount.user_id == user_id)
 
         # Apply filters
         if is_active is not None:
@@ -68,17 +69,12 @@ class BankAccountRepository:
         if currency is not None:
             query = query.where(BankAccount.currency == currency)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-
-        # Apply pagination and ordering
-        query = query.order_by(BankAccount.created_at.desc()).offset(skip).limit(limit)
-        result = await db.execute(query)
-        bank_accounts = result.scalars().all()
+        # Fetch the page and the total count (counted only for a full page)
+        rows, total = await fetch_page(
+            db, query.order_by(BankAccount.created_at.desc()), skip, limit
+        )
 
-        return list(bank_accounts), total
+        return [row[0] for row in rows], total
 
     @staticmethod
     async def update(
@@ -88,18 +84,14 @@ class BankAccountRepository:
         update_data: BankAccountUpdate
     ) -> Optional[BankAccount]:
         """Update a bank account"""
-        bank_account = await BankAccountRepository.get_by_id(db, bank_account_id, user_id)
-        if not bank_account:
-            return None
-
         # Update only provided fields
         update_dict = update_data.model_dump(exclude_unset=True)
-        for field, value in update_dict.items():
-            setattr(bank_account, field, value)
+        if not update_dict:
+            return await BankAccountRepository.get_by_id(db, bank_account_id, user_id)
 
-        await db.commit()
-        await db.refresh(bank_account)
-        return bank_account
+        return await BankAccountRepository._update_returning(
+            db, bank_account_id, user_id, **update_dict
+        )
 
     @staticmethod
     async def delete(
@@ -108,13 +100,22 @@ class BankAccountRepository:
         user_id: UUID
     ) -> bool:
         """Delete a bank account (hard delete)"""
-        bank_account = await BankAccountRepository.get_by_id(db, bank_account_id, user_id)
-        if not bank_account:
-            return False
-
-        await db.delete(bank_account)
+        # Transactions and documents are removed by ON DELETE CASCADE
+        result = await db.execute(
+            delete(BankAccount)
+            .where(
+                and_(
+                    BankAccount.id == bank_account_id,
+                    BankAccount.user_id == user_id
+                )
+            )
+            .returning(BankAccount.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         await db.commit()
-        return True
+        # Cached documents and transactions of the account are gone too
+        request_cache.clear(db)
+        return deleted
 
     @staticmethod
     async def deactivate(
@@ -123,14 +124,9 @@ class BankAccountRepository:
         user_id: UUID
     ) -> Optional[BankAccount]:
         """Soft delete - deactivate a bank account"""
-        bank_account = await BankAccountRepository.get_by_id(db, bank_account_id, user_id)
-        if not bank_account:
-            return None
-
-        bank_account.is_active = False
-        await db.commit()
-        await db.refresh(bank_account)
-        return bank_account
+        return await BankAccountRepository._update_returning(
+            db, bank_account_id, user_id, is_active=False
+        )
 
     @staticmethod
     async def update_balance(
@@ -140,13 +136,32 @@ class BankAccountRepository:
         new_balance: Decimal
     ) -> Optional[BankAccount]:
         """Update the current balance of a bank account"""
-        bank_account = await BankAccountRepository.get_by_id(db, bank_account_id, user_id)
-        if not bank_account:
-            return None
+        return await BankAccountRepository._update_returning(
+            db, bank_account_id, user_id, current_balance=new_balance
+        )
 
-        bank_account.current_balance = new_balance
+    @staticmethod
+    async def _update_returning(
+        db: AsyncSession,
+        bank_account_id: UUID,
+        user_id: UUID,
+        **values
+    ) -> Optional[BankAccount]:
+        """Update a bank account with a single UPDATE ... RETURNING (user-scoped)"""
+        result = await db.execute(
+            update(BankAccount)
+            .where(
+                and_(
+                    BankAccount.id == bank_account_id,
+                    BankAccount.user_id == user_id
+                )
+            )
+            .values(**values)
+            .returning(BankAccount)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        bank_account = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(bank_account)
         return bank_account
 
     @staticmethod
@@ -1,9 +1,13 @@
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.client import Client
+from app.models.invoice import Invoice
+from app.repositories.loading import no_lazy_loads
+from app.repositories.pagination import fetch_page
+from app.repositories import request_cache
 from app.schemas.client import ClientCreate, ClientUpdate
 
 
@@ -23,10 +27,12 @@ class ClientRepository:
         Returns:
             Client object or None if not found
         """
-        result = await db.execute(
-            select(Client).filter(Client.id == client_id, Client.user_id == user_id)
-        )
-        return result.scalar_one_or_none()
+        # Primary key lookup through the identity map: no SQL at all when the
+        # client is already loaded in this session
+        client = await db.get(Client, client_id, options=no_lazy_loads())
+        if client is None or client.user_id != user_id:
+            return None
+        return client
 
     @staticmethod
     async def get_all(
@@ -49,22 +55,15 @@ class ClientRepository:
         Returns:
             Tuple of (clients list, total count)
         """
-        query = select(Client).filter(Client.user_id == user_id)
+        query = select(Client).options(*no_lazy_loads()).filter(Client.user_id == user_id)
 
         if is_active is not None:
             query = query.filter(Client.is_active == is_active)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-
-        # Get paginated results
-        query = query.offset(skip).limit(limit).order_by(Client.name)
-        result = await db.execute(query)
-        clients = result.scalars().all()
+        # Get paginated results and the total count (counted only for a full page)
+        rows, total = await fetch_page(db, query.order_by(Client.name), skip, limit)
 
-        return list(clients), total
+        return [row[0] for row in rows], total
 
     @staticmethod
     async def create(db: AsyncSession, user_id: UUID, client_data: ClientCreate) -> Client:
@@ -79,23 +78,27 @@ class ClientRepository:
         Returns:
             Created Client object
         """
-        client = Client(
-            user_id=user_id,
-            name=client_data.name,
-            email=client_data.email,
-            phone=client_data.phone,
-            address=client_data.address,
-            city=client_data.city,
-            country=client_data.country,
-            currency=client_data.currency,
-            tax_id=client_data.tax_id,
-            notes=client_data.notes,
-            is_active=client_data.is_active,
+        # INSERT ... RETURNING hands back the generated columns in the same
+        # round-trip, so no refresh is needed
+        result = await db.execute(
+            insert(Client)
+            .values(
+                user_id=user_id,
+                name=client_data.name,
+                email=client_data.email,
+                phone=client_data.phone,
+                address=client_data.address,
+                city=client_data.city,
+                country=client_data.country,
+                currency=client_data.currency,
+                tax_id=client_data.tax_id,
+                notes=client_data.notes,
+                is_active=client_data.is_active,
+            )
+            .returning(Client)
         )
-
-        db.add(client)
+        client = result.scalar_one()
         await db.commit()
-        await db.refresh(client)
 
         return client
 
@@ -115,19 +118,11 @@ class ClientRepository:
         Returns:
             Updated Client object or None if not found
         """
-        client = await ClientRepository.get_by_id(db, client_id, user_id)
-        if not client:
-            return None
-
         update_data = client_data.model_dump(exclude_unset=True)
+        if not update_data:
+            return await ClientRepository.get_by_id(db, client_id, user_id)
 
-        for field, value in update_data.items():
-            setattr(client, field, value)
-
-        await db.commit()
-        await db.refresh(client)
-
-        return client
+        return await ClientRepository._update_returning(db, client_id, user_id, **update_data)
 
     @staticmethod
     async def delete(db: AsyncSession, client_id: UUID, user_id: UUID) -> bool:
@@ -141,15 +136,28 @@ class ClientRepository:
 
         Returns:
             True if deleted, False if not found
-        """
-        client = await ClientRepository.get_by_id(db, client_id, user_id)
-        if not client:
-            return False
 
-        await db.delete(client)
+        Note:
+            Deletes directly in the database instead of loading the client
+            and its invoices. The client's invoices go first, as the ORM
+            cascade did, because invoices.client_id is ON DELETE RESTRICT;
+            their items and transaction links are handled by the invoice
+            foreign keys.
+        """
+        await db.execute(
+            delete(Invoice).where(Invoice.client_id == client_id, Invoice.user_id == user_id)
+        )
+        result = await db.execute(
+            delete(Client)
+            .where(Client.id == client_id, Client.user_id == user_id)
+            .returning(Client.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         await db.commit()
+        # Cached invoices of the client are gone too
+        request_cache.clear(db)
 
-        return True
+        return deleted
 
     @staticmethod
     async def deactivate(db: AsyncSession, client_id: UUID, user_id: UUID) -> Optional[Client]:
@@ -164,12 +172,32 @@ class ClientRepository:
         Returns:
             Updated Client object or None if not found
         """
-        client = await ClientRepository.get_by_id(db, client_id, user_id)
-        if not client:
-            return None
+        return await ClientRepository._update_returning(db, client_id, user_id, is_active=False)
+
+    @staticmethod
+    async def _update_returning(
+        db: AsyncSession, client_id: UUID, user_id: UUID, **values
+    ) -> Optional[Client]:
+        """
+        Update a client with a single UPDATE ... RETURNING statement.
+
+        Args:
+            db: Database session
+            client_id: Client UUID
+            user_id: User UUID (for authorization)
+            **values: Column values to set
 
-        client.is_active = False
+        Returns:
+            Updated Client object or None if not found
+        """
+        result = await db.execute(
+            update(Client)
+            .where(Client.id == client_id, Client.user_id == user_id)
+            .values(**values)
+            .returning(Client)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        client = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(client)
 
         return client
@@ -6,12 +6,33 @@ Follows the repository pattern used throughout the FinTrack application.
 """
 from typing import Optional
 from uuid import UUID
-from datetime import datetime
-from sqlalchemy import select, func
+from sqlalchemy import select, insert, update, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, selectinload, undefer
 
+from app.models.base import UTC_NOW
 from app.models.document import Document, DocumentType, ProcessingStatus
+from app.repositories.loading import no_lazy_loads
+from app.repositories.pagination import fetch_page
+from app.repositories import request_cache
+
+
+# Columns shown by the document list (DocumentStatusResponse) plus the
+# owning user/account and file metadata; mime type and the notification
+# flag are left unloaded, as is the deferred extraction_result
+DOCUMENT_LIST_COLUMNS = (
+    Document.id,
+    Document.user_id,
+    Document.bank_account_id,
+    Document.document_type,
+    Document.original_filename,
+    Document.file_size_bytes,
+    Document.status,
+    Document.processing_started_at,
+    Document.processing_completed_at,
+    Document.error_message,
+    Document.created_at,
+)
 
 
 class DocumentRepository:
@@ -44,20 +65,24 @@ class DocumentRepository:
         Returns:
             Created Document object
         """
-        document = Document(
-            user_id=user_id,
-            document_type=document_type,
-            original_filename=filename,
-            file_size_bytes=file_size,
-            mime_type=mime_type,
-            status=ProcessingStatus.PENDING,
-            bank_account_id=bank_account_id,
-            email_notification_requested=email_notification_requested
+        # INSERT ... RETURNING hands back the generated columns in the same
+        # round-trip, so no refresh is needed
+        result = await db.execute(
+            insert(Document)
+            .values(
+                user_id=user_id,
+                document_type=document_type,
+                original_filename=filename,
+                file_size_bytes=file_size,
+                mime_type=mime_type,
+                status=ProcessingStatus.PENDING,
+                bank_account_id=bank_account_id,
+                email_notification_requested=email_notification_requested
+            )
+            .returning(Document)
         )
-
-        db.add(document)
+        document = result.scalar_one()
         await db.commit()
-        await db.refresh(document)
 
         return document
 
@@ -65,7 +90,8 @@ class DocumentRepository:
     async def get_by_id(
         db: AsyncSession,
         document_id: UUID,
-        user_id: UUID
+        user_id: UUID,
+        include_extraction_result: bool = False
     ) -> Optional[Document]:
         """
         Get document by ID with transactions.
@@ -74,16 +100,26 @@ class DocumentRepository:
             db: Database session
             document_id: Document UUID
             user_id: User UUID (for authorization)
+            include_extraction_result: Also load the deferred extraction_result
 
         Returns:
             Document object or None if not found
         """
-        result = await db.execute(
+        key = (Document, document_id, user_id, include_extraction_result)
+        document = request_cache.get_cached(db, key)
+        if document is not None:
+            return document
+
+        query = (
             select(Document)
-            .options(selectinload(Document.transactions))
+            .options(selectinload(Document.transactions), *no_lazy_loads())
             .filter(Document.id == document_id, Document.user_id == user_id)
         )
-        return result.scalar_one_or_none()
+        if include_extraction_result:
+            query = query.options(undefer(Document.extraction_result))
+
+        result = await db.execute(query)
+        return request_cache.cache(db, key, result.scalar_one_or_none())
 
     @staticmethod
     async def get_all(
@@ -110,24 +146,6 @@ class DocumentRepository:
         """
         from app.models.transaction import Transaction
 
-        # Build base query
-        query = select(Document).filter(Document.user_id == user_id)
-
-        # Apply filters
-        if document_type:
-            query = query.filter(Document.document_type == document_type)
-        if status:
-            # Support both single status and list of statuses
-            if isinstance(status, list):
-                query = query.filter(Document.status.in_(status))
-            else:
-                query = query.filter(Document.status == status)
-
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-
         # Build query with transaction count using subquery
         transaction_count_subquery = (
             select(func.count(Transaction.id))
@@ -136,26 +154,27 @@ class DocumentRepository:
             .scalar_subquery()
         )
 
-        query_with_count = (
+        query = (
             select(Document, transaction_count_subquery.label('transaction_count'))
+            .options(load_only(*DOCUMENT_LIST_COLUMNS), *no_lazy_loads())
             .filter(Document.user_id == user_id)
         )
 
-        # Apply same filters to the count query
+        # Apply filters
         if document_type:
-            query_with_count = query_with_count.filter(Document.document_type == document_type)
+            query = query.filter(Document.document_type == document_type)
         if status:
+            # Support both single status and list of statuses
             if isinstance(status, list):
-                query_with_count = query_with_count.filter(Document.status.in_(status))
+                query = query.filter(Document.status.in_(status))
             else:
-                query_with_count = query_with_count.filter(Document.status == status)
+                query = query.filter(Document.status == status)
 
-        # Get paginated results with transaction counts
-        query_with_count = query_with_count.offset(skip).limit(limit).order_by(Document.created_at.desc())
-        result = await db.execute(query_with_count)
-        documents_with_counts = result.all()
+        # Get paginated results with transaction counts and the total count
+        # (counted only for a full page)
+        rows, total = await fetch_page(db, query.order_by(Document.created_at.desc()), skip, limit)
 
-        return documents_with_counts, total
+        return [(row[0], row[1]) for row in rows], total
 
     @staticmethod
     async def update_status(
@@ -176,26 +195,29 @@ class DocumentRepository:
         Returns:
             Updated Document object or None if not found
         """
-        result = await db.execute(
-            select(Document).filter(Document.id == document_id)
-        )
-        document = result.scalar_one_or_none()
-
-        if not document:
-            return None
-
-        document.status = status
+        values = {"status": status}
 
+        # Timestamps are stamped by Postgres (naive UTC, like the column
+        # defaults) rather than computed in Python
         if status == ProcessingStatus.PROCESSING:
-            document.processing_started_at = datetime.utcnow()
-        elif status in [ProcessingStatus.COMPLETED, ProcessingStatus.FAILED]:
-            document.processing_completed_at = datetime.utcnow()
+            values["processing_started_at"] = UTC_NOW
+        elif status in (ProcessingStatus.COMPLETED, ProcessingStatus.FAILED):
+            values["processing_completed_at"] = UTC_NOW
 
         if error_message:
-            document.error_message = error_message
+            values["error_message"] = error_message
 
+        # Single UPDATE ... RETURNING; populate_existing refreshes the
+        # document if it is already in the session
+        result = await db.execute(
+            update(Document)
+            .where(Document.id == document_id)
+            .values(**values)
+            .returning(Document)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        document = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(document)
 
         return document
 
@@ -206,7 +228,7 @@ class DocumentRepository:
         extraction_data: dict
     ) -> Optional[Document]:
         """
-        Store extraction result JSON.
+        Store extraction result JSON (JSONB; encoded by the driver).
 
         Args:
             db: Database session
@@ -216,17 +238,13 @@ class DocumentRepository:
         Returns:
             Updated Document object or None if not found
         """
-        import json
-
-        result = await db.execute(
-            select(Document).filter(Document.id == document_id)
-        )
-        document = result.scalar_one_or_none()
+        # Identity map lookup: no SQL when the document is already loaded
+        document = await db.get(Document, document_id)
 
         if not document:
             return None
 
-        document.extraction_result = json.dumps(extraction_data)
+        document.extraction_result = extraction_data
 
         await db.commit()
         await db.refresh(document)
@@ -249,12 +267,29 @@ class DocumentRepository:
 
         Returns:
             True if deleted, False if not found
+
+        Note:
+            Deletes directly in the database instead of loading the document
+            and its children for the ORM cascade. Its transactions and API
+            usage rows are removed first, as the ORM cascade did (their
+            foreign keys would only set document_id to NULL).
         """
-        document = await DocumentRepository.get_by_id(db, document_id, user_id)
-        if not document:
-            return False
+        from app.models.api_usage import APIUsage
+        from app.models.transaction import Transaction
+
+        owned = select(Document.id).where(Document.id == document_id, Document.user_id == user_id)
+
+        await db.execute(delete(Transaction).where(Transaction.document_id.in_(owned)))
+        await db.execute(delete(APIUsage).where(APIUsage.document_id.in_(owned)))
 
-        await db.delete(document)
+        result = await db.execute(
+            delete(Document)
+            .where(Document.id == document_id, Document.user_id == user_id)
+            .returning(Document.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         await db.commit()
+        # Cached transactions of the document are gone too
+        request_cache.clear(db)
 
-        return True
+        return deleted
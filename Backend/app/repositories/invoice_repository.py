@@ -2,15 +2,22 @@ from typing import Optional, Literal
 from uuid import UUID
 from datetime import date
 from decimal import Decimal
-from sqlalchemy import select, func, and_
+from sqlalchemy import Float, cast, select, insert, update, delete, func, and_, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.invoice import Invoice
 from app.models.invoice_item import InvoiceItem
+from app.repositories.loading import no_lazy_loads
+from app.repositories.pagination import fetch_page
+from app.repositories import request_cache
 from app.schemas.invoice import InvoiceCreate, InvoiceUpdate, InvoiceItemCreate
 
 
+# Monetary amounts are rounded to whole cents
+_CENT = Decimal("0.01")
+
+
 class InvoiceRepository:
     """Repository for Invoice database operations."""
 
@@ -27,12 +34,17 @@ class InvoiceRepository:
         Returns:
             Invoice object with items or None if not found
         """
+        key = (Invoice, invoice_id, user_id)
+        invoice = request_cache.get_cached(db, key)
+        if invoice is not None:
+            return invoice
+
         result = await db.execute(
             select(Invoice)
-            .options(selectinload(Invoice.items))
+            .options(selectinload(Invoice.items), *no_lazy_loads())
             .filter(Invoice.id == invoice_id, Invoice.user_id == user_id)
         )
-        return result.scalar_one_or_none()
+        return request_cache.cache(db, key, result.scalar_one_or_none())
 
     @staticmethod
     async def get_all(
@@ -61,7 +73,11 @@ class InvoiceRepository:
         Returns:
             Tuple of (invoices list, total count)
         """
-        query = select(Invoice).options(selectinload(Invoice.items)).filter(Invoice.user_id == user_id)
+        query = (
+            select(Invoice)
+            .options(selectinload(Invoice.items), *no_lazy_loads())
+            .filter(Invoice.user_id == user_id)
+        )
 
         # Apply filters
         if status:
@@ -73,17 +89,10 @@ class InvoiceRepository:
         if end_date:
             query = query.filter(Invoice.issue_date <= end_date)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-
-        # Get paginated results
-        query = query.offset(skip).limit(limit).order_by(Invoice.issue_date.desc())
-        result = await db.execute(query)
-        invoices = result.scalars().all()
+        # Get paginated results and the total count (counted only for a full page)
+        rows, total = await fetch_page(db, query.order_by(Invoice.issue_date.desc()), skip, limit)
 
-        return list(invoices), total
+        return [row[0] for row in rows], total
 
     @staticmethod
     async def create(db: AsyncSession, user_id: UUID, invoice_data: InvoiceCreate) -> Invoice:
@@ -98,13 +107,13 @@ class InvoiceRepository:
         Returns:
             Created Invoice object
         """
-        # Calculate totals
-        subtotal = sum(
-            item.quantity * item.rate for item in invoice_data.items
-        )
+        # Calculate totals (each line amount is computed once and reused for
+        # the item rows below)
+        amounts = [(item.quantity * item.rate).quantize(_CENT) for item in invoice_data.items]
+        subtotal = sum(amounts, Decimal(0))
 
         tax_rate = invoice_data.tax_rate or Decimal(0)
-        tax_amount = (subtotal * tax_rate / 100).quantize(Decimal("0.01"))
+        tax_amount = (subtotal * tax_rate / 100).quantize(_CENT)
 
         discount_amount = invoice_data.discount_amount or Decimal(0)
 
@@ -131,27 +140,29 @@ class InvoiceRepository:
         db.add(invoice)
         await db.flush()  # Get invoice.id
 
-        # Create invoice items
-        for idx, item_data in enumerate(invoice_data.items):
-            amount = (item_data.quantity * item_data.rate).quantize(Decimal("0.01"))
-            item = InvoiceItem(
-                invoice_id=invoice.id,
-                description=item_data.description,
-                quantity=item_data.quantity,
-                rate=item_data.rate,
-                amount=amount,
-                order_index=item_data.order_index if item_data.order_index else idx,
+        # Create invoice items in one Core executemany INSERT
+        if invoice_data.items:
+            await db.execute(
+                insert(InvoiceItem.__table__),
+                [
+                    {
+                        "invoice_id": invoice.id,
+                        "description": item_data.description,
+                        "quantity": item_data.quantity,
+                        "rate": item_data.rate,
+                        "amount": amounts[idx],
+                        "order_index": item_data.order_index if item_data.order_index else idx,
+                    }
+                    for idx, item_data in enumerate(invoice_data.items)
+                ]
             )
-            db.add(item)
 
         await db.commit()
-        await db.refresh(invoice)
 
-        # Load items relationship
-        result = await db.execute(
-            select(Invoice).options(selectinload(Invoice.items)).filter(Invoice.id == invoice.id)
-        )
-        return result.scalar_one()
+        # Load the items into the relationship (every column value is set
+        # client-side, so the invoice row itself needs no refresh)
+        await db.refresh(invoice, attribute_names=["items"])
+        return invoice
 
     @staticmethod
     async def update(
@@ -181,18 +192,15 @@ class InvoiceRepository:
         # Recalculate totals if relevant fields changed
         if any(field in update_data for field in ["tax_rate", "discount_amount"]):
             tax_rate = invoice.tax_rate or Decimal(0)
-            invoice.tax_amount = (invoice.subtotal * tax_rate / 100).quantize(Decimal("0.01"))
+            invoice.tax_amount = (invoice.subtotal * tax_rate / 100).quantize(_CENT)
             discount_amount = invoice.discount_amount or Decimal(0)
             invoice.total = invoice.subtotal + invoice.tax_amount - discount_amount
 
         await db.commit()
-        await db.refresh(invoice)
 
-        # Reload items
-        result = await db.execute(
-            select(Invoice).options(selectinload(Invoice.items)).filter(Invoice.id == invoice.id)
-        )
-        return result.scalar_one()
+        # get_by_id already loaded the items, and the session keeps the
+        # updated values after commit, so nothing needs to be re-read
+        return invoice
 
     @staticmethod
     async def delete(db: AsyncSession, invoice_id: UUID, user_id: UUID) -> bool:
@@ -206,15 +214,21 @@ class InvoiceRepository:
 
         Returns:
             True if deleted, False if not found
-        """
-        invoice = await InvoiceRepository.get_by_id(db, invoice_id, user_id)
-        if not invoice:
-            return False
 
-        await db.delete(invoice)
+        Note:
+            Items are removed (ON DELETE CASCADE) and linked transactions
+            unlinked (ON DELETE SET NULL) by the database.
+        """
+        result = await db.execute(
+            delete(Invoice)
+            .where(Invoice.id == invoice_id, Invoice.user_id == user_id)
+            .returning(Invoice.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         await db.commit()
+        request_cache.invalidate(db, Invoice, invoice_id)
 
-        return True
+        return deleted
 
     @staticmethod
     async def get_stats(db: AsyncSession, user_id: UUID) -> dict:
@@ -228,33 +242,38 @@ class InvoiceRepository:
         Returns:
             Dictionary with statistics
         """
-        # Get all invoices
-        result = await db.execute(select(Invoice).filter(Invoice.user_id == user_id))
-        invoices = result.scalars().all()
-
-        total_invoices = len(invoices)
-        draft_count = sum(1 for inv in invoices if inv.status == "draft")
-        sent_count = sum(1 for inv in invoices if inv.status == "sent")
-        paid_count = sum(1 for inv in invoices if inv.status == "paid")
-        overdue_count = sum(1 for inv in invoices if inv.status == "overdue")
-        cancelled_count = sum(1 for inv in invoices if inv.status == "cancelled")
-
-        total_amount = sum(inv.total for inv in invoices)
-        paid_amount = sum(inv.total for inv in invoices if inv.status == "paid")
-        outstanding_amount = sum(
-            inv.total for inv in invoices if inv.status in ["sent", "overdue"]
+        # One row per status with its invoice count and summed total; the sum
+        # comes back as double precision, which the driver decodes straight
+        # to a float (the response reports amounts as floats)
+        result = await db.execute(
+            select(
+                Invoice.status,
+                func.count(Invoice.id),
+                cast(func.coalesce(func.sum(Invoice.total), 0), Float),
+            )
+            .filter(Invoice.user_id == user_id)
+            .group_by(Invoice.status)
         )
+        counts = {}
+        amounts = {}
+        for status, count, amount in result.all():
+            counts[status] = count
+            amounts[status] = amount
+
+        total_amount = sum(amounts.values(), 0.0)
+        paid_amount = amounts.get("paid", 0.0)
+        outstanding_amount = amounts.get("sent", 0.0) + amounts.get("overdue", 0.0)
 
         return {
-            "total_invoices": total_invoices,
-            "draft_count": draft_count,
-            "sent_count": sent_count,
-            "paid_count": paid_count,
-            "overdue_count": overdue_count,
-            "cancelled_count": cancelled_count,
-            "total_amount": float(total_amount),
-            "paid_amount": float(paid_amount),
-            "outstanding_amount": float(outstanding_amount),
+            "total_invoices": sum(counts.values()),
+            "draft_count": counts.get("draft", 0),
+            "sent_count": counts.get("sent", 0),
+            "paid_count": counts.get("paid", 0),
+            "overdue_count": counts.get("overdue", 0),
+            "cancelled_count": counts.get("cancelled", 0),
+            "total_amount": total_amount,
+            "paid_amount": paid_amount,
+            "outstanding_amount": outstanding_amount,
         }
 
     @staticmethod
@@ -276,12 +295,16 @@ class InvoiceRepository:
         Returns:
             Updated Invoice object or None if not found
         """
-        invoice = await InvoiceRepository.get_by_id(db, invoice_id, user_id)
-        if not invoice:
-            return None
-
-        invoice.status = status
+        # lambda_stmt caches the built statement; ids and status become bound values
+        result = await db.execute(lambda_stmt(
+            lambda: update(Invoice)
+            .where(Invoice.id == invoice_id, Invoice.user_id == user_id)
+            .values(status=status)
+            .returning(Invoice)
+            .options(selectinload(Invoice.items))
+            .execution_options(synchronize_session=False, populate_existing=True)
+        ))
+        invoice = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(invoice)
 
         return invoice
@@ -0,0 +1,48 @@
+"""
+Loader options guarding repository reads against hidden lazy loads.
+
+Objects returned by a repository should carry every relationship their
+callers use, loaded up front with selectinload(). Any other relationship
+access would be an implicit per-object SELECT (an N+1 in loops, and an
+error outside the session's greenlet in async code).
+
+With ORM_RAISE_ON_LAZY_LOAD enabled (the default), read paths add
+raiseload('*') so such an access fails loudly at the line that caused it.
+With it disabled, lazy loads are allowed but logged as warnings.
+"""
+from typing import Tuple
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def no_lazy_loads() -> Tuple[LoaderOption, ...]:
+    """
+    Return loader options forbidding lazy loads of unloaded relationships.
+
+    Combine with the explicit eager loads a read path needs, e.g.
+    ``.options(selectinload(Invoice.items), *no_lazy_loads())``.
+
+    Returns:
+        (raiseload('*'),) when ORM_RAISE_ON_LAZY_LOAD is enabled, else ()
+    """
+    if settings.ORM_RAISE_ON_LAZY_LOAD:
+        return (raiseload("*"),)
+    return ()
+
+
+if not settings.ORM_RAISE_ON_LAZY_LOAD:
+    @event.listens_for(Session, "do_orm_execute")
+    def _warn_on_lazy_load(orm_execute_state: ORMExecuteState):
+        """Log every lazy relationship load (warn-only mode)."""
+        if orm_execute_state.lazy_loaded_from is not None:
+            logger.warning(
+                f"Lazy load from {orm_execute_state.lazy_loaded_from.class_.__name__}: "
+                f"{orm_execute_state.statement}"
+            )
@@ -0,0 +1,116 @@
+"""
+Shared pagination helper for repository list queries.
+
+List endpoints need a page of rows plus the total number of matches. The
+first page is fetched with one extra row: when that extra row is missing,
+the page reaches the end of the results and the total is simply
+skip + rows, so the common short list needs no count at all.
+
+Later pages almost always need the COUNT (a client paging further already
+knows the list is long), so for them the page and the count are queried
+concurrently on separate pooled connections and their round-trips overlap,
+when a second connection is free (see extra_session); otherwise the count
+runs after the page on the same session.
+
+The count is a flat COUNT(*) over the list query's table and WHERE clause,
+not a COUNT over the list query wrapped as a subquery, so it carries none of
+the listed columns (e.g. per-row correlated subqueries) or loader options.
+"""
+from typing import Any, List, Tuple
+import asyncio
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import extra_session
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    skip: int,
+    limit: int
+) -> Tuple[List[Row[Any]], int]:
+    """
+    Fetch one page of a filtered, ordered query together with its total count.
+
+    Args:
+        db: Database session
+        query: Filtered and ordered select (without offset/limit) on a
+            single table; its WHERE clause is reused for the count
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+
+    Returns:
+        Tuple of (page rows, total count)
+    """
+    count_query = _count_query(query)
+
+    if skip:
+        return await _paginate_parallel(db, query, count_query, skip, limit)
+
+    rows = list((await db.execute(query.limit(limit + 1))).all())
+
+    # Fewer rows than asked for: this page is the last one
+    if len(rows) <= limit:
+        return rows, len(rows)
+
+    total = (await db.execute(count_query)).scalar_one()
+
+    return rows[:limit], total
+
+
+def _count_query(query: Select) -> Select:
+    """
+    Build a COUNT(*) with the same FROM and WHERE clauses as a list query.
+
+    Args:
+        query: Filtered select on a single table
+
+    Returns:
+        Flat count select
+    """
+    count_query = select(func.count()).select_from(*query.columns_clause_froms)
+    if query.whereclause is not None:
+        count_query = count_query.where(query.whereclause)
+    return count_query
+
+
+async def _paginate_parallel(
+    db: AsyncSession,
+    query: Select,
+    count_query: Select,
+    skip: int,
+    limit: int
+) -> Tuple[List[Row[Any]], int]:
+    """
+    Run the page query and the count query concurrently.
+
+    The page runs on the caller's session (so its objects belong to it);
+    the count runs on a second session from the pool, since one session
+    can only execute one statement at a time. Without a free extra
+    connection both run on the caller's session, one after the other.
+
+    Args:
+        db: Database session
+        query: Filtered and ordered select (without offset/limit)
+        count_query: COUNT over the filtered query
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+
+    Returns:
+        Tuple of (page rows, total count)
+    """
+    async with extra_session() as count_db:
+        if count_db is None:
+            page_result = await db.execute(query.offset(skip).limit(limit))
+            total = (await db.execute(count_query)).scalar_one()
+        else:
+            page_result, count_result = await asyncio.gather(
+                db.execute(query.offset(skip).limit(limit)),
+                count_db.execute(count_query)
+            )
+            total = count_result.scalar_one()
+
+    return list(page_result.all()), total
@@ -0,0 +1,90 @@
+"""
+Request-scoped cache for repository get_by_id lookups.
+
+A request often loads the same row more than once: the endpoint checks the
+record exists, then a repository method looks it up again before changing
+it. Each API request gets its own session (see get_db), so results are kept
+in the session's info dict under a (Model, id, user_id) key and dropped with
+the session at the end of the request.
+
+Repository methods that change or delete a row invalidate its entries; a
+rollback (which expires every loaded object) clears the whole cache.
+"""
+from typing import Any, Dict, Hashable, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+_CACHE_KEY = "repository_cache"
+
+T = TypeVar("T")
+
+
+def _entries(db: AsyncSession) -> Dict[Tuple[Hashable, ...], Any]:
+    """Return the cache dict of a session, creating it on first use."""
+    return db.info.setdefault(_CACHE_KEY, {})
+
+
+def get_cached(db: AsyncSession, key: Tuple[Hashable, ...]) -> Optional[Any]:
+    """
+    Look up an object loaded earlier in this session.
+
+    Args:
+        db: Database session
+        key: (Model, id, user_id, ...) lookup key
+
+    Returns:
+        Cached object or None if not cached
+    """
+    return _entries(db).get(key)
+
+
+def cache(db: AsyncSession, key: Tuple[Hashable, ...], obj: T) -> T:
+    """
+    Remember the result of a lookup for the rest of this session.
+
+    Misses (None) are not cached, so a row created later in the same
+    request is still found.
+
+    Args:
+        db: Database session
+        key: (Model, id, user_id, ...) lookup key
+        obj: Loaded object or None
+
+    Returns:
+        The object passed in
+    """
+    if obj is not None:
+        _entries(db)[key] = obj
+    return obj
+
+
+def invalidate(db: AsyncSession, model: type, object_id: Hashable) -> None:
+    """
+    Drop every cached lookup of one row.
+
+    Args:
+        db: Database session
+        model: Model class of the row
+        object_id: Primary key of the row
+    """
+    entries = _entries(db)
+    for key in [key for key in entries if key[0] is model and key[1] == object_id]:
+        del entries[key]
+
+
+def clear(db: AsyncSession) -> None:
+    """
+    Drop the whole cache (after deletes that cascade to other tables).
+
+    Args:
+        db: Database session
+    """
+    db.info.pop(_CACHE_KEY, None)
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_on_rollback(session: Session):
+    """A rollback expires every loaded object, so cached ones are stale."""
+    session.info.pop(_CACHE_KEY, None)
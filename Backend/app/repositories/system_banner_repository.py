@@ -1,11 +1,34 @@
-from datetime import datetime
 from typing import Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import select, func
+from sqlalchemy import select, update, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache_delete, cache_get_json, cache_set_json
 from app.models.system_banner import SystemBanner
-from app.schemas.system_banner import SystemBannerCreate, SystemBannerUpdate
+from app.repositories.pagination import fetch_page
+from app.schemas.system_banner import SystemBannerCreate, SystemBannerResponse, SystemBannerUpdate
+
+
+# Active banners, newest first, built once (they are read on every page
+# load); verified users don't see banners meant only for unverified users
+_ACTIVE_BANNERS = (
+    select(SystemBanner)
+    .filter(SystemBanner.is_active == True)
+    .order_by(SystemBanner.created_at.desc())
+)
+_ACTIVE_BANNERS_FOR_VERIFIED = (
+    select(SystemBanner)
+    .filter(SystemBanner.is_active == True, SystemBanner.show_to_unverified_only == False)
+    .order_by(SystemBanner.created_at.desc())
+)
+
+# Active banner responses are cached in Redis per verification status and
+# dropped whenever an admin changes a banner
+ACTIVE_BANNERS_CACHE_KEYS = {
+    True: "banners:active:verified:v1",
+    False: "banners:active:unverified:v1",
+}
+ACTIVE_BANNERS_CACHE_TTL_SECONDS = 60
 
 
 class SystemBannerRepository:
@@ -28,6 +51,7 @@ class SystemBannerRepository:
         db.add(banner)
         await db.commit()
         await db.refresh(banner)
+        await SystemBannerRepository.invalidate_active_banners()
 
         return banner
 
@@ -43,8 +67,8 @@ class SystemBannerRepository:
         Returns:
             SystemBanner object or None if not found
         """
-        result = await db.execute(select(SystemBanner).filter(SystemBanner.id == banner_id))
-        return result.scalar_one_or_none()
+        # Primary key lookup through the identity map
+        return await db.get(SystemBanner, banner_id)
 
     @staticmethod
     async def list_all(
@@ -70,19 +94,12 @@ class SystemBannerRepository:
         if active_only:
             query = query.filter(SystemBanner.is_active == True)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar_one()
-
-        # Apply pagination and ordering (newest first)
-        query = query.order_by(SystemBanner.created_at.desc()).offset(skip).limit(limit)
-
-        # Execute query
-        result = await db.execute(query)
-        banners = result.scalars().all()
+        # Fetch the page (newest first) and the total count (counted only for a full page)
+        rows, total = await fetch_page(
+            db, query.order_by(SystemBanner.created_at.desc()), skip, limit
+        )
 
-        return list(banners), total
+        return [row[0] for row in rows], total
 
     @staticmethod
     async def get_active_banners(
@@ -98,18 +115,48 @@ class SystemBannerRepository:
         Returns:
             List of active banners applicable to the user
         """
-        query = select(SystemBanner).filter(SystemBanner.is_active == True)
-
-        # If user is verified, exclude banners that are only for unverified users
-        if is_user_verified:
-            query = query.filter(SystemBanner.show_to_unverified_only == False)
-
-        # Order by creation date (newest first)
-        query = query.order_by(SystemBanner.created_at.desc())
+        query = _ACTIVE_BANNERS_FOR_VERIFIED if is_user_verified else _ACTIVE_BANNERS
 
         result = await db.execute(query)
         return list(result.scalars().all())
 
+    @staticmethod
+    async def get_active_banners_cached(
+        db: AsyncSession, is_user_verified: bool
+    ) -> List[dict]:
+        """
+        Get active banners for display to user, served from Redis when cached.
+
+        Args:
+            db: Database session
+            is_user_verified: Whether the current user has verified their email
+
+        Returns:
+            List of active banners as SystemBannerResponse dicts
+
+        Note:
+            Results are cached for ACTIVE_BANNERS_CACHE_TTL_SECONDS; every
+            banner write invalidates them immediately.
+        """
+        key = ACTIVE_BANNERS_CACHE_KEYS[is_user_verified]
+
+        cached = await cache_get_json(key)
+        if cached is not None:
+            return cached
+
+        banners = [
+            SystemBannerResponse.model_validate(banner).model_dump(mode="json")
+            for banner in await SystemBannerRepository.get_active_banners(db, is_user_verified)
+        ]
+        await cache_set_json(key, banners, ACTIVE_BANNERS_CACHE_TTL_SECONDS)
+
+        return banners
+
+    @staticmethod
+    async def invalidate_active_banners() -> None:
+        """Drop the cached active banner lists after a banner changed."""
+        await cache_delete(*ACTIVE_BANNERS_CACHE_KEYS.values())
+
     @staticmethod
     async def update(
         db: AsyncSession, banner_id: UUID, banner_data: SystemBannerUpdate
@@ -125,21 +172,11 @@ class SystemBannerRepository:
         Returns:
             Updated SystemBanner object or None if not found
         """
-        banner = await SystemBannerRepository.get_by_id(db, banner_id)
-        if not banner:
-            return None
-
-        # Update fields
         update_data = banner_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(banner, field, value)
-
-        banner.updated_at = datetime.utcnow()
+        if not update_data:
+            return await SystemBannerRepository.get_by_id(db, banner_id)
 
-        await db.commit()
-        await db.refresh(banner)
-
-        return banner
+        return await SystemBannerRepository._update_returning(db, banner_id, **update_data)
 
     @staticmethod
     async def delete(db: AsyncSession, banner_id: UUID) -> bool:
@@ -153,14 +190,16 @@ class SystemBannerRepository:
         Returns:
             True if deleted, False if not found
         """
-        banner = await SystemBannerRepository.get_by_id(db, banner_id)
-        if not banner:
-            return False
-
-        await db.delete(banner)
+        result = await db.execute(
+            delete(SystemBanner).where(SystemBanner.id == banner_id).returning(SystemBanner.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         await db.commit()
 
-        return True
+        if deleted:
+            await SystemBannerRepository.invalidate_active_banners()
+
+        return deleted
 
     @staticmethod
     async def deactivate(db: AsyncSession, banner_id: UUID) -> Optional[SystemBanner]:
@@ -174,15 +213,33 @@ class SystemBannerRepository:
         Returns:
             Updated SystemBanner object or None if not found
         """
-        banner = await SystemBannerRepository.get_by_id(db, banner_id)
-        if not banner:
-            return None
+        return await SystemBannerRepository._update_returning(db, banner_id, is_active=False)
+
+    @staticmethod
+    async def _update_returning(db: AsyncSession, banner_id: UUID, **values) -> Optional[SystemBanner]:
+        """
+        Update a banner with a single UPDATE ... RETURNING statement.
 
-        banner.is_active = False
-        banner.updated_at = datetime.utcnow()
+        Args:
+            db: Database session
+            banner_id: Banner UUID
+            **values: Column values to set
 
+        Returns:
+            Updated SystemBanner object or None if not found
+        """
+        result = await db.execute(
+            update(SystemBanner)
+            .where(SystemBanner.id == banner_id)
+            .values(**values)
+            .returning(SystemBanner)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        banner = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(banner)
+
+        if banner is not None:
+            await SystemBannerRepository.invalidate_active_banners()
 
         return banner
 
@@ -7,10 +7,15 @@ Follows the repository pattern used throughout the FinTrack application.
 from typing import Optional, List
 from uuid import UUID
 from datetime import date
-from sqlalchemy import select, func
+from sqlalchemy import Float, cast, select, func, update, delete, insert, literal, true, false, values, column
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.ids import uuid7
+from app.models.document import Document
 from app.models.transaction import Transaction, TransactionType, TransactionCategory
+from app.repositories.loading import no_lazy_loads
+from app.repositories.pagination import fetch_page
+from app.repositories import request_cache
 from app.schemas.transaction import TransactionCreate, TransactionUpdate
 
 
@@ -40,55 +45,11 @@ class TransactionRepository:
         Returns:
             Created Transaction object
         """
-        transaction = Transaction(
-            user_id=user_id,
-            document_id=document_id,
-            bank_account_id=bank_account_id,
-            transaction_date=transaction_data.transaction_date,
-            description=transaction_data.description,
-            amount=transaction_data.amount,
-            transaction_type=transaction_data.transaction_type,
-            balance_after=transaction_data.balance_after,
-            category=transaction_data.category,
-            merchant=transaction_data.merchant,
-            account_last4=transaction_data.account_last4,
-            notes=transaction_data.notes,
-            is_manually_added=is_manually_added
-        )
-
-        db.add(transaction)
-        await db.commit()
-        await db.refresh(transaction)
-
-        return transaction
-
-    @staticmethod
-    async def bulk_create(
-        db: AsyncSession,
-        user_id: UUID,
-        transactions_data: List[TransactionCreate],
-        document_id: Optional[UUID] = None,
-        bank_account_id: Optional[UUID] = None,
-        source_document_name: Optional[str] = None
-    ) -> List[Transaction]:
-        """
-        Bulk create transactions.
-
-        Args:
-            db: Database session
-            user_id: User UUID
-            transactions_data: List of transaction creation data
-            document_id: Document UUID (optional)
-            bank_account_id: Bank account UUID (optional)
-            source_document_name: Original filename of source document (optional)
-
-        Returns:
-            List of created Transaction objects
-        """
-        transactions = []
-
-        for transaction_data in transactions_data:
-            transaction = Transaction(
+        # INSERT ... RETURNING hands back the generated columns in the same
+        # round-trip, so no refresh is needed
+        result = await db.execute(
+            insert(Transaction)
+            .values(
                 user_id=user_id,
                 document_id=document_id,
                 bank_account_id=bank_account_id,
@@ -101,19 +62,14 @@ class TransactionRepository:
                 merchant=transaction_data.merchant,
                 account_last4=transaction_data.account_last4,
                 notes=transaction_data.notes,
-                source_document_name=source_document_name,
-                is_manually_added=False
+                is_manually_added=is_manually_added
             )
-            transactions.append(transaction)
-            db.add(transaction)
-
+            .returning(Transaction)
+        )
+        transaction = result.scalar_one()
         await db.commit()
 
-        # Refresh all transactions
-        for transaction in transactions:
-            await db.refresh(transaction)
-
-        return transactions
+        return transaction
 
     @staticmethod
     async def get_by_id(
@@ -132,13 +88,12 @@ class TransactionRepository:
         Returns:
             Transaction object or None if not found
         """
-        result = await db.execute(
-            select(Transaction).filter(
-                Transaction.id == transaction_id,
-                Transaction.user_id == user_id
-            )
-        )
-        return result.scalar_one_or_none()
+        # Primary key lookup through the identity map: no SQL at all when the
+        # transaction is already loaded in this session
+        transaction = await db.get(Transaction, transaction_id)
+        if transaction is None or transaction.user_id != user_id:
+            return None
+        return transaction
 
     @staticmethod
     async def get_all(
@@ -171,7 +126,11 @@ class TransactionRepository:
         Returns:
             Tuple of (transactions list, total count)
         """
-        query = select(Transaction).filter(Transaction.user_id == user_id)
+        query = (
+            select(Transaction)
+            .options(*no_lazy_loads())
+            .filter(Transaction.user_id == user_id)
+        )
 
         # Apply filters
         if transaction_type:
@@ -187,17 +146,12 @@ class TransactionRepository:
         if bank_account_id:
             query = query.filter(Transaction.bank_account_id == bank_account_id)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-
-        # Get paginated results
-        query = query.offset(skip).limit(limit).order_by(Transaction.transaction_date.desc())
-        result = await db.execute(query)
-        transactions = result.scalars().all()
+        # Get paginated results and the total count (counted only for a full page)
+        rows, total = await fetch_page(
+            db, query.order_by(Transaction.transaction_date.desc()), skip, limit
+        )
 
-        return list(transactions), total
+        return [row[0] for row in rows], total
 
     @staticmethod
     async def update(
@@ -218,17 +172,20 @@ class TransactionRepository:
         Returns:
             Updated Transaction object or None if not found
         """
-        transaction = await TransactionRepository.get_by_id(db, transaction_id, user_id)
-        if not transaction:
-            return None
-
         update_data = transaction_data.model_dump(exclude_unset=True)
+        if not update_data:
+            return await TransactionRepository.get_by_id(db, transaction_id, user_id)
 
-        for field, value in update_data.items():
-            setattr(transaction, field, value)
-
+        # Single UPDATE ... RETURNING; an unowned or missing id matches no row
+        result = await db.execute(
+            update(Transaction)
+            .where(Transaction.id == transaction_id, Transaction.user_id == user_id)
+            .values(**update_data)
+            .returning(Transaction)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        transaction = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(transaction)
 
         return transaction
 
@@ -249,52 +206,122 @@ class TransactionRepository:
         Returns:
             True if deleted, False if not found
         """
-        transaction = await TransactionRepository.get_by_id(db, transaction_id, user_id)
-        if not transaction:
-            return False
-
-        await db.delete(transaction)
+        result = await db.execute(
+            delete(Transaction)
+            .where(Transaction.id == transaction_id, Transaction.user_id == user_id)
+            .returning(Transaction.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
         await db.commit()
 
-        return True
+        return deleted
 
     @staticmethod
-    async def delete_by_document_id(
+    async def replace_document_transactions(
         db: AsyncSession,
+        user_id: UUID,
         document_id: UUID,
-        user_id: UUID
-    ) -> int:
+        transactions_data: List[TransactionCreate]
+    ) -> Optional[tuple[int, int]]:
         """
-        Delete all transactions for a specific document.
+        Replace all transactions imported from a document in one statement.
 
-        Used when reimporting a document to replace old transactions.
+        Verifies the document belongs to the user, deletes any transactions
+        previously imported from it (reimport scenario) and inserts the new
+        ones, inheriting bank_account_id and source_document_name from the
+        document. The three steps run as a single CTE, so the whole import is
+        one database round trip.
 
         Args:
             db: Database session
-            document_id: Document UUID
             user_id: User UUID (for authorization)
+            document_id: Document UUID
+            transactions_data: List of transaction creation data
 
         Returns:
-            Number of transactions deleted
+            Tuple of (imported count, replaced count), or None if the document
+            was not found
         """
-        # Get all transactions for this document that belong to the user
-        result = await db.execute(
-            select(Transaction).filter(
-                Transaction.document_id == document_id,
-                Transaction.user_id == user_id
-            )
+        table = Transaction.__table__
+
+        doc = (
+            select(Document.id, Document.bank_account_id, Document.original_filename)
+            .where(Document.id == document_id, Document.user_id == user_id)
+            .cte("doc")
         )
-        transactions = result.scalars().all()
 
-        count = len(transactions)
+        deleted = (
+            delete(table)
+            .where(
+                table.c.document_id.in_(select(doc.c.id)),
+                table.c.user_id == user_id
+            )
+            .returning(table.c.id)
+            .cte("del")
+        )
 
-        # Delete all transactions
-        for transaction in transactions:
-            await db.delete(transaction)
+        row_columns = (
+            "id", "transaction_date", "description", "amount", "transaction_type",
+            "balance_after", "category", "merchant", "account_last4", "notes"
+        )
+        rows = values(
+            *(column(name, table.c[name].type) for name in row_columns),
+            name="rows"
+        ).data([
+            (
+                uuid7(),
+                transaction_data.transaction_date,
+                transaction_data.description,
+                transaction_data.amount,
+                transaction_data.transaction_type,
+                transaction_data.balance_after,
+                transaction_data.category,
+                transaction_data.merchant,
+                transaction_data.account_last4,
+                transaction_data.notes,
+            )
+            for transaction_data in transactions_data
+        ])
+
+        inserted = (
+            insert(table)
+            .from_select(
+                [
+                    *row_columns, "user_id", "document_id", "bank_account_id",
+                    "source_document_name", "is_manually_added"
+                ],
+                select(
+                    # NULLs in a VALUES list are sent untyped, so a column that
+                    # is NULL in every row (e.g. no balances) comes out as
+                    # text; cast each column back to its table type
+                    *(cast(rows.c[name], table.c[name].type) for name in row_columns),
+                    literal(user_id, table.c.user_id.type),
+                    doc.c.id,
+                    doc.c.bank_account_id,
+                    doc.c.original_filename,
+                    false(),
+                ).select_from(rows.join(doc, true()))
+            )
+            .returning(table.c.id)
+            .cte("ins")
+        )
 
+        result = await db.execute(
+            select(
+                select(doc.c.id).scalar_subquery(),
+                select(func.count()).select_from(inserted).scalar_subquery(),
+                select(func.count()).select_from(deleted).scalar_subquery(),
+            )
+        )
+        found_document_id, imported_count, replaced_count = result.one()
         await db.commit()
+        # Cached documents still list the replaced transactions
+        request_cache.clear(db)
 
-        return count
+        if found_document_id is None:
+            return None
+
+        return imported_count, replaced_count
 
     @staticmethod
     async def get_stats(db: AsyncSession, user_id: UUID) -> dict:
@@ -308,30 +335,39 @@ class TransactionRepository:
         Returns:
             Dictionary with statistics
         """
-        # Get all transactions
-        result = await db.execute(
-            select(Transaction).filter(Transaction.user_id == user_id)
+        # Count and amount per transaction type, aggregated in the database
+        type_result = await db.execute(
+            select(
+                Transaction.transaction_type,
+                func.count(),
+                cast(func.coalesce(func.sum(Transaction.amount), 0), Float),
+            )
+            .filter(Transaction.user_id == user_id)
+            .group_by(Transaction.transaction_type)
         )
-        transactions = result.scalars().all()
+        counts = {}
+        amounts = {}
+        for transaction_type, count, amount in type_result.all():
+            counts[transaction_type] = count
+            amounts[transaction_type] = amount
 
-        total_transactions = len(transactions)
-
-        debits = [t for t in transactions if t.transaction_type == TransactionType.DEBIT]
-        credits = [t for t in transactions if t.transaction_type == TransactionType.CREDIT]
-
-        total_debit_amount = sum(float(t.amount) for t in debits)
-        total_credit_amount = sum(float(t.amount) for t in credits)
+        total_debit_amount = amounts.get(TransactionType.DEBIT, 0.0)
+        total_credit_amount = amounts.get(TransactionType.CREDIT, 0.0)
 
         # Count by category
-        transactions_by_category = {}
-        for transaction in transactions:
-            category = transaction.category.value
-            transactions_by_category[category] = transactions_by_category.get(category, 0) + 1
+        category_result = await db.execute(
+            select(Transaction.category, func.count())
+            .filter(Transaction.user_id == user_id)
+            .group_by(Transaction.category)
+        )
+        transactions_by_category = {
+            category.value: count for category, count in category_result.all()
+        }
 
         return {
-            "total_transactions": total_transactions,
-            "total_debits": len(debits),
-            "total_credits": len(credits),
+            "total_transactions": sum(counts.values()),
+            "total_debits": counts.get(TransactionType.DEBIT, 0),
+            "total_credits": counts.get(TransactionType.CREDIT, 0),
             "total_debit_amount": total_debit_amount,
             "total_credit_amount": total_credit_amount,
             "net_balance": total_credit_amount - total_debit_amount,
@@ -1,15 +1,32 @@
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import bindparam, case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import cache_delete, cache_get_json, cache_set_json
+
+from app.models.base import UTC_NOW
 from app.models.user import User
-from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import hash_password
+from app.schemas.user import CurrentUser, UserCreate, UserUpdate
+from app.core.security import hash_password_async
 from app.core.config import settings
 
 
+# Users resolved from access tokens are cached briefly in Redis as
+# CurrentUser snapshots, which carry no secrets (password hash,
+# verification token)
+USER_CACHE_KEY_PREFIX = "user:"
+USER_CACHE_TTL_SECONDS = 30
+
+# Hot lookups are built once; each call only binds its value, so the
+# statement object (and its compiled-cache key) is reused
+# Stored emails are lowercase (users_email_lowercase check constraint), so
+# lowering only the parameter keeps the lookup on the unique email index
+_GET_BY_EMAIL = select(User).where(User.email == func.lower(bindparam("email")))
+_GET_BY_VERIFICATION_TOKEN = select(User).where(User.verification_token == bindparam("token"))
+
+
 class UserRepository:
     """Repository for User database operations."""
 
@@ -25,8 +42,50 @@ class UserRepository:
         Returns:
             User object or None if not found
         """
-        result = await db.execute(select(User).filter(User.id == user_id))
-        return result.scalar_one_or_none()
+        # Primary key lookup through the identity map: no SQL at all when the
+        # user is already loaded in this session
+        return await db.get(User, user_id)
+
+    @staticmethod
+    async def get_by_id_cached(db: AsyncSession, user_id: UUID) -> Optional[CurrentUser]:
+        """
+        Get user by ID for request authentication, served from Redis when cached.
+
+        Hits and misses both return a frozen CurrentUser snapshot rather than
+        an ORM User, so callers can't persist, refresh or lazy-load through
+        it; anything that changes the user goes through the repository by ID.
+
+        Args:
+            db: Database session
+            user_id: User UUID
+
+        Returns:
+            CurrentUser snapshot or None if not found
+        """
+        key = f"{USER_CACHE_KEY_PREFIX}{user_id}"
+
+        cached = await cache_get_json(key)
+        if cached is not None:
+            return _user_from_cache(cached)
+
+        user = await UserRepository.get_by_id(db, user_id)
+        if user is None:
+            return None
+
+        current_user = CurrentUser.model_validate(user)
+        await cache_set_json(key, _user_to_cache(current_user), USER_CACHE_TTL_SECONDS)
+
+        return current_user
+
+    @staticmethod
+    async def invalidate_cache(user_id: UUID) -> None:
+        """
+        Drop a user's cached row after it changed.
+
+        Args:
+            user_id: User UUID
+        """
+        await cache_delete(f"{USER_CACHE_KEY_PREFIX}{user_id}")
 
     @staticmethod
     async def get_by_email(db: AsyncSession, email: str) -> Optional[User]:
@@ -40,7 +99,7 @@ class UserRepository:
         Returns:
             User object or None if not found
         """
-        result = await db.execute(select(User).filter(User.email == email.lower()))
+        result = await db.execute(_GET_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -55,7 +114,7 @@ class UserRepository:
         Returns:
             Created User object
         """
-        hashed_password = hash_password(user_data.password)
+        hashed_password = await hash_password_async(user_data.password)
 
         user = User(
             email=user_data.email.lower(),
@@ -87,21 +146,11 @@ class UserRepository:
         Returns:
             Updated User object or None if not found
         """
-        user = await UserRepository.get_by_id(db, user_id)
-        if not user:
-            return None
-
         update_data = user_data.model_dump(exclude_unset=True)
+        if not update_data:
+            return await UserRepository.get_by_id(db, user_id)
 
-        for field, value in update_data.items():
-            setattr(user, field, value)
-
-        user.updated_at = datetime.utcnow()
-
-        await db.commit()
-        await db.refresh(user)
-
-        return user
+        return await UserRepository._update_returning(db, user_id, **update_data)
 
     @staticmethod
     async def update_last_login(db: AsyncSession, user_id: UUID) -> None:
@@ -112,10 +161,7 @@ class UserRepository:
             db: Database session
             user_id: User UUID
         """
-        user = await UserRepository.get_by_id(db, user_id)
-        if user:
-            user.last_login_at = datetime.utcnow()
-            await db.commit()
+        await UserRepository._update_returning(db, user_id, last_login_at=UTC_NOW)
 
     @staticmethod
     async def increment_failed_attempts(db: AsyncSession, user_id: UUID) -> None:
@@ -125,18 +171,26 @@ class UserRepository:
         Args:
             db: Database session
             user_id: User UUID
+
+        Note:
+            The counter is incremented in SQL, so concurrent failed logins
+            can't overwrite each other's increments.
         """
-        user = await UserRepository.get_by_id(db, user_id)
-        if user:
-            user.failed_login_attempts += 1
+        attempts = User.failed_login_attempts + 1
 
+        await UserRepository._update_returning(
+            db,
+            user_id,
+            failed_login_attempts=attempts,
             # Lock account if max attempts reached
-            if user.failed_login_attempts >= settings.MAX_LOGIN_ATTEMPTS:
-                user.locked_until = datetime.utcnow() + timedelta(
-                    minutes=settings.ACCOUNT_LOCKOUT_DURATION_MINUTES
-                )
-
-            await db.commit()
+            locked_until=case(
+                (
+                    attempts >= settings.MAX_LOGIN_ATTEMPTS,
+                    UTC_NOW + timedelta(minutes=settings.ACCOUNT_LOCKOUT_DURATION_MINUTES)
+                ),
+                else_=User.locked_until
+            )
+        )
 
     @staticmethod
     async def reset_failed_attempts(db: AsyncSession, user_id: UUID) -> None:
@@ -147,11 +201,9 @@ class UserRepository:
             db: Database session
             user_id: User UUID
         """
-        user = await UserRepository.get_by_id(db, user_id)
-        if user:
-            user.failed_login_attempts = 0
-            user.locked_until = None
-            await db.commit()
+        await UserRepository._update_returning(
+            db, user_id, failed_login_attempts=0, locked_until=None
+        )
 
     @staticmethod
     async def lock_account(db: AsyncSession, user_id: UUID, duration_minutes: int) -> None:
@@ -163,10 +215,9 @@ class UserRepository:
             user_id: User UUID
             duration_minutes: Duration in minutes
         """
-        user = await UserRepository.get_by_id(db, user_id)
-        if user:
-            user.locked_until = datetime.utcnow() + timedelta(minutes=duration_minutes)
-            await db.commit()
+        await UserRepository._update_returning(
+            db, user_id, locked_until=UTC_NOW + timedelta(minutes=duration_minutes)
+        )
 
     @staticmethod
     async def change_password(db: AsyncSession, user_id: UUID, new_password: str) -> Optional[User]:
@@ -181,17 +232,23 @@ class UserRepository:
         Returns:
             Updated User object or None if not found
         """
-        user = await UserRepository.get_by_id(db, user_id)
-        if not user:
-            return None
+        return await UserRepository._update_returning(
+            db, user_id, password_hash=await hash_password_async(new_password)
+        )
 
-        user.password_hash = hash_password(new_password)
-        user.updated_at = datetime.utcnow()
+    @staticmethod
+    async def update_password_hash(db: AsyncSession, user_id: UUID, password_hash: str) -> None:
+        """
+        Replace a user's stored password hash without changing the password.
 
-        await db.commit()
-        await db.refresh(user)
+        Used to transparently upgrade legacy hashes on successful login.
 
-        return user
+        Args:
+            db: Database session
+            user_id: User UUID
+            password_hash: New hash of the user's current password
+        """
+        await UserRepository._update_returning(db, user_id, password_hash=password_hash)
 
     @staticmethod
     async def deactivate(db: AsyncSession, user_id: UUID) -> Optional[User]:
@@ -205,17 +262,7 @@ class UserRepository:
         Returns:
             Updated User object or None if not found
         """
-        user = await UserRepository.get_by_id(db, user_id)
-        if not user:
-            return None
-
-        user.is_active = False
-        user.updated_at = datetime.utcnow()
-
-        await db.commit()
-        await db.refresh(user)
-
-        return user
+        return await UserRepository._update_returning(db, user_id, is_active=False)
 
     @staticmethod
     async def set_verification_token(
@@ -236,18 +283,12 @@ class UserRepository:
         Returns:
             Updated User object or None if not found
         """
-        user = await UserRepository.get_by_id(db, user_id)
-        if not user:
-            return None
-
-        user.verification_token = token
-        user.verification_token_expires_at = expires_at
-        user.updated_at = datetime.utcnow()
-
-        await db.commit()
-        await db.refresh(user)
-
-        return user
+        return await UserRepository._update_returning(
+            db,
+            user_id,
+            verification_token=token,
+            verification_token_expires_at=expires_at
+        )
 
     @staticmethod
     async def get_by_verification_token(db: AsyncSession, token: str) -> Optional[User]:
@@ -261,9 +302,7 @@ class UserRepository:
         Returns:
             User object or None if not found
         """
-        result = await db.execute(
-            select(User).filter(User.verification_token == token)
-        )
+        result = await db.execute(_GET_BY_VERIFICATION_TOKEN, {"token": token})
         return result.scalar_one_or_none()
 
     @staticmethod
@@ -278,17 +317,50 @@ class UserRepository:
         Returns:
             Updated User object or None if not found
         """
-        user = await UserRepository.get_by_id(db, user_id)
-        if not user:
-            return None
+        return await UserRepository._update_returning(
+            db,
+            user_id,
+            is_verified=True,
+            verified_at=UTC_NOW,
+            verification_token=None,
+            verification_token_expires_at=None
+        )
+
+    @staticmethod
+    async def _update_returning(db: AsyncSession, user_id: UUID, **values) -> Optional[User]:
+        """
+        Update a user with a single UPDATE ... RETURNING statement.
+
+        The returned row refreshes a user already loaded in this session
+        (e.g. by the login flow), so its attributes stay current.
 
-        user.is_verified = True
-        user.verified_at = datetime.utcnow()
-        user.verification_token = None
-        user.verification_token_expires_at = None
-        user.updated_at = datetime.utcnow()
+        Args:
+            db: Database session
+            user_id: User UUID
+            **values: Column values to set (may be SQL expressions)
 
+        Returns:
+            Updated User object or None if not found
+        """
+        result = await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**values)
+            .returning(User)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        user = result.scalar_one_or_none()
         await db.commit()
-        await db.refresh(user)
+        await UserRepository.invalidate_cache(user_id)
 
         return user
+
+
+def _user_to_cache(user: CurrentUser) -> dict:
+    """Serialize a user snapshot for the cache (orjson encodes UUIDs and datetimes)."""
+    return user.model_dump()
+
+
+def _user_from_cache(data: dict) -> CurrentUser:
+    """Rebuild a user snapshot from its decoded cache JSON."""
+    return CurrentUser.model_validate(data)
@@ -12,7 +12,8 @@ from uuid import UUID
 class UserUsageStats(BaseModel):
     """Statistics for a single user's API usage."""
 
-    user_id: str
+    user_id: UUID
+    email: Optional[str] = None
     input_tokens: int
     output_tokens: int
     total_tokens: int
@@ -104,6 +104,21 @@ class UserResponse(UserBase):
         from_attributes = True
 
 
+class CurrentUser(UserResponse):
+    """
+    Read-only snapshot of the authenticated user (request dependencies).
+
+    Cache hits and misses both resolve to this schema, so handlers see the
+    same object either way. It is not an ORM instance: it can't be added to
+    a session or refreshed, and it is frozen. Changes go through
+    UserRepository by current_user.id.
+    """
+
+    class Config:
+        from_attributes = True
+        frozen = True
+
+
 class UserInDB(UserResponse):
     """Schema for user stored in database (includes sensitive fields)."""
 
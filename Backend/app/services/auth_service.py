@@ -1,15 +1,18 @@
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional
 from uuid import UUID
+from fastapi import BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
-from jose import JWTError
+from jwt import InvalidTokenError as JWTError
 
 from app.models.user import User
-from app.schemas.user import UserCreate
+from app.schemas.user import CurrentUser, UserCreate
 from app.schemas.token import Token, TokenPayload
 from app.repositories.user_repository import UserRepository
 from app.core.security import (
-    verify_password,
+    verify_password_async,
+    hash_password_async,
+    password_needs_rehash,
     create_access_token,
     create_refresh_token,
     decode_token,
@@ -32,13 +35,19 @@ class AuthService:
     """Service for authentication operations."""
 
     @staticmethod
-    async def register_user(db: AsyncSession, user_data: UserCreate) -> User:
+    async def register_user(
+        db: AsyncSession,
+        user_data: UserCreate,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> User:
         """
         Register a new user and send verification email.
 
         Args:
             db: Database session
             user_data: User registration data
+            background_tasks: Request background tasks used to send the email
+                after the response (optional)
 
         Returns:
             Created User object
@@ -62,11 +71,12 @@ class AuthService:
         await UserRepository.set_verification_token(db, user.id, token, expires_at)
 
         # Send verification email
-        EmailService.send_verification_email(
+        await EmailService.send_verification_email(
             to_email=user.email,
             first_name=user.first_name or "there",
             verification_token=token,
-            frontend_url=settings.FRONTEND_URL
+            frontend_url=settings.FRONTEND_URL,
+            background_tasks=background_tasks
         )
 
         return user
@@ -107,11 +117,15 @@ class AuthService:
             raise InactiveUserError()
 
         # Verify password
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             # Increment failed attempts
             await UserRepository.increment_failed_attempts(db, user.id)
             raise InvalidCredentialsError()
 
+        # Upgrade legacy bcrypt (or outdated argon2) hashes now that we have the password
+        if password_needs_rehash(user.password_hash):
+            await UserRepository.update_password_hash(db, user.id, await hash_password_async(password))
+
         # Reset failed attempts on successful login
         await UserRepository.reset_failed_attempts(db, user.id)
 
@@ -141,7 +155,7 @@ class AuthService:
         )
 
     @staticmethod
-    async def verify_access_token(db: AsyncSession, token: str) -> User:
+    async def verify_access_token(db: AsyncSession, token: str) -> CurrentUser:
         """
         Verify access token and return user.
 
@@ -150,7 +164,7 @@ class AuthService:
             token: JWT access token
 
         Returns:
-            User object
+            Read-only CurrentUser snapshot
 
         Raises:
             InvalidTokenError: If token is invalid or expired
@@ -171,8 +185,8 @@ class AuthService:
         except (JWTError, ValueError):
             raise InvalidTokenError()
 
-        # Get user from database
-        user = await UserRepository.get_by_id(db, user_id)
+        # Get user (cached briefly, since every authenticated request does this)
+        user = await UserRepository.get_by_id_cached(db, user_id)
         if user is None:
             raise UserNotFoundError()
 
@@ -256,7 +270,7 @@ class AuthService:
             raise UserNotFoundError()
 
         # Verify current password
-        if not verify_password(current_password, user.password_hash):
+        if not await verify_password_async(current_password, user.password_hash):
             raise InvalidCredentialsError(detail="Current password is incorrect")
 
         # Change password
@@ -299,13 +313,19 @@ class AuthService:
         return verified_user
 
     @staticmethod
-    async def resend_verification_email(db: AsyncSession, email: str) -> bool:
+    async def resend_verification_email(
+        db: AsyncSession,
+        email: str,
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> bool:
         """
         Resend verification email to user.
 
         Args:
             db: Database session
             email: User's email address
+            background_tasks: Request background tasks used to send the email
+                after the response (optional)
 
         Returns:
             bool: True if email sent successfully
@@ -331,11 +351,12 @@ class AuthService:
         await UserRepository.set_verification_token(db, user.id, token, expires_at)
 
         # Send verification email
-        success = EmailService.send_verification_email(
+        success = await EmailService.send_verification_email(
             to_email=user.email,
             first_name=user.first_name or "there",
             verification_token=token,
-            frontend_url=settings.FRONTEND_URL
+            frontend_url=settings.FRONTEND_URL,
+            background_tasks=background_tasks
         )
 
         return success
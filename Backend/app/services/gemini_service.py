@@ -11,10 +11,10 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 from uuid import UUID
 
+from app.core.api_usage_buffer import api_usage_buffer
 from app.core.config import settings
 from app.core.exceptions import DocumentProcessingError
-from app.models.api_usage import APIUsage, APIServiceType, APIOperationType
-from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.api_usage import APIServiceType, APIOperationType
 
 
 class GeminiService:
@@ -178,7 +178,6 @@ Rules:
 
     @staticmethod
     async def _log_api_usage(
-        db: AsyncSession,
         user_id: Optional[UUID],
         document_id: Optional[UUID],
         model_name: str,
@@ -193,8 +192,9 @@ Rules:
         """
         Log API usage to the database for monitoring and quota tracking.
 
+        Records are queued and inserted in batches by the API usage buffer.
+
         Args:
-            db: Database session
             user_id: User who made the request (None for system requests)
             document_id: Related document ID if applicable
             model_name: Model used (e.g., "gemini-2.5-flash")
@@ -207,35 +207,30 @@ Rules:
             request_id: API request ID from provider
         """
         try:
-            usage_record = APIUsage(
-                service=APIServiceType.GEMINI,
-                operation=APIOperationType.DOCUMENT_PROCESSING,
-                model_name=model_name,
-                user_id=user_id,
-                document_id=document_id,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                total_tokens=input_tokens + output_tokens,
-                status_code=status_code,
-                success=1 if success else 0,
-                error_message=error_message,
-                duration_ms=duration_ms,
-                request_id=request_id
-            )
-
-            db.add(usage_record)
-            await db.commit()
+            await api_usage_buffer.record({
+                "service": APIServiceType.GEMINI,
+                "operation": APIOperationType.DOCUMENT_PROCESSING,
+                "model_name": model_name,
+                "user_id": user_id,
+                "document_id": document_id,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "status_code": status_code,
+                "success": success,
+                "error_message": error_message,
+                "duration_ms": duration_ms,
+                "request_id": request_id,
+            })
 
         except Exception as e:
             # Don't fail the main operation if logging fails
             print(f"Warning: Failed to log API usage: {str(e)}")
-            await db.rollback()
 
     @staticmethod
     async def extract_bank_statement_data(
         file_content: bytes,
         filename: str,
-        db: AsyncSession,
         user_id: Optional[UUID] = None,
         document_id: Optional[UUID] = None
     ) -> Dict[str, Any]:
@@ -245,7 +240,6 @@ Rules:
         Args:
             file_content: Raw PDF file bytes
             filename: Original filename (for logging)
-            db: Database session for logging API usage
             user_id: User who initiated the request (optional)
             document_id: Document ID being processed (optional)
 
@@ -375,7 +369,6 @@ Rules:
 
                 # Log successful API usage
                 await GeminiService._log_api_usage(
-                    db=db,
                     user_id=user_id,
                     document_id=document_id,
                     model_name=settings.GEMINI_MODEL,
@@ -394,7 +387,6 @@ Rules:
 
             # Log failed API usage
             await GeminiService._log_api_usage(
-                db=db,
                 user_id=user_id,
                 document_id=document_id,
                 model_name=settings.GEMINI_MODEL,
@@ -412,7 +404,6 @@ Rules:
 
             # Log failed API usage
             await GeminiService._log_api_usage(
-                db=db,
                 user_id=user_id,
                 document_id=document_id,
                 model_name=settings.GEMINI_MODEL,
@@ -8,10 +8,22 @@ if [ -n "$DATABASE_URL" ]; then
     echo "Running database migrations..."
     alembic upgrade head
     echo "Migrations completed successfully!"
+
+    # Create upcoming api_usage partitions before traffic arrives (the app's
+    # rollup loop keeps them up to date afterwards)
+    echo "Maintaining api_usage partitions..."
+    python -m app.core.api_usage_partitions
 else
     echo "No DATABASE_URL set, skipping migrations"
 fi
 
 # Start the application
 echo "Starting uvicorn server..."
-exec uvicorn app.main:app --host 0.0.0.0 --port 8000
+# WebSocket keepalive uses protocol-level ping frames handled by the server;
+# uvloop/httptools (from uvicorn[standard]) keep the event loop and HTTP parsing in C
+exec uvicorn app.main:app --host 0.0.0.0 --port 8000 \
+    --loop uvloop \
+    --http httptools \
+    --ws websockets \
+    --ws-ping-interval 20 \
+    --ws-ping-timeout 30
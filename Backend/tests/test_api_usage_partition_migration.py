@@ -0,0 +1,90 @@
+"""
+Smoke test for the api_usage partitioning migration (9b4e1d7a3c5f).
+
+Needs a real Postgres: set TEST_DATABASE_URL to an empty scratch database
+(postgresql+asyncpg://...). The test migrates it and leaves it at the
+revision before partitioning.
+"""
+import asyncio
+import os
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+BEFORE_PARTITIONING = "7a2d5c8e1f4b"
+PARTITIONING = "9b4e1d7a3c5f"
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"
+)
+
+INSERT_USAGE = """
+    INSERT INTO api_usage (
+        id, service, operation, model_name, input_tokens, output_tokens,
+        total_tokens, status_code, success, created_at, updated_at
+    )
+    VALUES (
+        gen_random_uuid(), 'gemini', 'document_processing', 'gemini-2.5-flash',
+        10, 5, 15, 200, true, :created_at, :created_at
+    )
+"""
+
+
+def _run(statement, **params):
+    """Run one statement in its own transaction; return its rows, if any."""
+    async def run():
+        engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+        try:
+            async with engine.begin() as connection:
+                result = await connection.execute(text(statement), params)
+                return result.all() if result.returns_rows else None
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+@pytest.fixture
+def alembic_config(monkeypatch):
+    # alembic/env.py takes the database URL from DATABASE_URL
+    monkeypatch.setenv("DATABASE_URL", TEST_DATABASE_URL)
+    return Config(str(Path(__file__).resolve().parents[1] / "alembic.ini"))
+
+
+def _rows_per_table():
+    return dict(_run("SELECT tableoid::regclass::text, count(*) FROM api_usage GROUP BY 1"))
+
+
+def test_partitioning_migration(alembic_config):
+    this_month = datetime.now(timezone.utc).replace(tzinfo=None, day=15)
+    this_partition = f"api_usage_{this_month:%Y_%m}"
+
+    command.upgrade(alembic_config, BEFORE_PARTITIONING)
+    _run(INSERT_USAGE, created_at=this_month)
+
+    # Fails if the new primary key collides with the renamed table's
+    command.upgrade(alembic_config, PARTITIONING)
+
+    assert _run("""
+        SELECT conrelid::regclass::text FROM pg_constraint
+        WHERE conname = 'api_usage_pkey'
+    """) == [("api_usage",)]
+    assert _rows_per_table() == {this_partition: 1}
+
+    # A row for a month without a partition lands in the default partition;
+    # creating that month's partition moves it over instead of failing
+    _run(INSERT_USAGE, created_at=datetime(2100, 3, 10, 8, 0))
+    assert _rows_per_table()["api_usage_default"] == 1
+
+    _run("SELECT create_api_usage_partition(:month)", month=date(2100, 3, 1))
+    assert _rows_per_table() == {this_partition: 1, "api_usage_2100_03": 1}
+
+    command.downgrade(alembic_config, BEFORE_PARTITIONING)
+    assert _rows_per_table() == {"api_usage": 2}
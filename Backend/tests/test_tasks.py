@@ -0,0 +1,115 @@
+"""
+Tests for send_email_task deduplication across Celery redeliveries.
+"""
+import hashlib
+
+import pytest
+
+from app.core import tasks
+from app.core.email import EmailService
+from app.core.tasks import EmailDeliveryError, send_email_task
+
+EMAIL = {
+    "to_email": "user@example.com",
+    "subject": "Verify your email",
+    "html_body": "<p>Hi</p>",
+    "dedup_key": "verification-token",
+}
+IN_FLIGHT_KEY = "email:sending:" + hashlib.sha256(
+    f"{EMAIL['to_email']}:{EMAIL['dedup_key']}".encode()
+).hexdigest()
+
+
+class _FakeRedis:
+    """The subset of the sync Redis client send_email_task uses (TTLs ignored)."""
+
+    def __init__(self):
+        self.store = {}
+
+    def exists(self, key):
+        return int(key in self.store)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def delete(self, key):
+        return int(self.store.pop(key, None) is not None)
+
+
+class _WorkerLost(BaseException):
+    """Stands in for the worker process dying mid-task."""
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = _FakeRedis()
+    monkeypatch.setattr(tasks, "get_sync_redis", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Recipients of every email handed to ZeptoMail, in order."""
+    outbox = []
+
+    def send_email(**kwargs):
+        outbox.append(kwargs["to_email"])
+        return True
+
+    monkeypatch.setattr(EmailService, "send_email", staticmethod(send_email))
+    return outbox
+
+
+def _sent_keys(redis):
+    return [key for key in redis.store if key.startswith("email:sent:")]
+
+
+def test_duplicate_delivery_after_success_is_skipped(redis, sent):
+    assert send_email_task.run(**EMAIL) is True
+    assert send_email_task.run(**EMAIL) is True
+
+    assert sent == ["user@example.com"]
+    assert len(_sent_keys(redis)) == 1
+    assert IN_FLIGHT_KEY not in redis.store
+
+
+def test_redelivery_after_worker_lost_before_send_still_sends(redis, sent, monkeypatch):
+    def dies(**kwargs):
+        raise _WorkerLost()
+
+    with monkeypatch.context() as patch:
+        patch.setattr(EmailService, "send_email", staticmethod(dies))
+        with pytest.raises(_WorkerLost):
+            send_email_task.run(**EMAIL)
+
+    # Nothing was sent, so nothing may be marked sent
+    assert _sent_keys(redis) == []
+
+    # Celery redelivers the unacknowledged task
+    assert send_email_task.run(**EMAIL) is True
+    assert sent == ["user@example.com"]
+
+
+def test_failed_send_is_retried_and_not_marked_sent(redis, sent, monkeypatch):
+    with monkeypatch.context() as patch:
+        patch.setattr(EmailService, "send_email", staticmethod(lambda **kwargs: False))
+        with pytest.raises(EmailDeliveryError):
+            send_email_task.run(**EMAIL)
+
+    assert _sent_keys(redis) == []
+
+    assert send_email_task.run(**EMAIL) is True
+    assert sent == ["user@example.com"]
+
+
+def test_send_in_flight_elsewhere_is_retried_later(redis, sent):
+    redis.set(IN_FLIGHT_KEY, "1")
+
+    with pytest.raises(EmailDeliveryError):
+        send_email_task.run(**EMAIL)
+
+    assert sent == []
+
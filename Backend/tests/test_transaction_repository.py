@@ -0,0 +1,72 @@
+"""
+Tests for TransactionRepository.replace_document_transactions.
+
+The statement is captured from a stand-in session and compiled for
+asyncpg, so these run without a database.
+"""
+import asyncio
+import re
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.repositories.transaction_repository import TransactionRepository
+from app.schemas.transaction import TransactionCreate
+
+
+class _Result:
+    def __init__(self, row):
+        self._row = row
+
+    def one(self):
+        return self._row
+
+
+class _RecordingSession:
+    """Records executed statements and answers with a fixed result row."""
+
+    def __init__(self, row):
+        self.info = {}
+        self.statements = []
+        self._row = row
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _Result(self._row)
+
+    async def commit(self):
+        pass
+
+
+def _import(transactions):
+    document_id = uuid4()
+    db = _RecordingSession((document_id, len(transactions), 0))
+
+    result = asyncio.run(
+        TransactionRepository.replace_document_transactions(db, uuid4(), document_id, transactions)
+    )
+
+    assert result == (len(transactions), 0)
+    (statement,) = db.statements
+    return str(statement.compile(dialect=postgresql.asyncpg.dialect()))
+
+
+def test_all_null_values_column_is_cast_to_its_table_type():
+    # No row has a balance, so the VALUES column holds nothing but NULLs
+    transactions = [
+        TransactionCreate(
+            transaction_date=date(2024, 1, day),
+            description=f"Payment {day}",
+            amount=Decimal("12.50"),
+            transaction_type="debit",
+        )
+        for day in (1, 2)
+    ]
+
+    sql = _import(transactions)
+
+    assert re.search(r'CAST\("?rows"?\.balance_after AS (NUMERIC|DECIMAL)', sql)
+    for name in ("transaction_date", "amount", "merchant", "account_last4", "notes"):
+        assert re.search(rf'CAST\("?rows"?\.{name} AS ', sql), name
@@ -0,0 +1,57 @@
+"""
+Tests for the Redis user cache behind request authentication.
+"""
+from datetime import datetime
+from uuid import uuid4
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from app.models.user import User
+from app.repositories.user_repository import _user_from_cache, _user_to_cache
+from app.schemas.user import CurrentUser
+
+
+def _user() -> User:
+    return User(
+        id=uuid4(),
+        email="user@example.com",
+        password_hash="$argon2id$secret",
+        verification_token="token",
+        first_name="Ada",
+        last_name="Lovelace",
+        is_active=True,
+        is_verified=True,
+        is_superuser=False,
+        last_login_at=datetime(2024, 5, 1, 9, 30, 15, 123456),
+        created_at=datetime(2024, 1, 2, 3, 4, 5),
+        updated_at=datetime(2024, 5, 1, 9, 30, 15, 123456),
+    )
+
+
+def test_cache_round_trip_matches_the_database_snapshot():
+    current_user = CurrentUser.model_validate(_user())
+
+    # cache_set_json / cache_get_json encode and decode with orjson
+    cached = orjson.loads(orjson.dumps(_user_to_cache(current_user)))
+    restored = _user_from_cache(cached)
+
+    assert restored == current_user
+    assert restored.id == current_user.id
+    assert isinstance(restored.updated_at, datetime)
+    assert restored.updated_at == datetime(2024, 5, 1, 9, 30, 15, 123456)
+
+
+def test_cached_snapshot_carries_no_secrets():
+    cached = _user_to_cache(CurrentUser.model_validate(_user()))
+
+    assert "password_hash" not in cached
+    assert "verification_token" not in cached
+
+
+def test_current_user_is_read_only():
+    current_user = CurrentUser.model_validate(_user())
+
+    with pytest.raises(ValidationError):
+        current_user.is_superuser = True
@@ -29,7 +29,6 @@ export function WebSocketProvider({ children }: { children: ReactNode }) {
   const maxReconnectAttempts = 5;
   const reconnectDelay = 3000;
   const isConnectedRef = useRef(false);
-  const pingInterval = useRef<NodeJS.Timeout | undefined>(undefined);
   const isUnmounted = useRef(false);
 
   const connect = useCallback(() => {
@@ -60,31 +59,11 @@ export function WebSocketProvider({ children }: { children: ReactNode }) {
         console.log('WebSocket connected');
         isConnectedRef.current = true;
         reconnectAttempts.current = 0;
-
-        // Clear any existing ping interval
-        if (pingInterval.current) {
-          clearInterval(pingInterval.current);
-        }
-
-        // Send ping every 30 seconds to keep connection alive
-        pingInterval.current = setInterval(() => {
-          if (ws.current?.readyState === WebSocket.OPEN) {
-            ws.current.send('ping');
-          } else {
-            if (pingInterval.current) {
-              clearInterval(pingInterval.current);
-            }
-          }
-        }, 30000);
+        // Keepalive is handled by protocol-level ping frames from the server
       };
 
       ws.current.onmessage = (event) => {
         try {
-          // Handle pong response
-          if (event.data === 'pong') {
-            return;
-          }
-
           const message: WebSocketMessage = JSON.parse(event.data);
           console.log('WebSocket message received:', message);
 
@@ -109,11 +88,6 @@ export function WebSocketProvider({ children }: { children: ReactNode }) {
         console.log('WebSocket closed:', event.code, event.reason);
         isConnectedRef.current = false;
 
-        // Clear ping interval
-        if (pingInterval.current) {
-          clearInterval(pingInterval.current);
-        }
-
         // Don't reconnect if component is unmounted or normal closure
         if (isUnmounted.current || event.code === 1000) {
           return;
@@ -144,10 +118,6 @@ export function WebSocketProvider({ children }: { children: ReactNode }) {
       clearTimeout(reconnectTimeout.current);
     }
 
-    if (pingInterval.current) {
-      clearInterval(pingInterval.current);
-    }
-
     if (ws.current) {
       ws.current.close(1000, 'Client disconnecting');
       ws.current = null;
@@ -64,24 +64,11 @@ export function useWebSocket(options: UseWebSocketOptions = {}) {
         setIsConnected(true);
         reconnectAttempts.current = 0; // Reset reconnect attempts on successful connection
         optionsRef.current.onConnect?.();
-
-        // Send ping every 30 seconds to keep connection alive
-        const pingInterval = setInterval(() => {
-          if (ws.current?.readyState === WebSocket.OPEN) {
-            ws.current.send('ping');
-          } else {
-            clearInterval(pingInterval);
-          }
-        }, 30000);
+        // Keepalive is handled by protocol-level ping frames from the server
       };
 
       ws.current.onmessage = (event) => {
         try {
-          // Handle pong response
-          if (event.data === 'pong') {
-            return;
-          }
-
           const message: WebSocketMessage = JSON.parse(event.data);
           console.log('WebSocket message received:', message);
 